@@ -39,7 +39,8 @@ from jinja2.nativetypes import NativeEnvironment
 from dellwarranty2snipe import get_dell_warranty
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
-from snipeit_api.helpers import filter_list, get_dept_from_ou, clean_edr, validate_os, get_os_type, setup_logging
+from snipeit_api.helpers import get_dept_from_ou, clean_edr, validate_os, get_os_type, setup_logging, \
+    setup_manufacturer_rules
 from snipeit_api.models import Hardware, Manufacturers, Models
 
 version = "0.2"
@@ -48,6 +49,7 @@ CONFIG = RawConfigParser()
 # Find a valid settings.conf file.
 CONFIG.read("settings.conf")
 setup_logging(CONFIG)
+setup_manufacturer_rules(CONFIG)
 if 'snipe-it' not in set(CONFIG):
     logging.debug("No valid CONFIG found in current folder.")
     logging.error(
@@ -211,22 +213,15 @@ def parse_ansible_data(ansible_data: dict):
         logging.warning(f"No asset tag found for {computer_name}, using {new_hw.asset_tag} as asset tag.")
 
 
-    # Amend domain
-    old_domain = new_hw.get_custom_field("Domain").split(", ")
-    new_domain = []
-    if domain:  # Sometimes it is empty
-        new_domain = [domain.upper()]
-    new_hw.set_custom_field("Domain", ", ".join(filter_list(new_domain + old_domain)))
+    # Amend domain, sometimes it is empty
+    new_hw.merge_custom_field("Domain", [domain.upper()] if domain else [])
 
-    management = ['Ansible']
     # Add the new values to the old values
-    new_hw.set_custom_field("Management",
-                            ', '.join(filter_list(new_hw.get_custom_field("Management").split(", ") + management)))
+    new_hw.merge_custom_field("Management", ['Ansible'])
 
-    new_hw.set_custom_field("EDR", ', '.join(
-        filter_list(new_hw.get_custom_field("EDR").split(", ") + [clean_edr(edr)])))
+    new_hw.merge_custom_field("EDR", [clean_edr(edr)])
 
-    logging.debug(new_hw.to_dict() | new_hw.get_custom_fields())
+    logging.debug(new_hw.to_payload())
 
     if "dell" in manufacturer_str.lower() and not new_hw.purchase_date:
         warranty = get_dell_warranty([serial], manufacturer.id, snipeapi=api)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# Micro benchmarks for the hot paths in snipeit_api, these do not talk to Snipe-IT
+# Usage: python benchmark.py [name ...]
+import copy
+import logging
+from sys import argv
+from time import perf_counter
+from tracemalloc import start as trace_start, stop as trace_stop, get_traced_memory
+
+from snipeit_api.defaults import DEFAULTS
+from snipeit_api.helpers import clean_manufacturer, _normalize_manufacturer, clean_tag, clean_tags, _clean_tag
+from snipeit_api.models import Hardware, HardwareRow
+from snipeit_api.normalize import normalize_records
+
+logging.basicConfig(level=logging.ERROR)
+
+
+def make_hardware(count: int) -> list[Hardware]:
+    assets = []
+    for i in range(count):
+        hw = Hardware(id=i + 1,
+                      name=f"HOST{i:06d}",
+                      asset_tag=f"TAG{i:06d}",
+                      serial=f"SERIAL{i:06d}",
+                      status_id=DEFAULTS['status_id_deployed'],
+                      model_id=DEFAULTS['model_id'],
+                      custom_fields=copy.deepcopy(DEFAULTS['custom_fields']))
+        hw.set_custom_field("Operating System", "Windows 11 Enterprise")
+        hw.set_custom_field("MAC Address 1", f"00:11:22:{i >> 16 & 255:02X}:{i >> 8 & 255:02X}:{i & 255:02X}")
+        assets.append(hw.store_state())
+    return assets
+
+
+def make_api_rows(count: int) -> list[dict]:
+    # Shaped like the rows of the hardware endpoint
+    rows = []
+    for i in range(count):
+        custom_fields = {name: {**cf, 'value': ''} for name, cf in DEFAULTS['custom_fields'].items()}
+        custom_fields['Operating System']['value'] = "Windows 11 Enterprise"
+        custom_fields['Department']['value'] = f"Department {i % 200}"
+        custom_fields['MAC Address 1']['value'] = f"00:11:22:{i >> 16 & 255:02X}:{i >> 8 & 255:02X}:{i & 255:02X}"
+        rows.append({'id': i + 1, 'name': f"HOST{i:06d}", 'asset_tag': f"TAG{i:06d}", 'serial': f"SERIAL{i:06d}",
+                     'model': {'id': i % 50 + 1, 'name': f"Model {i % 50}"},
+                     'status_label': {'id': 2, 'name': "Deployed", 'status_meta': "deployed"},
+                     'category': {'id': 2, 'name': "Computers"},
+                     'manufacturer': {'id': i % 5 + 1, 'name': f"Manufacturer {i % 5}"},
+                     'company': None,
+                     'location': {'id': i % 30 + 1, 'name': f"Location {i % 30}"},
+                     'assigned_to': {'id': i % 3000 + 1, 'type': 'user', 'name': f"User {i % 3000}",
+                                     'username': f"user{i % 3000}"},
+                     'updated_at': {'datetime': "2024-01-01 00:00:00", 'formatted': "2024-01-01 12:00 AM"},
+                     'custom_fields': custom_fields})
+    return rows
+
+
+def measure_peak(build, *args) -> tuple[int, object]:
+    trace_start()
+    result = build(*args)
+    peak = get_traced_memory()[1]
+    trace_stop()
+    return peak, result
+
+
+def report(name: str, count: int, seconds: float):
+    print(f"{name}: {count} in {seconds:.3f}s ({count / seconds:,.0f}/s)")
+
+
+def bench_serializer(total: int = 100_000, pool_size: int = 1_000):
+    assets = make_hardware(pool_size)
+
+    start = perf_counter()
+    for i in range(total):
+        assets[i % pool_size].to_payload()
+    report("to_payload", total, perf_counter() - start)
+
+    start = perf_counter()
+    for i in range(total):
+        hw = assets[i % pool_size]
+        hw.notes = "odd" if i & 1 else ""
+        hw.to_patch_payload()
+    report("to_patch_payload", total, perf_counter() - start)
+
+    # The dataclass_json to_dict that upsert used before, too slow to run the full count
+    start = perf_counter()
+    for hw in assets:
+        hw.to_dict() | hw.get_custom_fields()
+    report("dataclass_json to_dict", pool_size, perf_counter() - start)
+
+
+def bench_memory(total: int = 100_000, hardware_sample: int = 2_000):
+    rows = make_api_rows(total)
+    start = perf_counter()
+    peak, compact = measure_peak(list, map(HardwareRow.from_api, rows))
+    report("HardwareRow.from_api", total, perf_counter() - start)
+    print(f"HardwareRow peak memory per {total}: {peak / 2 ** 20:,.1f} MiB")
+    del compact, rows
+
+    # Full Hardware objects are too slow to build 100k of, extrapolate from a sample
+    peak, _ = measure_peak(make_hardware, hardware_sample)
+    print(f"Hardware peak memory per {total} (from {hardware_sample}): "
+          f"{peak * total / hardware_sample / 2 ** 20:,.1f} MiB")
+
+
+def bench_manufacturer(total: int = 100_000):
+    # Raw strings as they come out of Medigate, SCCM and Ansible
+    raw = ["Dell Inc.", "DELL", "Hewlett-Packard", "HPE", "Hewlett Packard Enterprise", "LENOVO", "Apple Inc.",
+           "VMware, Inc.", "Microsoft Corporation", "Super Micro Computer", "GE Healthcare", "Getac",
+           "Zebra Technologies", "Cisco Systems", "Some Unlisted Vendor"]
+    values = [f"{raw[i % len(raw)]}{' ' * (i % 3)}" for i in range(total)]
+
+    start = perf_counter()
+    for value in values:
+        _normalize_manufacturer.__wrapped__(value)
+    report("clean_manufacturer (uncached)", total, perf_counter() - start)
+
+    _normalize_manufacturer.cache_clear()
+    start = perf_counter()
+    for value in values:
+        clean_manufacturer(value)
+    report("clean_manufacturer (memoised)", total, perf_counter() - start)
+
+
+def bench_validators(total: int = 100_000, distinct: int = 5_000):
+    values = [f"SERIAL{i % distinct:06d}" if i % 7 else "To be filled by O.E.M." for i in range(total)]
+
+    start = perf_counter()
+    for value in values:
+        _clean_tag.__wrapped__(value)
+    report("clean_tag (uncached)", total, perf_counter() - start)
+
+    _clean_tag.cache_clear()
+    start = perf_counter()
+    for value in values:
+        clean_tag(value)
+    report("clean_tag (memoised)", total, perf_counter() - start)
+
+    _clean_tag.cache_clear()
+    start = perf_counter()
+    clean_tags(values)
+    report("clean_tags", total, perf_counter() - start)
+
+
+def make_source_records(count: int) -> list[dict]:
+    # Shaped like a Medigate pull, with the repetition a real fleet has
+    models = [f"OptiPlex {i}0{i}0" for i in range(1, 10)] + ["HP EliteBook 840 G8", "Latitude 5420", "Not Available"]
+    manufacturers = ["Dell Inc.", "HP", "LENOVO", "GE Healthcare", "Philips Medical Systems"]
+    systems = ["Windows 11", "Windows 10", "Microsoft Windows Server 2019", "Ubuntu", "Red Hat", "Mac OS 10.15"]
+    return [{'name': f"HOST{i:06d}.example.com",
+             'serial': f"SERIAL{i:06d}" if i % 10 else "To be filled by O.E.M.",
+             'asset_tag': f"TAG{i:06d}",
+             'model': models[i % len(models)],
+             'manufacturer': manufacturers[i % len(manufacturers)],
+             'mac_addresses': [f"00:11:22:{i >> 16 & 255:02X}:{i >> 8 & 255:02X}:{i & 255:02X}"],
+             'operating_system': systems[i % len(systems)],
+             'ip_address': f"10.{i // 64516 + 1}.{i // 254 % 254 + 1}.{i % 254 + 1}",
+             'last_user': f"DOMAIN\\user{i % 3000}"}
+            for i in range(count)]
+
+
+def bench_normalize(total: int = 50_000):
+    records = make_source_records(total)
+    start = perf_counter()
+    normalize_records(records)
+    report("normalize_records", total, perf_counter() - start)
+
+
+BENCHMARKS = {
+    "serializer": bench_serializer,
+    "memory": bench_memory,
+    "manufacturer": bench_manufacturer,
+    "validators": bench_validators,
+    "normalize": bench_normalize,
+}
+
+
+def main():
+    for name in argv[1:] or BENCHMARKS:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
@@ -13,8 +13,9 @@ import xlrd
 
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
-from snipeit_api.helpers import clean_ip, clean_mac, clean_tag, validate_os, get_os_type, validate_hostname
+from snipeit_api.helpers import clean_mac, clean_tag, validate_os, get_os_type
 from snipeit_api.models import Hardware
+from snipeit_api.validation import clean_ip, validate_hostname
 
 logging.basicConfig(level=logging.DEBUG)
 CONFIG = RawConfigParser()
@@ -3,19 +3,24 @@ from __future__ import annotations
 
 import copy
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from configparser import RawConfigParser
 from datetime import datetime, timedelta, timezone
-from itertools import chain
-from time import sleep
-from typing import Generator
-
-from requests import Response, get, post, patch
+from functools import partial
+from threading import Lock
+from time import perf_counter
+from typing import Generator, Iterable
+from urllib.parse import quote
 
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
 from snipeit_api.helpers import filter_list, query_apple_warranty, print_progress, clean_tag, clean_user, \
     parse_isoformat, setup_logging
+from snipeit_api.jamf import JamfClient
 from snipeit_api.models import Hardware, Models, Manufacturers, Users
+from snipeit_api.pipeline import Pipeline, Stage
+from snipeit_api.state import load_state, save_state
 
 CONFIG = RawConfigParser()
 CONFIG.read("settings.conf")
@@ -27,167 +32,129 @@ snipeit_apikey = CONFIG.get('snipe-it', 'apikey')
 DEFAULTS['techs'] = CONFIG.get('snipe-it', 'techs').split(" ")
 
 snipe_api = SnipeITApi(url=snipeit_apiurl, api_key=snipeit_apikey)
-JAMF_HEADERS = {'Accept': 'application/json', 'Content-Type': 'application/json'}
-JAMF_EXPIRES: datetime = datetime.now(timezone.utc)
-
-
-# Use Basic Auth to request a Jamf Token.
-def request_jamf_token():
-    global JAMF_EXPIRES, JAMF_HEADERS
-
-    # If we have a token and it is not expired, don't request a new one
-    if JAMF_EXPIRES > datetime.now(timezone.utc) + timedelta(seconds=120):
-        return JAMF_HEADERS
-
-    api_url = f"{CONFIG['jamf']['url']}/api/v1/auth/keep-alive"
-    auth = None
-
-    # If we have a token, we can use the keep-alive endpoint if it hasn't expired
-    if 'Authorization' not in JAMF_HEADERS or not JAMF_HEADERS['Authorization']:
-        # Tokens expire after 20 minutes (new API)
-        api_url = f"{CONFIG['jamf']['url']}/api/v1/auth/token"
-        auth = (CONFIG['jamf']['username'], CONFIG['jamf']['password'])
-
-    logging.info(f'Calling for a token against: {api_url}')
-
-    response = api_call(api_url,
-                        auth=auth,
-                        method="POST",
-                        headers=JAMF_HEADERS)
-
-    response_json = response.json()
-    if response.status_code != 200:
-        logging.info(f"Received an invalid response from Jamf: {response.status_code} - {response_json}")
-        logging.error("Could not obtain a token for use, please check your username and password.")
-        raise SystemExit("Unable to obtain Jamf Token")
-
-    # DEV: Only enable this if you want to see the token in the log.
-    # logging.debug(jsonresponse)
-    try:
-        JAMF_EXPIRES = parse_isoformat(response_json['expires'])
-    except ValueError:
-        logging.error(f"Timestamp in {response_json} is invalid - exiting")
-        raise SystemExit("Unable to grok Jamf Timestamp - Exiting")
-
-    logging.info(f"Token expires at {JAMF_EXPIRES}")
-
-    # The headers are also global, because they get used elsewhere.
-    JAMF_HEADERS['Authorization'] = f'Bearer {response_json["token"]}'
-    return JAMF_HEADERS
+# Only devices that reported since the last successful sync are fetched
+STATE_FILE = CONFIG.get('jamf', 'state', fallback='jamf_state.json')
+FULL_SYNC_HOURS = CONFIG.getint('jamf', 'full_sync_hours', fallback=24)
+# Devices that report while we run, or whose report dates are a little behind, are fetched again next time
+SYNC_OVERLAP = timedelta(minutes=15)
+JAMF_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+SOFTWARE_HOURS = CONFIG.getint('jamf', 'software_hours', fallback=24)
 
 
 # Function to make the API call for all JAMF devices
 # Returns a list of all computers in JAMF with inventory details
 # Pass filter_rsql in rsql format - e.g. "general.assetTag==123456"
-def get_jamf_computers(filter_rsql=None):
-    # Sections the user wants to retrieve, we require general and hardware for getting serial/asset numbers
-    sections = {"GENERAL", "HARDWARE", "PURCHASING", "USER_AND_LOCATION", "STORAGE", "OPERATING_SYSTEM",
-                "LOCAL_USER_ACCOUNTS", "LICENSED_SOFTWARE"}
+def get_jamf_computers(filter_rsql=None, pagination: Pagination = None, sections: Iterable[str] = None):
+    # Sections to retrieve, by default the ones COMPUTER_FIELDS reads (without the heavy ones)
+    if sections is None:
+        sections = jamf_sections(COMPUTER_FIELDS)
 
-    search_query = "?section=" + "&section=".join(sections)
+    search_query = "?section=" + "&section=".join(sorted(sections))
 
     if filter_rsql:
-        search_query += f"&filter={filter_rsql}"
+        search_query += f"&filter={quote(filter_rsql)}"
 
     logging.info("Fetching JAMF computers...")
-    return get_jamf_paginated_objects(f"/api/v1/computers-inventory{search_query}")
-
-
-TOTALCOUNT = 0
-PAGE_SIZE = 50
+    return get_jamf_paginated_objects(f"/api/v1/computers-inventory{search_query}", pagination)
+
+
+# Pages are fetched a few at a time, the page size starts at page_size and doubles while Jamf answers quickly, up
+# to the largest page Jamf allows. It is halved again when a page is slow or Jamf rate limits us.
+PAGE_SIZE = CONFIG.getint('jamf', 'page_size', fallback=100)
+MAX_PAGE_SIZE = 2000
+PAGE_WINDOW = CONFIG.getint('jamf', 'page_window', fallback=4)
+PAGE_SECONDS = CONFIG.getfloat('jamf', 'page_seconds', fallback=5.0)
+
+# Both streams fetch their pages at the same time, keep a connection open for each
+jamf = JamfClient(CONFIG.get('jamf', 'url'), CONFIG.get('jamf', 'username'), CONFIG.get('jamf', 'password'),
+                  pool_size=PAGE_WINDOW * 2)
+
+
+class Pagination:
+    """
+    State of one paginated Jamf call, so several can run at the same time. Page sizes are always page_size times a
+    power of two, so the offset of the next page is a multiple of whatever size we pick for it.
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE, target_seconds: float = PAGE_SECONDS) -> None:
+        self.min_page_size = page_size
+        self.page_size = page_size
+        self.target_seconds = target_seconds
+        self.total_count = 0
+        self.lock = Lock()
+
+    def size_at(self, offset: int) -> int:
+        size = self.page_size
+        while offset % size:
+            size //= 2
+        return size
+
+    def record(self, page_size: int, seconds: float) -> None:
+        with self.lock:
+            if seconds > self.target_seconds:
+                self.page_size = max(self.page_size // 2, self.min_page_size)
+            elif (seconds < self.target_seconds / 2 and page_size == self.page_size and
+                  self.page_size * 2 <= MAX_PAGE_SIZE):
+                self.page_size *= 2
+                logging.debug(f"Increased the Jamf page size to {self.page_size}")
+
+    def throttled(self) -> None:
+        with self.lock:
+            self.page_size = max(self.page_size // 2, self.min_page_size)
+
+
+def get_jamf_page(api: str, page: int, page_size: int, pagination: Pagination) -> dict:
+    start = perf_counter()
+    response = jamf_api_call(f"{api}&page={page}&page-size={page_size}", method="GET", pagination=pagination)
+
+    if "results" not in response or "totalCount" not in response:
+        logging.info("Received an invalid response from Jamf, exiting")
+        raise SystemExit("Invalid response from Jamf")
+
+    pagination.record(page_size, perf_counter() - start)
+    logging.debug(f"Received: {len(response['results'])} objects for page {page} of {page_size}")
+    return response
 
 
 # Function to make an API call with pagination, returning all objects
-def get_jamf_paginated_objects(api, page=0):
-    global TOTALCOUNT
-    global PAGE_SIZE
-
-    while True:
-        logging.debug(f"Started page {page}/{TOTALCOUNT // PAGE_SIZE} at {datetime.now()}")
-        page_add = f"&page={page}&page-size={PAGE_SIZE}"
-        response = jamf_api_call(f"{api}{page_add}", method="GET")
-
-        if "results" not in response or not response['results'] or "totalCount" not in response:
-            logging.info("Received an invalid response from Jamf, exiting")
-            raise SystemExit("Invalid response from Jamf")
-
-        TOTALCOUNT = response['totalCount']
-        current = response['results']
-        logging.debug(f"Received: {len(current)} objects")
-
-        for item in current:
-            yield item
-
-        page += 1
-        if (PAGE_SIZE * page) >= response['totalCount']:
-            break
+# Page 0 tells us the totalCount, the remaining pages are fetched concurrently and returned in order
+def get_jamf_paginated_objects(api: str, pagination: Pagination = None, window: int = PAGE_WINDOW):
+    if pagination is None:
+        pagination = Pagination()
+
+    page_size = pagination.page_size
+    response = get_jamf_page(api, 0, page_size, pagination)
+    pagination.total_count = response['totalCount']
+    yield from response['results']
+
+    offset = page_size
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=window) as executor:
+        while pending or offset < pagination.total_count:
+            while len(pending) < window and offset < pagination.total_count:
+                page_size = pagination.size_at(offset)
+                pending.append(executor.submit(get_jamf_page, api, offset // page_size, page_size, pagination))
+                offset += page_size
+            yield from pending.popleft().result()['results']
 
 
 # Function to make the API call for all JAMF mobile devices
-def get_jamf_mobiles(filter_rsql=None):
-    # Sections the user wants to retrieve, we require general and hardware for getting serial/asset numbers
-    sections = {"GENERAL", "HARDWARE", "USER_AND_LOCATION", "PURCHASING"}
+def get_jamf_mobiles(filter_rsql=None, pagination: Pagination = None, sections: Iterable[str] = None):
+    # Sections to retrieve, by default the ones MOBILE_FIELDS reads
+    if sections is None:
+        sections = jamf_sections(MOBILE_FIELDS)
 
-    search_query = "?section=" + "&section=".join(sections)
+    search_query = "?section=" + "&section=".join(sorted(sections))
 
     if filter_rsql:
-        search_query += f"&filter={filter_rsql}"
+        search_query += f"&filter={quote(filter_rsql)}"
 
     logging.info("Fetching JAMF mobiles...")
-    return get_jamf_paginated_objects(f"/api/v2/mobile-devices/detail{search_query}")
-
-
-def jamf_api_call(endpoint, payload=None, method="GET", backoff=0):
-    global JAMF_HEADERS
-    global JAMF_EXPIRES
-
-    if backoff > 5:
-        logging.error("JAMF API call failed after 5 retries")
-        raise SystemExit("JAMF API call failed after 5 retries")
-
-    api_url = f"{CONFIG['jamf']['url']}{endpoint}"
-
-    request_jamf_token()
+    return get_jamf_paginated_objects(f"/api/v2/mobile-devices/detail{search_query}", pagination)
 
-    response = api_call(api_url, payload, method, JAMF_HEADERS)
 
-    if response.status_code == 200:
-        return response.json()
-
-    if response.status_code == 429:
-        backoff += 1
-        time_backoff = backoff * 30
-        logging.warning(f'JAMF Pro Ratelimit exceeded: pausing {time_backoff}s')
-        sleep(time_backoff)
-        return jamf_api_call(endpoint, payload, method, backoff)
-
-    if response.status == 401:
-        logging.error("JAMF API call failed with 401, refreshing token")
-        # This means we likely are reusing an expired token, expired tokens cannot be re-used.
-        JAMF_EXPIRES = datetime.now(timezone.utc)
-        del JAMF_HEADERS['Authorization']
-        backoff += 1
-        return jamf_api_call(endpoint, payload, method, backoff)
-
-    logging.error(f"JAMF responded with error code:{response.text}")
-    logging.debug(f"{response.status_code} - {response.content}")
-    raise SystemExit("JAMF API call failed")
-
-
-# Helper function to call an API
-def api_call(api_url, json=None, method="GET", headers=None, auth=None) -> Response:
-    logging.debug(f"Calling {api_url} with method {method} and payload {json}")
-
-    if method == "GET":
-        response = get(api_url, headers=headers, json=json)
-    elif method == "POST":
-        response = post(api_url, auth=auth, headers=headers, json=json)
-    elif method == "PATCH":
-        response = patch(api_url, headers=headers, json=json)
-    else:
-        raise SystemExit(f"Unknown method {method}")
-
-    return response
+def jamf_api_call(endpoint, payload=None, method="GET", pagination: Pagination = None):
+    return jamf.call(endpoint, payload, method, throttled=pagination.throttled if pagination else None)
 
 
 def get_dict(key: str, props: dict):
@@ -220,190 +187,288 @@ def get_list(key: str, props: dict):
     return value
 
 
-def main():
-    # These functions do not run until you need an item from the generator
-    mobile_list: Generator = get_jamf_mobiles()
-    computer_list: Generator = get_jamf_computers()
-    complete_list = chain(mobile_list, computer_list)
-    current_count = 0
-    manufacturer = Manufacturers(api=snipe_api).get_by_name("Apple").create()
-
-    for jamf_asset in complete_list:
-        # We can differentiate between a computer and a mobile device by the presence of a mobileDeviceId
-        logging.debug(f"Processing JAMF asset: {jamf_asset}")
-        custom_fieldset_id = DEFAULTS['fieldset_id']
-        category_id = DEFAULTS['category_id']
+def get_value(key: str, props: dict):
+    return props.get(key)
+
+
+# The values jamf2snipe reads from a Jamf record, name -> (path, getter). The first part of the path is the section
+# it comes from, only those sections are requested from Jamf.
+JAMF_SECTIONS = {
+    'general': "GENERAL",
+    'hardware': "HARDWARE",
+    'purchasing': "PURCHASING",
+    'userAndLocation': "USER_AND_LOCATION",
+    'storage': "STORAGE",
+    'operatingSystem': "OPERATING_SYSTEM",
+    'localUserAccounts': "LOCAL_USER_ACCOUNTS",
+    'licensedSoftware': "LICENSED_SOFTWARE",
+}
+# Sections that make the responses a lot larger, fetched every software_hours and cached in between
+HEAVY_SECTIONS = {"LICENSED_SOFTWARE"}
+
+DEVICE_FIELDS = {
+    'model_identifier': ('hardware.modelIdentifier', get_str),
+    'model': ('hardware.model', get_str),
+    'serial': ('hardware.serialNumber', get_str),
+    'asset_tag': ('hardware.assetTag', get_value),
+    'wifi_mac': ('hardware.wifiMacAddress', get_str),
+    'bluetooth_mac': ('hardware.bluetoothMacAddress', get_str),
+    'mac': ('hardware.macAddress', get_str),
+    'alt_mac': ('hardware.altMacAddress', get_str),
+    'purchase_price': ('purchasing.purchasePrice', get_value),
+    'lease_date': ('purchasing.leaseDate', get_str),
+    'po_date': ('purchasing.poDate', get_value),
+    'warranty_date': ('purchasing.warrantyDate', get_str),
+}
+MOBILE_FIELDS = DEVICE_FIELDS | {
+    'id': ('mobileDeviceId', get_str),
+    'username': ('userAndLocation.username', get_str),
+    'name': ('general.displayName', get_str),
+    'storage': ('hardware.capacityMb', get_int),
+    'os': ('deviceType', get_str),
+    'os_version': ('general.osVersion', get_str),
+    'os_build': ('general.osBuild', get_str),
+    'ip': ('general.ipAddress', get_str),
+}
+COMPUTER_FIELDS = DEVICE_FIELDS | {
+    'id': ('id', get_str),
+    'name': ('general.name', get_str),
+    'local_users': ('localUserAccounts', get_list),
+    'ram': ('hardware.totalRamMegabytes', get_int),
+    'disks': ('storage.disks', get_list),
+    'cpu': ('hardware.processorType', get_str),
+    'ad_status': ('operatingSystem.activeDirectoryStatus', get_str),
+    'os': ('operatingSystem.name', get_str),
+    'os_version': ('operatingSystem.version', get_str),
+    'os_build': ('operatingSystem.build', get_str),
+    'licensed_software': ('licensedSoftware', get_list),
+}
+# Software that counts as an EDR
+EDR_SOFTWARE = frozenset(("Cylance PROTECT", "CrowdStrike Falcon"))
+
+
+def jamf_sections(fields: dict, heavy: bool = False) -> set[str]:
+    """
+    @param fields: Field mapping, e.g. COMPUTER_FIELDS
+    @param heavy: Whether to include the HEAVY_SECTIONS
+    @return: The Jamf sections the mapping reads from
+    """
+    sections = {JAMF_SECTIONS[section] for section in (path.split('.')[0] for path, _ in fields.values())
+                if section in JAMF_SECTIONS}
+    return sections if heavy else sections - HEAVY_SECTIONS
+
+
+def project(jamf_asset: dict, fields: dict) -> dict:
+    device = {}
+    for name, (path, getter) in fields.items():
+        *parents, key = path.split('.')
+        props = jamf_asset
+        for parent in parents:
+            props = get_dict(parent, props)
+        device[name] = getter(key, props)
+    return device
+
+
+def changed_since(rsql_field: str, since: str) -> str | None:
+    """
+    @param rsql_field: The report date of the device, e.g. general.reportDate
+    @param since: Jamf timestamp of the previous sync, '' for everything
+    @return: RSQL filter for the devices that reported since then
+    """
+    if not since:
+        return None
+    return f'{rsql_field}=ge="{since}"'
+
+
+def normalise_jamf_asset(jamf_asset: dict, software: dict[str, list[str]], fetch_software: bool) -> dict:
+    """
+    @param jamf_asset: A computer or mobile device from Jamf
+    @param software: EDR names per computer id, updated when the software inventory was fetched
+    @param fetch_software: Whether the software inventory was fetched in this run
+    @return: The values to write to Snipe-IT
+    """
+    logging.debug(f"Processing JAMF asset: {jamf_asset}")
+    # We can differentiate between a computer and a mobile device by the presence of a mobileDeviceId
+    if "mobileDeviceId" in jamf_asset:
+        device = project(jamf_asset, MOBILE_FIELDS)
+        device['fieldset_id'] = DEFAULTS['mobile_fieldset_id']
+        device['category_id'] = DEFAULTS['mobile_category_id']
+        device['name'] = device['name'].strip()
+        device['cpu'] = None
+        device['ram'] = 0
+        device['domain'] = ''
+        device['edr'] = []
+        asset_tag_prefix = 'JAMF-M-'
+    else:
+        device = project(jamf_asset, COMPUTER_FIELDS)
+        device['fieldset_id'] = DEFAULTS['fieldset_id']
+        device['category_id'] = DEFAULTS['category_id']
+        device['username'] = ''
+        for user in device['local_users']:
+            if 'homeDirectory' not in user or not user['homeDirectory']:
+                continue
+            # Home directory starts with /Users
+            if (user['homeDirectory'].startswith("/Users") and
+                    user['username'].lower() not in DEFAULTS['techs'] and
+                    'admin' not in user['username'].lower()):
+                device['username'] = clean_user(user['username'])
+                break
+        # Add up all the disk sizes because they are not necessarily in order
+        device['storage'] = sum(disk['sizeMegabytes'] for disk in device['disks'] if 'sizeMegabytes' in disk)
+        device['ip'] = ''
+        device['domain'] = ''
+        ad_status = device['ad_status']
+        if ad_status and ad_status != "Not Bound":
+            device['domain'] = ad_status.split('.')[0].upper()
+        if fetch_software:
+            software[device['id']] = sorted({x['name'] for x in device['licensed_software']} & EDR_SOFTWARE)
+        # None when we have not seen the software of this computer yet, leave the EDR field alone then
+        device['edr'] = software.get(device['id'])
         asset_tag_prefix = 'JAMF-'
-        jamf_cpu = None
-        jamf_ram = 0
-        hardware = get_dict("hardware", jamf_asset)
-        general = get_dict("general", jamf_asset)
-        storage = get_dict("storage", jamf_asset)
-        purchasing = get_dict("purchasing", jamf_asset)
-        operating_system = get_dict("operatingSystem", jamf_asset)
-        jamf_username = ''
-        jamf_ip = ''
-        jamf_domain = ''
-
-        if "mobileDeviceId" in jamf_asset:
-            jamf_id = get_str("mobileDeviceId", jamf_asset)
-            custom_fieldset_id = DEFAULTS['mobile_fieldset_id']
-            category_id = DEFAULTS['mobile_category_id']
-            jamf_userloc = get_dict("userAndLocation", jamf_asset)
-            jamf_username = jamf_userloc.get("username", '')
-            jamf_name = get_str("displayName", general).strip()
-            asset_tag_prefix = 'JAMF-M-'
-            jamf_storage = get_int("capacityMb", hardware)
-            jamf_os = get_str('deviceType', jamf_asset)
-            jamf_os_version = get_str('osVersion', general)
-            jamf_os_build = get_str('osBuild', general)
-            jamf_ip = get_str('ipAddress', general)
-            jamf_licensed_software = []
-        else:
-            jamf_id = jamf_asset['id']
-            jamf_name = general.get("name", '')
-            jamf_usernames = get_list("localUserAccounts", jamf_asset)
-            for user in jamf_usernames:
-                if 'homeDirectory' not in user or not user['homeDirectory']:
-                    continue
-                # Home directory starts with /Users
-                if (user['homeDirectory'].startswith("/Users") and
-                        user['username'].lower() not in DEFAULTS['techs'] and
-                        'admin' not in user['username'].lower()):
-                    jamf_username = clean_user(user['username'])
-                    break
-            jamf_ram = hardware.get('totalRamMegabytes', 0)
-            jamf_disks = get_list("disks", storage)
-            jamf_storage = 0
-            # Add up all the disk sizes because they are not necessarily in order
-            for disk in jamf_disks:
-                if 'sizeMegabytes' not in disk:
-                    continue
-                jamf_storage += disk['sizeMegabytes']
-            jamf_cpu = hardware.get('processorType', '')
-            ad_status = get_str("activeDirectoryStatus", operating_system)
-            if ad_status and ad_status != "Not Bound":
-                jamf_domain = ad_status.split('.')[0].upper()
-            jamf_os = get_str('name', operating_system)
-            jamf_os_version = get_str('version', operating_system)
-            jamf_os_build = get_str('build', operating_system)
-            jamf_licensed_software = get_list("licensedSoftware", jamf_asset)
-        logging.debug(f"Processing JAMF ID: {jamf_id}")
-
-        model_jamf_id = get_str('modelIdentifier', hardware)
-        model_jamf_name = get_str('model', hardware)
-        serial_number = get_str('serialNumber', hardware)
-        asset_tag = hardware.get('assetTag', f"{asset_tag_prefix}{jamf_id}")
-
-        # Get MAC addresses
-        raw_macs = [hardware.get('wifiMacAddress', ''), hardware.get('bluetoothMacAddress', ''),
-                    hardware.get('macAddress', ''), hardware.get('altMacAddress', '')]
-
-        if clean_tag(model_jamf_id):
-            model = (Models(api=snipe_api, model_number=model_jamf_id)
-                     .get_by_model_number()
-                     .populate({"name": model_jamf_name,
-                                "model_number": model_jamf_id,
-                                "manufacturer_id": manufacturer.id,
-                                "category_id": category_id,
-                                "fieldset_id": custom_fieldset_id,
-                                "eol": int(CONFIG['snipe-it'].get('default_eol', "84"))
-                                })
-                     .create())
+    logging.debug(f"Processing JAMF ID: {device['id']}")
+
+    if device['asset_tag'] is None:
+        device['asset_tag'] = f"{asset_tag_prefix}{device['id']}"
+    device['macs'] = [device['wifi_mac'], device['bluetooth_mac'], device['mac'], device['alt_mac']]
+    # Sometimes JAMF returns an extra .0 at the end of the version, and sometimes it doesn't, it is not consistent
+    if device['os_version'].endswith(".0"):
+        device['os_version'] = device['os_version'][:-2]
+    if device['os_build'].endswith(".0"):
+        device['os_build'] = device['os_build'][:-2]
+    return device
+
+
+def upsert_jamf_asset(device: dict, manufacturer: Manufacturers) -> None:
+    if clean_tag(device['model_identifier']):
+        model = (Models(api=snipe_api, model_number=device['model_identifier'])
+                 .get_by_model_number()
+                 .populate({"name": device['model'],
+                            "model_number": device['model_identifier'],
+                            "manufacturer_id": manufacturer.id,
+                            "category_id": device['category_id'],
+                            "fieldset_id": device['fieldset_id'],
+                            "eol": int(CONFIG['snipe-it'].get('default_eol', "84"))
+                            })
+                 .create())
+    else:
+        model = Models(api=snipe_api, name='Unspecified').get_by_name()
+
+    new_hw = (Hardware(api=snipe_api,
+                       name=device['name'],
+                       asset_tag=device['asset_tag'],
+                       serial=device['serial'],
+                       custom_fields=copy.deepcopy(DEFAULTS['custom_fields']),
+                       status_id=DEFAULTS['status_id_deployed'],
+                       model_id=model.id
+                       )
+              .get_by_serial()
+              .get_by_asset_tag()
+              .get_by_mac(device['macs'])
+              .store_state()
+              .populate_mac(device['macs']))
+
+    if new_hw.status_id == DEFAULTS['status_id_pending']:
+        new_hw.status_id = DEFAULTS['status_id_deployed']
+
+    if new_hw.status_id == 5:
+        new_hw.status_id = 4
+
+    purchase_cost = device['purchase_price']
+    if not new_hw.purchase_cost and purchase_cost:
+        setattr(new_hw, 'purchase_cost', purchase_cost)
+
+    lease_date = device['lease_date']
+    purchase_date = device['po_date'] if device['po_date'] is not None else lease_date
+    warranty_ends = device['warranty_date']
+    if not new_hw.purchase_date:
+        if purchase_date:
+            setattr(new_hw, 'purchase_date', purchase_date)
         else:
-            model = Models(api=snipe_api, name='Unspecified').get_by_name()
-
-        new_hw = (Hardware(api=snipe_api,
-                           name=jamf_name,
-                           asset_tag=asset_tag,
-                           serial=serial_number,
-                           custom_fields=copy.deepcopy(DEFAULTS['custom_fields']),
-                           status_id=DEFAULTS['status_id_deployed'],
-                           model_id=model.id
-                           )
-                  .get_by_serial()
-                  .get_by_asset_tag()
-                  .get_by_mac(raw_macs)
-                  .store_state()
-                  .populate_mac(raw_macs))
-
-        if new_hw.status_id == DEFAULTS['status_id_pending']:
-            new_hw.status_id = DEFAULTS['status_id_deployed']
-
-        if new_hw.status_id == 5:
-            new_hw.status_id = 4
-
-        purchase_cost = purchasing.get('purchasePrice', 0)
-        if not new_hw.purchase_cost and purchase_cost:
-            setattr(new_hw, 'purchase_cost', purchase_cost)
-
-        lease_date = purchasing.get('leaseDate', '')
-        purchase_date = purchasing.get('poDate', lease_date)
-        warranty_ends = purchasing.get('warrantyDate', '')
-        if not new_hw.purchase_date:
+            logging.debug(f"Asset has no purchase date, making a guess")
+            purchase_date = query_apple_warranty(device['serial'], device['model'])
             if purchase_date:
-                setattr(new_hw, 'purchase_date', purchase_date)
+                setattr(new_hw, 'purchase_date', purchase_date.strftime("%Y-%m-%d"))
+                setattr(new_hw, 'warranty_months', 36)
             else:
-                logging.debug(f"Asset has no purchase date, making a guess")
-                purchase_date = query_apple_warranty(serial_number, model_jamf_name)
-                if purchase_date:
-                    setattr(new_hw, 'purchase_date', purchase_date.strftime("%Y-%m-%d"))
-                    setattr(new_hw, 'warranty_months', 36)
-                else:
-                    logging.info(f"Could not find a purchase date for {model_jamf_name}")
-
-        if warranty_ends and purchase_date:
-            months = (datetime.strptime(warranty_ends, "%Y-%m-%d") - datetime.strptime(purchase_date,
-                                                                                       "%Y-%m-%d")).days // 30
-            setattr(new_hw, 'warranty_months', months)
-
-        new_hw.set_custom_field("CPU", jamf_cpu)
-        new_hw.set_custom_field("RAM", jamf_ram)
-        new_hw.set_custom_field("Storage", str(jamf_storage))
-
-        # Don't collect public network information
-        if (jamf_ip.startswith("10.") or jamf_ip.startswith("192.168") or jamf_ip.startswith("172.16") or
-                jamf_ip.startswith("172.17") or jamf_ip.startswith("172.18") or jamf_ip.startswith("172.19") or
-                jamf_ip.startswith("172.2") or jamf_ip.startswith("172.30") or jamf_ip.startswith("172.31")):
-            new_hw.set_custom_field("IP Address", jamf_ip)
-
-        new_hw.set_custom_field("OS Type", "Other")
-        new_hw.set_custom_field("Operating System", jamf_os)
-        # Sometimes JAMF returns an extra .0 at the end of the version, and sometimes it doesn't, it is not consistent
-        if jamf_os_version.endswith(".0"):
-            jamf_os_version = jamf_os_version[:-2]
-        new_hw.set_custom_field("OS Version", jamf_os_version)
-        if jamf_os_build.endswith(".0"):
-            jamf_os_build = jamf_os_build[:-2]
-        new_hw.set_custom_field("OS Build", jamf_os_build)
-
-        # All Apple devices come with XProtect
-        if not jamf_licensed_software:
-            jamf_licensed_software = [{"name": "XProtect", 'id': '0'}]
-        # Filter out the names from jamf_licensed_software
-        edr_list = [x['name'] for x in jamf_licensed_software if x['name'] in ["Cylance PROTECT", "CrowdStrike Falcon"]]
-        new_hw.set_custom_field("EDR", ', '.join(filter_list(edr_list)))
-
-        if not new_hw.get_custom_field("Domain"):
-            new_hw.set_custom_field("Domain", jamf_domain)
-        else:
-            old_domain_list: list = new_hw.get_custom_field("Domain").split(", ")
-            # Add the new values to the old values
-            new_hw.set_custom_field("Domain", ', '.join(filter_list(old_domain_list + [jamf_domain])))
+                logging.info(f"Could not find a purchase date for {device['model']}")
 
-        if not new_hw.get_custom_field("Management"):
-            new_hw.set_custom_field("Management", "JAMF")
-        else:
-            old_management_list: list = new_hw.get_custom_field("Management").split(", ")
-            # Add the new values to the old values
-            new_hw.set_custom_field("Management", ', '.join(filter_list(old_management_list + ['JAMF'])))
+    if warranty_ends and purchase_date:
+        months = (datetime.strptime(warranty_ends, "%Y-%m-%d") - datetime.strptime(purchase_date,
+                                                                                   "%Y-%m-%d")).days // 30
+        setattr(new_hw, 'warranty_months', months)
+
+    new_hw.set_custom_field("CPU", device['cpu'])
+    new_hw.set_custom_field("RAM", device['ram'])
+    new_hw.set_custom_field("Storage", str(device['storage']))
+
+    # Don't collect public network information
+    jamf_ip = device['ip']
+    if (jamf_ip.startswith("10.") or jamf_ip.startswith("192.168") or jamf_ip.startswith("172.16") or
+            jamf_ip.startswith("172.17") or jamf_ip.startswith("172.18") or jamf_ip.startswith("172.19") or
+            jamf_ip.startswith("172.2") or jamf_ip.startswith("172.30") or jamf_ip.startswith("172.31")):
+        new_hw.set_custom_field("IP Address", jamf_ip)
+
+    new_hw.set_custom_field("OS Type", "Other")
+    new_hw.set_custom_field("Operating System", device['os'])
+    new_hw.set_custom_field("OS Version", device['os_version'])
+    new_hw.set_custom_field("OS Build", device['os_build'])
+
+    if device['edr'] is not None:
+        new_hw.set_custom_field("EDR", ', '.join(filter_list(device['edr'])))
 
-        if jamf_username:
-            new_hw.set_custom_field("Last User", jamf_username)
+    # Add the new values to the old values
+    new_hw.merge_custom_field("Domain", [device['domain']])
+    new_hw.merge_custom_field("Management", ['JAMF'])
+
+    if device['username']:
+        new_hw.set_custom_field("Last User", device['username'])
+
+    new_hw.upsert()
+
+
+def main():
+    state = load_state(STATE_FILE)
+    now = datetime.now(timezone.utc)
+    last_full = state.get('last_full', '')
+    # Deleted and re-enrolled devices are not "updated", a full sync every so often catches whatever we missed
+    full_sync = not last_full or parse_isoformat(last_full) < now - timedelta(hours=FULL_SYNC_HOURS)
+    since = '' if full_sync else state.get('watermark', '')
+    started = (now - SYNC_OVERLAP).strftime(JAMF_TIMESTAMP_FORMAT)
+    logging.info(f"{'Full' if full_sync else 'Incremental'} Jamf sync" + (f" of devices updated since {since}"
+                                                                           if since else ""))
+
+    mobile_pages = Pagination()
+    computer_pages = Pagination()
+    mobile_list: Generator = get_jamf_mobiles(changed_since("general.lastInventoryUpdateDate", since),
+                                              pagination=mobile_pages)
+    # EDR names from the software inventory of every computer, the software is only fetched every software_hours
+    software: dict[str, list[str]] = {} if full_sync else state.get('software', {})
+    software_at = state.get('software_at', '')
+    fetch_software = (full_sync or not software_at or
+                      parse_isoformat(software_at) < now - timedelta(hours=SOFTWARE_HOURS))
+    # The software of every computer that changed since the previous software fetch, not just since the last run.
+    # Otherwise a computer that changed during a run without software keeps its old EDR names until the next full sync.
+    computers_since = since if full_sync or not fetch_software else software_at
+    computer_list: Generator = get_jamf_computers(changed_since("general.reportDate", computers_since),
+                                                  pagination=computer_pages,
+                                                  sections=jamf_sections(COMPUTER_FIELDS, heavy=fetch_software))
+    manufacturer = Manufacturers(api=snipe_api).get_by_name("Apple").create()
 
-        new_hw.upsert()
-        print_progress(current_count, TOTALCOUNT)
-        current_count += 1
+    # Both streams are fetched at the same time while the devices are upserted
+    pipeline = Pipeline([Stage('normalise', partial(normalise_jamf_asset, software=software,
+                                                    fetch_software=fetch_software)),
+                         Stage('upsert', partial(upsert_jamf_asset, manufacturer=manufacturer))],
+                        progress=lambda done: print_progress(done, mobile_pages.total_count +
+                                                             computer_pages.total_count))
+    pipeline.run(mobile_list, computer_list)
+    if pipeline.failed:
+        raise SystemExit(f"{pipeline.failed} devices failed, keeping the previous watermark")
+
+    # Only after every device made it, otherwise the next run picks up where this one started
+    save_state(STATE_FILE, {'watermark': started,
+                            'last_full': now.strftime(JAMF_TIMESTAMP_FORMAT) if full_sync else last_full,
+                            'software_at': started if fetch_software else software_at,
+                            'software': software})
 
 
 if __name__ == "__main__":
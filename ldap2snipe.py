@@ -1,7 +1,18 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import copy
+import html
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from configparser import RawConfigParser
+from datetime import datetime, timedelta, timezone
+from functools import partial
 from os import getenv
+from queue import Empty, Queue
+from threading import BoundedSemaphore, Lock
+from typing import Iterator
 
 from ldap.controls import SimplePagedResultsControl
 
@@ -11,8 +22,10 @@ import logging
 
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
-from snipeit_api.helpers import filter_list, get_dept_from_ou, clean_user
+from snipeit_api.helpers import get_dept_from_ou, clean_user
 from snipeit_api.models import Hardware, Users, Departments
+from snipeit_api.pipeline import Pipeline, Stage
+from snipeit_api.state import load_state, save_state
 
 # Read in credentials from ini file
 logging.basicConfig(level=logging.ERROR)
@@ -22,24 +35,62 @@ CONFIG.read("settings.conf")
 snipeit_apiurl = CONFIG.get('snipe-it', 'url')
 snipeit_apikey = CONFIG.get('snipe-it', 'apikey')
 
-entry = getenv('LDAP_CONFIG', 'ldap')
-domain_creds = CONFIG[entry]
-
-# Get this variable from environment
-# snipeit_apikey =
-
-domain = domain_creds['domain']
-ldap_bind_dn = domain_creds['bind_dn']
-ldap_pass = domain_creds['password']
-ldap_bases = domain_creds['search_bases'].split('\n')
-ldap_user_base = domain_creds['ldap_base']
-ldap_filter_computer = domain_creds['ldap_filter']
-ldap_filter_user = domain_creds['ldap_filter_user']
+# whenChanged is set by the domain controller that made the change, allow for clocks and replication running behind
+SYNC_OVERLAP = timedelta(minutes=15)
+LDAP_TIMESTAMP_FORMAT = "%Y%m%d%H%M%S.0Z"
+# Domains synced at the same time share the state file
+STATE_LOCK = Lock()
 
 snipe_api = SnipeITApi(snipeit_apiurl, snipeit_apikey)
 
 
-def process_computer(item):
+class LdapDomain:
+    """
+    One LDAP config section. Every search base is searched over its own connection, taken from a small pool of
+    connections to the best domain controller that answers.
+    """
+
+    def __init__(self, entry: str) -> None:
+        domain_creds = CONFIG[entry]
+        self.entry = entry
+        self.domain = domain_creds['domain']
+        self.bind_dn = domain_creds['bind_dn']
+        self.password = domain_creds['password']
+        self.bases = [base.strip() for base in domain_creds['search_bases'].split('\n') if base.strip()]
+        self.user_base = domain_creds['ldap_base']
+        self.filter_computer = domain_creds['ldap_filter']
+        self.filter_user = domain_creds['ldap_filter_user']
+        # Only objects changed since the last successful run of this domain are synced, see sync_domain
+        self.state_file = domain_creds.get('state', 'ldap_state.json')
+        self.full_sync_hours = int(domain_creds.get('full_sync_hours', '24'))
+        self.pool_size = int(domain_creds.get('connections', '4'))
+        self.idle: Queue = Queue()
+        self.slots = BoundedSemaphore(self.pool_size)
+
+    def __repr__(self):
+        return f"LdapDomain({self.entry}: {self.domain})"
+
+    @contextmanager
+    def connection(self):
+        with self.slots:
+            try:
+                conn = self.idle.get_nowait()
+            except Empty:
+                conn = connect_ldap(self)
+            try:
+                yield conn
+            except BaseException:
+                # The connection may be in the middle of a search, do not hand it out again
+                conn.unbind_s()
+                raise
+            self.idle.put(conn)
+
+    def close(self) -> None:
+        while not self.idle.empty():
+            self.idle.get_nowait().unbind_s()
+
+
+def process_computer(item, domain: LdapDomain):
     ou = item['canonicalname'].split('/')[:-1]
     ou_text = "/".join(ou)
 
@@ -55,11 +106,8 @@ def process_computer(item):
     if new_hw.status_id == 5 or 'research' in ou_text.lower():
         new_hw.status_id = 4
 
-    mgmt: list = new_hw.get_custom_field('Management').split(", ")
-    new_hw.set_custom_field('Management', ", ".join(filter_list(mgmt + ['AD'])))
-
-    domains: list = new_hw.get_custom_field('Domain').split(", ")
-    new_hw.set_custom_field('Domain', ", ".join(filter_list(domains + [domain_creds['domain'].split('.')[0].upper()])))
+    new_hw.merge_custom_field('Management', ['AD'])
+    new_hw.merge_custom_field('Domain', [domain.domain.split('.')[0].upper()])
 
     org_unit = ou_text.lower().replace('.rochester.edu', '')
     new_hw.set_custom_field('Org. Unit', org_unit)
@@ -80,56 +128,139 @@ def process_computer(item):
     new_hw.upsert()
 
 
-def process_user(item: dict, manager_lookup: dict[str, str]):
+class SnipeDirectory:
+    """
+    Every Snipe-IT user (by employee number and by username) and department (by name), loaded once so LDAP users
+    are compared in memory and only real differences are sent.
+    """
+
+    def __init__(self, api: SnipeITApi) -> None:
+        self.api = api
+        self.by_employee_num: dict[str, dict] = {}
+        self.by_username: dict[str, dict] = {}
+        self.departments: dict[str, int] = {}
+        self.loaded = False
+        # Several domains can create users and departments at the same time
+        self.lock = Lock()
+
+    def load(self) -> SnipeDirectory:
+        for row in self.api.iter_rows('users', {'sort': 'id', 'order': 'asc'}):
+            self.add_user(row)
+        for row in self.api.iter_rows('departments', {'sort': 'id', 'order': 'asc'}):
+            self.departments[html.unescape(row.get('name') or '').casefold()] = row['id']
+        # Only once both are complete, a partial directory would turn existing users into duplicate creates
+        self.loaded = True
+        logging.info(f"Loaded {len(self.by_username)} users and {len(self.departments)} departments from Snipe-IT")
+        return self
+
+    def add_user(self, row: dict) -> dict:
+        # Only what process_user compares, not the whole row
+        user = {
+            'id': row['id'],
+            'username': html.unescape(row.get('username') or ''),
+            'employee_num': html.unescape(str(row.get('employee_num') or '')),
+            'first_name': html.unescape(row.get('first_name') or ''),
+            'last_name': html.unescape(row.get('last_name') or ''),
+            'email': html.unescape(row.get('email') or ''),
+            'jobtitle': html.unescape(row.get('jobtitle') or ''),
+            'phone': html.unescape(row.get('phone') or ''),
+            'department_id': (row.get('department') or {}).get('id') or 0,
+            'manager_id': (row.get('manager') or {}).get('id') or 0,
+        }
+        if user['employee_num']:
+            self.by_employee_num[user['employee_num']] = user
+        if user['username']:
+            self.by_username[user['username'].lower()] = user
+        return user
+
+    def find_user(self, employee_num: str, username: str) -> dict | None:
+        """
+        @return: The user with this employee number, otherwise the one with this username
+        """
+        return self.by_employee_num.get(employee_num) or self.by_username.get(username.lower())
+
+    def department_id(self, name: str) -> int:
+        key = name.casefold()
+        with self.lock:
+            if key not in self.departments:
+                logging.info(f"Could not find department {name}")
+                self.departments[key] = Departments(api=self.api, name=name).create().id
+        return self.departments[key]
+
+
+def process_user(item: dict, manager_lookup: dict[str, str], directory: SnipeDirectory):
     username = clean_user(item['username'])
-    uidnumber = int(item['uidnumber'])
+    uidnumber = int(item['uidnumber'] or 0)
 
-    if not int(item['uidnumber']) or not username:
+    if not uidnumber or not username:
         return
 
-    new_user = Users(api=snipe_api).get_by_employee_num(uidnumber)
+    with directory.lock:
+        if not directory.loaded:
+            directory.load()
 
-    new_user.store_state()
+    employee_num = str(uidnumber)
+    current = directory.find_user(employee_num, username)
+    # Users created by another importer do not have an employee number yet, anyone else is a different person
+    if current and current['employee_num'] and current['employee_num'] != employee_num:
+        logging.error(f"Skipping {username} ({employee_num}): username belongs to employee "
+                      f"{current['employee_num']} in Snipe-IT")
+        return
+    changes = {}
 
     # This is a new user, make sure we have a username
-    if not new_user.id:
-        new_user.username = username
-        new_user.first_name = item['given_name']
-        new_user.last_name = item['sn']
-        new_user.employee_num = uidnumber
-
-    if not new_user.first_name:
-        new_user.first_name = username
-    if not new_user.last_name:
-        new_user.last_name = 'Unknown'
-
-    if item['mail'] and not new_user.email:
-        new_user.email = item['mail']
-    if item['title'] and not new_user.jobtitle:
-        new_user.jobtitle = item['title']
-    if item['telephone_number'] and not new_user.phone:
-        new_user.phone = item['telephone_number']
-
+    if not current:
+        changes = {'username': username, 'first_name': item['given_name'], 'last_name': item['sn'],
+                   'employee_num': employee_num}
+        current = {}
+    elif current['employee_num'] != employee_num:
+        changes['employee_num'] = employee_num
+
+    if not changes.get('first_name', current.get('first_name')):
+        changes['first_name'] = username
+    if not changes.get('last_name', current.get('last_name')):
+        changes['last_name'] = 'Unknown'
+
+    for key, value in (('email', item['mail']), ('jobtitle', item['title']), ('phone', item['telephone_number'])):
+        if value and not current.get(key):
+            changes[key] = value
 
     department_name = item['department'].strip()
-    if department_name and not new_user.department_id:
-        department = Departments(api=snipe_api, name=department_name).get_by_name()
-        if not department.id:
-            logging.info(f"Could not find department {department_name}")
-            department.create()
-        if department.id:
-            new_user.department_id = department.id
+    if department_name and not current.get('department_id'):
+        department_id = directory.department_id(department_name)
+        if department_id:
+            changes['department_id'] = department_id
 
     manager_uid = manager_lookup.get(item['manager_dn'].lower(), '')
-    if manager_uid and manager_uid != new_user.employee_num:
-        manager = Users(api=snipe_api).get_by_employee_num(manager_uid)
-        if manager.id:
-            new_user.manager_id = manager.id
+    if manager_uid and manager_uid != employee_num:
+        manager = directory.by_employee_num.get(manager_uid)
+        if manager and manager['id'] != current.get('manager_id'):
+            changes['manager_id'] = manager['id']
+
+    if not current:
+        with directory.lock:
+            # Another domain syncing the same person may have created them since the lookup above
+            if not directory.find_user(employee_num, username):
+                # Raised so the pipeline counts the failure and the watermark is not moved past this user
+                try:
+                    new_user = Users(api=snipe_api).populate(changes).upsert()
+                except ValueError as e:
+                    raise ValueError(f"Error creating {username}: {e}") from e
+                directory.add_user({**changes, 'id': new_user.id, 'department': {'id': changes.get('department_id')},
+                                    'manager': {'id': changes.get('manager_id')}})
+                return
+        # Compare against the user the other domain created instead
+        return process_user(item, manager_lookup, directory)
+
+    if not changes:
+        return
 
-    try:
-        new_user.upsert()
-    except ValueError as e:
-        logging.error(f"Error upserting {new_user.username}: {e}")
+    data = snipe_api.call(f"users/{current['id']}", method="PATCH", payload=changes)
+    if data.get('status') != "success":
+        raise ValueError(f"Error upserting {username}: {data}")
+    current.update(changes)
+    if 'employee_num' in changes:
+        directory.by_employee_num[employee_num] = current
 
 
 def _decode_attr(attrs: dict, key: str) -> str:
@@ -138,7 +269,11 @@ def _decode_attr(attrs: dict, key: str) -> str:
     return attrs[key][0].decode('utf-8').strip()
 
 
-def query_base(ldap_conn, ldap_base, searchreq_attrlist, ldap_filter):
+def query_base(ldap_conn, ldap_base, searchreq_attrlist, ldap_filter) -> Iterator[dict[str, str]]:
+    """
+    Search a base page by page, every entry is returned as soon as its page arrives.
+    @return: The first value of every requested attribute, decoded, '' when the entry does not have it
+    """
     # Search for all hosts
     # How many users to search for in each page, this depends on the server maximum setting
     # (by default the highest value is 1000)
@@ -158,19 +293,15 @@ def query_base(ldap_conn, ldap_base, searchreq_attrlist, ldap_filter):
                                  filterstr=ldap_filter,
                                  attrlist=searchreq_attrlist, serverctrls=[req_ctrl])
 
-    results = []
     # Loop over all the pages using the same cookie, otherwise the search will fail
     while True:
         _, rdata, _, serverctrls = ldap_conn.result3(msgid)
         for item in rdata:
             logging.debug(item[1])
+            # Referrals have no attributes
             if not isinstance(item[1], dict):
                 continue
-            for key in searchreq_attrlist:
-                if key not in item[1]:
-                    item[1][key] = ["".encode('utf-8')]
-
-            results.append(item)
+            yield {key: _decode_attr(item[1], key) for key in searchreq_attrlist}
 
         pctrls = [c for c in serverctrls if c.controlType == SimplePagedResultsControl.controlType]
         if not pctrls or not pctrls[0].cookie:
@@ -180,75 +311,168 @@ def query_base(ldap_conn, ldap_base, searchreq_attrlist, ldap_filter):
         msgid = ldap_conn.search_ext(base=ldap_base, scope=ldap.SCOPE_SUBTREE, filterstr=ldap_filter,
                                      attrlist=searchreq_attrlist, serverctrls=[req_ctrl])
 
-    return results
 
-def connect_ldap():
-    # Query DNS for nearest LDAP server
-    ldap_server = dns.resolver.resolve(f'_ldap._tcp.{domain}', 'SRV')[0].target.to_text()
+def ldap_servers(domain: str) -> list[str]:
+    """
+    @param domain: DNS domain of the directory
+    @return: The domain controllers from the SRV records, lowest priority first and within a priority in a random
+             order weighted by their weight (RFC 2782)
+    """
+    records = dns.resolver.resolve(f'_ldap._tcp.{domain}', 'SRV')
+    servers = []
+    for priority in sorted({record.priority for record in records}):
+        group = [record for record in records if record.priority == priority]
+        while group:
+            # A weight of 0 still gets a small chance
+            record = random.choices(group, weights=[record.weight or 0.1 for record in group])[0]
+            group.remove(record)
+            servers.append(f"{record.target.to_text().rstrip('.')}:{record.port}")
+    return servers
+
+
+def connect_ldap(domain: LdapDomain):
+    # Query DNS for the domain controllers and use the first one that lets us bind
+    error = None
+    for ldap_server in ldap_servers(domain.domain):
+        try:
+            ldap_conn = ldap.initialize(f"ldap://{ldap_server}")
+            ldap_conn.protocol_version = 3
+            ldap_conn.set_option(ldap.OPT_REFERRALS, 0)
+            ldap_conn.set_option(ldap.OPT_NETWORK_TIMEOUT, 10)
+            ldap_conn.simple_bind_s(domain.bind_dn, domain.password)
+            return ldap_conn
+        except (ldap.SERVER_DOWN, ldap.TIMEOUT, ldap.CONNECT_ERROR) as e:
+            logging.warning(f"Cannot connect to {ldap_server} for {domain.domain}, trying the next one: {e}")
+            error = e
+    raise ConnectionError(f"No domain controller of {domain.domain} is reachable: {error}") from error
+
+
+def get_computers(domain: LdapDomain, ldap_base: str, since: str = ''):
+    with domain.connection() as ldap_conn:
+        results = query_base(ldap_conn, ldap_base, ["canonicalName", "cn", "operatingSystem", "OperatingSystemHotfix",
+                             "OperatingSystemServicePack", "operatingSystemVersion"],
+                             changed_since(domain.filter_computer, since))
+
+        for attrs in results:
+            yield {"canonicalname": attrs["canonicalName"],
+                   "cn": attrs["cn"].upper(),
+                   "os": attrs["operatingSystem"],
+                   "os_hotfix": attrs["OperatingSystemHotfix"],
+                   "os_servicepack": attrs["OperatingSystemServicePack"],
+                   "os_version": attrs["operatingSystemVersion"]}
+
+
+def get_host(domain: LdapDomain, since: str = '') -> int:
+    # Every search base is searched at the same time while the computers are updated
+    pipeline = Pipeline([Stage('upsert', partial(process_computer, domain=domain))])
+    pipeline.run(*(get_computers(domain, ldap_base, since) for ldap_base in domain.bases))
+    return pipeline.failed
+
+
+def get_manager_lookup(ldap_conn, domain: LdapDomain) -> dict[str, str]:
+    # Managers can come after the people reporting to them, a first pass over just the DN and uidNumber finds them all
+    manager_lookup = {}
+    for attrs in query_base(ldap_conn, domain.user_base, ["distinguishedName", "uidNumber"], domain.filter_user):
+        manager_key = attrs['distinguishedName'].lower()
+        manager_uid = attrs['uidNumber']
+        if manager_key and manager_uid:
+            manager_lookup[manager_key] = manager_uid
+    return manager_lookup
 
-    # Connect to LDAP
-    ldap_conn = ldap.initialize(f"ldap://{ldap_server}")
-    ldap_conn.protocol_version = 3
-    ldap_conn.set_option(ldap.OPT_REFERRALS, 0)
-    ldap_conn.simple_bind_s(ldap_bind_dn, ldap_pass)
-    return ldap_conn
 
-def get_host():
-    ldap_conn = connect_ldap()
-    # Search for all hosts How many users to search for in each page, this depends on the server maximum setting
-    # (by default the highest value is 1000)
-    for current_ldap_base in ldap_bases:
-        results = query_base(ldap_conn, current_ldap_base, ["canonicalName", "cn", "operatingSystem", "OperatingSystemHotfix",
-                          "OperatingSystemServicePack", "operatingSystemVersion"], ldap_filter_computer)
-
-        for item in results:
-            result = {"canonicalname": item[1]["canonicalName"][0].decode("utf-8"),
-                      "cn": item[1]["cn"][0].decode("utf-8").upper(),
-                      "os": item[1]["operatingSystem"][0].decode("utf-8"),
-                      "os_hotfix": item[1]["OperatingSystemHotfix"][0].decode("utf-8"),
-                      "os_servicepack": item[1]["OperatingSystemServicePack"][0].decode("utf-8"),
-                      "os_version": item[1]["operatingSystemVersion"][0].decode("utf-8")}
-            process_computer(result)
-
-def get_user():
-    ldap_conn = connect_ldap()
+def get_users(ldap_conn, domain: LdapDomain, since: str = ''):
     search_attrs = [
         "sn", "sAMAccountName", "givenName", "mail", "department", "title", "manager",
         "telephoneNumber", "uidNumber", "distinguishedName"
     ]
-    results = query_base(ldap_conn, ldap_user_base, search_attrs, ldap_filter_user)
+    for attrs in query_base(ldap_conn, domain.user_base, search_attrs, changed_since(domain.filter_user, since)):
+        yield {
+            "sn": attrs["sn"],
+            "username": attrs["sAMAccountName"],
+            "given_name": attrs["givenName"],
+            "mail": attrs["mail"],
+            "department": attrs["department"],
+            "title": attrs["title"],
+            "manager_dn": attrs["manager"],
+            "telephone_number": attrs["telephoneNumber"],
+            "uidnumber": attrs["uidNumber"],
+            "distinguished_name": attrs["distinguishedName"]
+        }
 
-    users = []
-    manager_lookup = {}
 
-    for item in results:
-        attrs = item[1]
-        result = {
-            "sn": _decode_attr(attrs, "sn"),
-            "username": _decode_attr(attrs, "sAMAccountName"),
-            "given_name": _decode_attr(attrs, "givenName"),
-            "mail": _decode_attr(attrs, "mail"),
-            "department": _decode_attr(attrs, "department"),
-            "title": _decode_attr(attrs, "title"),
-            "manager_dn": _decode_attr(attrs, "manager"),
-            "telephone_number": _decode_attr(attrs, "telephoneNumber"),
-            "uidnumber": _decode_attr(attrs, "uidNumber"),
-            "distinguished_name": _decode_attr(attrs, "distinguishedName")
-        }
-        users.append(result)
+def get_user(domain: LdapDomain, directory: SnipeDirectory, since: str = '') -> int:
+    with domain.connection() as ldap_conn:
+        # Always complete, the managers of changed users have usually not changed themselves
+        manager_lookup = get_manager_lookup(ldap_conn, domain)
+        pipeline = Pipeline([Stage('upsert', partial(process_user, manager_lookup=manager_lookup,
+                                                     directory=directory))])
+        pipeline.run(get_users(ldap_conn, domain, since))
+    return pipeline.failed
+
+
+def changed_since(ldap_filter: str, since: str) -> str:
+    """
+    @param ldap_filter: Filter from the configuration
+    @param since: LDAP generalized time of the previous sync, '' for everything
+    @return: The filter limited to the objects changed since then
+    """
+    if not since:
+        return ldap_filter
+    if not ldap_filter.startswith('('):
+        ldap_filter = f"({ldap_filter})"
+    return f"(&{ldap_filter}(whenChanged>={since}))"
+
+
+def sync_domain(domain: LdapDomain, directory: SnipeDirectory) -> None:
+    now = datetime.now(timezone.utc)
+    domain_state = load_state(domain.state_file).get(domain.entry, {})
+    last_full = domain_state.get('last_full', '')
+    # Deleted and moved objects do not always show up as changed, a full pass every so often catches them
+    full_sync = (not last_full or
+                 datetime.strptime(last_full, LDAP_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc) <
+                 now - timedelta(hours=domain.full_sync_hours))
+    since = '' if full_sync else domain_state.get('watermark', '')
+    started = (now - SYNC_OVERLAP).strftime(LDAP_TIMESTAMP_FORMAT)
+    logging.info(f"{'Full' if full_sync else 'Incremental'} sync of {domain.domain}" +
+                 (f" for objects changed since {since}" if since else ""))
 
-        manager_key = result['distinguished_name'].lower()
-        manager_uid = result['uidnumber']
-        if manager_key and manager_uid:
-            manager_lookup[manager_key] = manager_uid
+    try:
+        # Computers and users are searched at the same time, each over their own connections
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            hosts = executor.submit(get_host, domain, since)
+            users = executor.submit(get_user, domain, directory, since)
+            failed = hosts.result() + users.result()
+    finally:
+        domain.close()
+    if failed:
+        logging.error(f"{failed} objects failed, keeping the previous watermark of {domain.domain}")
+        return
 
-    for user in users:
-        process_user(user, manager_lookup)
+    # Other domains share the file, only replace ours
+    with STATE_LOCK:
+        state = load_state(domain.state_file)
+        state[domain.entry] = {'watermark': started,
+                               'last_full': now.strftime(LDAP_TIMESTAMP_FORMAT) if full_sync else last_full}
+        save_state(domain.state_file, state)
 
 
 def main():
-    get_host()
-    get_user()
+    # One or more config sections, e.g. LDAP_CONFIG=ldap,ldap_two, all of them are synced at the same time
+    domains = [LdapDomain(entry.strip()) for entry in getenv('LDAP_CONFIG', 'ldap').split(',') if entry.strip()]
+    # Shared, so two domains never create the same department
+    directory = SnipeDirectory(snipe_api)
+    failed = []
+    with ThreadPoolExecutor(max_workers=len(domains)) as executor:
+        futures = {executor.submit(sync_domain, domain, directory): domain for domain in domains}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Sync of {futures[future].domain} failed: {e!r}")
+                failed.append(futures[future].domain)
+    # The other domains are still synced, but the run has to show up as failed
+    if failed:
+        raise SystemExit(f"Sync failed for {', '.join(failed)}")
 
 
 if __name__ == '__main__':
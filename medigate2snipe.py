@@ -11,13 +11,16 @@ from medigate_api.rest import ApiException
 
 from snipeit_api.defaults import DEFAULTS
 from snipeit_api.api import SnipeITApi
-from snipeit_api.helpers import filter_list, filter_list_first, clean_tag, print_progress, \
-    clean_user, clean_edr, clean_mac, get_os_type, clean_model, setup_logging
+from snipeit_api.helpers import filter_list, filter_list_first, clean_tag, clean_tags, print_progress, \
+    clean_user, clean_edr, clean_mac_lists, get_os_type, clean_model, setup_logging, setup_manufacturer_rules
 from snipeit_api.models import Hardware, Models, Category, Manufacturers, FieldSets, Locations
+from snipeit_api.normalize import Field, normalize_records
+from snipeit_api.pipeline import Pipeline, Stage
 
 CONFIG = RawConfigParser()
 CONFIG.read("settings.conf")
 setup_logging(CONFIG)
+setup_manufacturer_rules(CONFIG)
 logging.debug("Checking for a settings.conf ...")
 medigate_apikey = CONFIG.get('medigate', 'apikey')
 medigate_apiurl = CONFIG.get('medigate', 'url')
@@ -107,208 +110,225 @@ fields = [
     # "vlan_description_list",
 ]
 
+
+def medigate_hostname(device_name: str) -> str:
+    hostname = device_name.split("\\")
+    hostname = hostname[int(len(hostname) > 1)]
+    # Get canonical name
+    return hostname.split(".")[0].upper()
+
+
+# Cleaned once per page, see snipeit_api.normalize
+medigate_fields = {
+    'name': Field('device_name', medigate_hostname),
+    'serial': Field('serial_number', column=clean_tags),
+    'model': Field('model', clean_model, default='Unknown'),
+    'mac_addresses': Field('mac_list', default=(), many=True, column=clean_mac_lists),
+    'last_user': Field(lambda device: filter_list_first(device['authentication_user_list'],
+                                                        [device['last_domain_user']]), clean_user),
+    'location': Field('site_name', clean_tag),
+}
+
 # Create an instance of the API class
 mg_api = DevicesApi(ApiClient(Configuration(access_token=medigate_apikey)))
-offset = 0
 count = 0
 limit = 100
-current = 0
-timeout = 60  # seconds
-
-while offset <= count:
-    parameters = GetDevicesParameters.from_dict({
-        "filter_by": {
-            "operation": "and",
-            "operands": [
-                {
-                    "field": "network_list",
-                    "operation": "in",
-                    "value": ["Corporate"]
-                },
-                {
-                    "field": "mac_list",
-                    "operation": "is_not_null"
-                },
-                {
-                    "field": "retired",
-                    "operation": "in",
-                    "value": [False]
-                },
-                {
-                    "field": "mac_oui_list",
-                    "operation": "not_in",
-                    "value": ["Randomized Locally Administered Address"]
-                },
-                {
-                    "field": DEFAULTS['first_or_last'],
-                    "operation": "has_any_after_seconds_ago",
-                    "value": DEFAULTS['days'] * 24 * 60 * 60  # 30 days
-                }
-            ]
-        },
-        "offset": offset,
-        "limit": limit,
-        "fields": fields,
-        "include_count": True,
-
-    })
-    logging.debug(parameters)
-    try:
-        # Get devices
-        api_response = mg_api.get_devices(parameters)
-        if not count:
-            count = api_response.count
-            print(f"Total devices: {count}")
-        offset += limit
-        timeout = 60 # Reset timeout on successful API call
-    except ApiException as e:
-        logging.error("Exception when calling DevicesApi->get_devices: %s\n" % e)
-        sleep(timeout)  # Sleep for 60 seconds before trying again
-        timeout *= 2  # Exponential backoff
-        continue
-    except (ValueError, KeyError):
-        logging.error("Error parsing response")
-        continue
-
-    for device in api_response.devices:
-        print_progress(current, count)
-        current += 1
-        logging.debug(device)
-        model_config = {
-            "manufacturer_id": DEFAULTS['manufacturer_id'],
-            "category_id": DEFAULTS['category_id'],
-            "fieldset_id": DEFAULTS['fieldset_id']
-        }
-        # Mapping from Claroty xDome (key) to Snipe-IT custom fields (tuple with field name, default value and callable to
-        # transform the value)
-        last_user = clean_user(filter_list_first(device['authentication_user_list'], [device['last_domain_user']]))
-        if not last_user or last_user in DEFAULTS['techs']:
-            last_user = ''
-        asset_config_nonauth = {
-            "status_id": DEFAULTS['status_id_pending'],
-            "model_id": DEFAULTS['model_id'],
-            "_snipeit_last_user_13": last_user,
-            "_snipeit_operating_system_14": device['os_name'],
-            "_snipeit_os_version_15": device['os_version'],
-            "_snipeit_os_build_16": device['os_revision'],
-            "_snipeit_domain_11": (', '.join(filter_list(device['domains']))).replace(".ROCHESTER.EDU", ""),
-        }
-        asset_config_auth = {
-            # "_snipeit_ip_address_5": clean_ip(filter_list_first(device['ip_list']).split("/")[0]),
-            "_snipeit_switches_6": filter_list_first(device["switch_group_name_list"], device["ap_name_list"]),
-            "_snipeit_switch_port_7": ",".join(filter_list(device["switch_port_list"])) + " " + ",".join(filter_list(device["switch_port_description_list"]))
-        }
-        # Apply clean_mac function to device['mac_list']
-        mac_addresses = filter_list([clean_mac(mac) for mac in device['mac_list']])
-        serial_number = clean_tag(device['serial_number'])
-
-        if not mac_addresses and not serial_number:
-            logging.error(
-                f"No valid serial number or MAC address found for {device['device_name']}."
-                f"Cannot uniquely identify asset."
-                f"{device['mac_list']}"
-                f"{device['serial_number']}"
-            )
+
+
+def get_devices():
+    global count
+    offset = 0
+    timeout = 60  # seconds
+
+    while offset <= count:
+        parameters = GetDevicesParameters.from_dict({
+            "filter_by": {
+                "operation": "and",
+                "operands": [
+                    {
+                        "field": "network_list",
+                        "operation": "in",
+                        "value": ["Corporate"]
+                    },
+                    {
+                        "field": "mac_list",
+                        "operation": "is_not_null"
+                    },
+                    {
+                        "field": "retired",
+                        "operation": "in",
+                        "value": [False]
+                    },
+                    {
+                        "field": "mac_oui_list",
+                        "operation": "not_in",
+                        "value": ["Randomized Locally Administered Address"]
+                    },
+                    {
+                        "field": DEFAULTS['first_or_last'],
+                        "operation": "has_any_after_seconds_ago",
+                        "value": DEFAULTS['days'] * 24 * 60 * 60  # 30 days
+                    }
+                ]
+            },
+            "offset": offset,
+            "limit": limit,
+            "fields": fields,
+            "include_count": True,
+
+        })
+        logging.debug(parameters)
+        try:
+            # Get devices
+            api_response = mg_api.get_devices(parameters)
+            if not count:
+                count = api_response.count
+                print(f"Total devices: {count}")
+            offset += limit
+            timeout = 60 # Reset timeout on successful API call
+        except ApiException as e:
+            logging.error("Exception when calling DevicesApi->get_devices: %s\n" % e)
+            sleep(timeout)  # Sleep for 60 seconds before trying again
+            timeout *= 2  # Exponential backoff
             continue
+        except (ValueError, KeyError):
+            logging.error("Error parsing response")
+            continue
+
+        # The fields of the whole page are cleaned at once
+        yield from zip(api_response.devices, normalize_records(api_response.devices, medigate_fields))
+
+
+def process_device(item: tuple):
+    device, record = item
+    logging.debug(device)
+    model_config = {
+        "manufacturer_id": DEFAULTS['manufacturer_id'],
+        "category_id": DEFAULTS['category_id'],
+        "fieldset_id": DEFAULTS['fieldset_id']
+    }
+    # Mapping from Claroty xDome (key) to Snipe-IT custom fields (tuple with field name, default value and callable to
+    # transform the value)
+    last_user = record['last_user']
+    if not last_user or last_user in DEFAULTS['techs']:
+        last_user = ''
+    asset_config_nonauth = {
+        "status_id": DEFAULTS['status_id_pending'],
+        "model_id": DEFAULTS['model_id'],
+        "_snipeit_last_user_13": last_user,
+        "_snipeit_operating_system_14": device['os_name'],
+        "_snipeit_os_version_15": device['os_version'],
+        "_snipeit_os_build_16": device['os_revision'],
+        "_snipeit_domain_11": (', '.join(filter_list(device['domains']))).replace(".ROCHESTER.EDU", ""),
+    }
+    asset_config_auth = {
+        # "_snipeit_ip_address_5": clean_ip(filter_list_first(device['ip_list']).split("/")[0]),
+        "_snipeit_switches_6": filter_list_first(device["switch_group_name_list"], device["ap_name_list"]),
+        "_snipeit_switch_port_7": ",".join(filter_list(device["switch_port_list"])) + " " + ",".join(filter_list(device["switch_port_description_list"]))
+    }
+    mac_addresses = record['mac_addresses']
+    serial_number = record['serial']
+
+    if not mac_addresses and not serial_number:
+        logging.error(
+            f"No valid serial number or MAC address found for {device['device_name']}."
+            f"Cannot uniquely identify asset."
+            f"{device['mac_list']}"
+            f"{device['serial_number']}"
+        )
+        return
+
+    # Remove empty values
+    asset_config_nonauth = {k: v for k, v in asset_config_nonauth.items() if v}
+    asset_config_auth = {k: v for k, v in asset_config_auth.items() if v}
 
-        # Remove empty values
-        asset_config_nonauth = {k: v for k, v in asset_config_nonauth.items() if v}
-        asset_config_auth = {k: v for k, v in asset_config_auth.items() if v}
+    if device['device_category']:
+        fieldset = FieldSets(api=snipe_api, name=device['device_category']).get_by_name().create()
+        model_config['fieldset_id'] = fieldset.id
+    if device['device_subcategory']:
+        category = (Category(api=snipe_api, category_type="asset", name=device['device_subcategory'])
+                    .get_by_name()
+                    .create())
+        model_config['category_id'] = category.id
 
-        if device['device_category']:
-            fieldset = FieldSets(api=snipe_api, name=device['device_category']).get_by_name().create()
-            model_config['fieldset_id'] = fieldset.id
-        if device['device_subcategory']:
-            category = (Category(api=snipe_api, category_type="asset", name=device['device_subcategory'])
+    if device['manufacturer']:
+        manufacturer = (Manufacturers(api=snipe_api, name=device['manufacturer'])
                         .get_by_name()
                         .create())
-            model_config['category_id'] = category.id
+        model_config['manufacturer_id'] = manufacturer.id
 
-        if device['manufacturer']:
-            manufacturer = (Manufacturers(api=snipe_api, name=device['manufacturer'])
-                            .get_by_name()
-                            .create())
-            model_config['manufacturer_id'] = manufacturer.id
+    try:
+        model = Models(api=snipe_api, name=record['model']).get_by_name().populate(model_config).create()
+    except ValueError as e:
+        logging.error(f"Model {device['model']} not found. Skipping.")
+        model = Models(api=snipe_api, name="Unknown").get_by_name()
 
-        try:
-            model = Models(api=snipe_api, name=clean_model(device['model'])).get_by_name().populate(model_config).create()
-        except ValueError as e:
-            logging.error(f"Model {device['model']} not found. Skipping.")
-            model = Models(api=snipe_api, name="Unknown").get_by_name()
-
-        asset_config_nonauth['model_id'] = model.id or DEFAULTS['model_id']
-        assert asset_config_nonauth['model_id'] != 0
-
-        if device['site_name']:
-            locationObject = Locations(api=snipe_api, name=clean_tag(device['site_name'])).get_by_name().create()
-        else:
-            locationObject = defaultLocationObject
-
-        hostname = device['device_name']
-        if not hostname:
-            logging.error(f"No hostname found for device with serial number {serial_number}. Skipping.")
-            continue
+    asset_config_nonauth['model_id'] = model.id or DEFAULTS['model_id']
+    assert asset_config_nonauth['model_id'] != 0
 
-        hostname = hostname.split("\\")
-        hostname = hostname[int(len(hostname) > 1)]
+    if device['site_name']:
+        locationObject = Locations(api=snipe_api, name=record['location']).get_by_name().create()
+    else:
+        locationObject = defaultLocationObject
 
-        # Get canonical name
-        hostname = hostname.split(".")[0].upper()
+    hostname = record['name']
+    if not hostname:
+        logging.error(f"No hostname found for device with serial number {serial_number}. Skipping.")
+        return
 
-        new_hw = (Hardware(api=snipe_api,
-                           serial=serial_number,
-                           name=hostname,
-                           custom_fields=copy.deepcopy(DEFAULTS['custom_fields']))
-                  .populate(asset_config_nonauth)
-                  .get_by_serial()
-                  .get_by_mac(device['mac_list'], remove_bad_vendors=True)
-                  .get_by_asset_tag(device['uid'])
-                  .get_by_name()
-                  .store_state())
+    new_hw = (Hardware(api=snipe_api,
+                       serial=serial_number,
+                       name=hostname,
+                       custom_fields=copy.deepcopy(DEFAULTS['custom_fields']))
+              .populate(asset_config_nonauth)
+              .get_by_serial()
+              .get_by_mac(device['mac_list'], remove_bad_vendors=True)
+              .get_by_asset_tag(device['uid'])
+              .get_by_name()
+              .store_state())
 
-        if new_hw.company_id in DEFAULTS['ignore_companies']:
-            continue
+    if new_hw.company_id in DEFAULTS['ignore_companies']:
+        return
 
-        # Populate all the custom fields
-        new_hw.populate(asset_config_auth).populate_mac(device['mac_list'])
-
-        # Set location if we have a site name, otherwise set to default location
-        new_hw.location_id = locationObject.id
-
-        # Override the OS type only if it is currently set to "Other" or empty
-        if not new_hw.get_custom_field("OS Type") or new_hw.get_custom_field("OS Type") == "Other":
-            if device['os_category'] == "Other":
-                device['os_category'] = get_os_type(device['os_category'])
-            new_hw.set_custom_field("OS Type", device['os_category'])
-
-        # Amend domain
-        old_domain = []
-        if new_hw.get_custom_field("Domain"):
-            old_domain = new_hw.get_custom_field("Domain").split(", ")
-        new_domain = []
-        for domain in device['domains']:
-            if domain:  # Sometimes it is [None]
-                new_domain.append(domain.replace(".ROCHESTER.EDU", ""))
-        new_hw.set_custom_field("Domain", ", ".join(filter_list(new_domain + old_domain)))
-
-        # Move from pending to deployed
-        if 'UR' in new_hw.get_custom_field("Domain") and new_hw.status_id == DEFAULTS['status_id_pending']:
-            new_hw.status_id = DEFAULTS['status_id_deployed']
-
-        # Add the new values to the old values
-        new_hw.set_custom_field("Management", ', '.join(
-            filter_list(new_hw.get_custom_field("Management").split(", ") + device['management_services'])))
-
-        # Call clean_edr on the list
-        device['endpoint_security_names'] = [clean_edr(edr) for edr in device['endpoint_security_names']]
-        new_hw.set_custom_field("EDR", ', '.join(
-            filter_list(new_hw.get_custom_field("EDR").split(", ") + device['endpoint_security_names'])))
-
-        # If we still have an "Unknown" model, then improve the data (hopefully)
-        if device['model'] and new_hw.model_id == DEFAULTS['model_id']:
-            asset_config_auth['model_id'] = model.id
+    # Populate all the custom fields
+    new_hw.populate(asset_config_auth).populate_mac(device['mac_list'])
 
-        try:
-            new_hw.upsert()
-        except ValueError as e:
-            logging.error(f"Error upserting {new_hw.name}: {e}")
+    # Set location if we have a site name, otherwise set to default location
+    new_hw.location_id = locationObject.id
+
+    # Override the OS type only if it is currently set to "Other" or empty
+    if not new_hw.get_custom_field("OS Type") or new_hw.get_custom_field("OS Type") == "Other":
+        if device['os_category'] == "Other":
+            device['os_category'] = get_os_type(device['os_category'])
+        new_hw.set_custom_field("OS Type", device['os_category'])
+
+    # Amend domain, sometimes it is [None]
+    new_hw.merge_custom_field("Domain", [domain.replace(".ROCHESTER.EDU", "") for domain in device['domains']
+                                         if domain])
+
+    # Move from pending to deployed
+    if 'UR' in new_hw.get_custom_field("Domain") and new_hw.status_id == DEFAULTS['status_id_pending']:
+        new_hw.status_id = DEFAULTS['status_id_deployed']
+
+    # Add the new values to the old values
+    new_hw.merge_custom_field("Management", device['management_services'])
+
+    # Call clean_edr on the list
+    device['endpoint_security_names'] = [clean_edr(edr) for edr in device['endpoint_security_names']]
+    new_hw.merge_custom_field("EDR", device['endpoint_security_names'])
+
+    # If we still have an "Unknown" model, then improve the data (hopefully)
+    if device['model'] and new_hw.model_id == DEFAULTS['model_id']:
+        asset_config_auth['model_id'] = model.id
+
+    try:
+        new_hw.upsert()
+    except ValueError as e:
+        logging.error(f"Error upserting {new_hw.name}: {e}")
+
+
+# The next page is fetched while the devices of this one are written to Snipe-IT
+pipeline = Pipeline([Stage('upsert', process_device)], progress=lambda done: print_progress(done, count))
+pipeline.run(get_devices())
+if pipeline.failed:
+    raise SystemExit(f"{pipeline.failed} of {count} devices failed")
@@ -8,11 +8,12 @@ from requests import get
 from requests.auth import HTTPBasicAuth
 import logging
 from configparser import RawConfigParser
-from snipeit_api.helpers import clean_manufacturer, clean_mac, clean_tag, clean_os
+from snipeit_api.helpers import clean_manufacturer, clean_mac, clean_tag, clean_os, setup_manufacturer_rules
 
 CONFIG = RawConfigParser()
 logging.debug("Checking for a settings.conf ...")
 CONFIG.read("settings.conf")
+setup_manufacturer_rules(CONFIG)
 # Get the ORDR API key from CONFIG
 ordr_username = CONFIG.get('ordr', 'username')
 ordr_password = CONFIG.get('ordr', 'password')
@@ -1,9 +1,42 @@
 #!/usr/bin/env python3
+# Sets the Department and Lab custom fields of all hardware from its Org. Unit, see ou_dept.csv
+import html
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from configparser import RawConfigParser
+from time import perf_counter
+
 from snipeit_api.api import SnipeITApi
 from snipeit_api.helpers import get_dept_from_ou, get_lab_from_ou
-from snipeit_api.models import Hardware
+
+
+def reconcile(row: dict) -> tuple[str, dict]:
+    """
+    @param row: A row from the hardware endpoint
+    @return: The OU of the asset and the custom fields (DB column -> value) that need to change
+    """
+    custom_fields = row.get('custom_fields') or {}
+    ou = html.unescape((custom_fields.get('Org. Unit') or {}).get('value') or '')
+    if not ou:
+        return ou, {}
+    payload = {}
+    for name, value in (('Department', get_dept_from_ou(ou)), ('Lab', get_lab_from_ou(ou))):
+        custom_field = custom_fields.get(name)
+        # Not in the fieldset of this model
+        if not custom_field:
+            continue
+        if html.unescape(custom_field.get('value') or '') != value:
+            payload[custom_field['field']] = value
+    return ou, payload
+
+
+def patch(snipe_api: SnipeITApi, asset_id: int, name: str, payload: dict) -> bool:
+    data = snipe_api.call(f"hardware/{asset_id}", method="PATCH", payload=payload)
+    if data.get('status') != "success":
+        logging.error(f"Failed to update {name}: {data}")
+        return False
+    logging.info(f"Updated {name}")
+    return True
 
 
 def main():
@@ -14,36 +47,49 @@ def main():
     config.read("settings.conf")
     snipeit_apiurl = config.get('snipe-it', 'url')
     snipeit_apikey = config.get('snipe-it', 'apikey')
+    writers = config.getint('ou2dept', 'writers', fallback=4)
     snipeapi = SnipeITApi(snipeit_apiurl, snipeit_apikey)
-    offset = 0
-    limit = 300
-    total = 0
+
     missing_ou = set()
-    while offset <= total:
-        pages = snipeapi.call(f'hardware?limit={limit}&offset={offset}', method='GET')
-        offset += limit
-
-        total = pages['total']
-        for asset in pages['rows']:
-            ou = asset['custom_fields']['Org. Unit']['value']
-            if not ou:
-                continue
-            dept_name = get_dept_from_ou(ou)
-            lab_name = get_lab_from_ou(ou)
-            if not dept_name:
+    scanned = 0
+    updated = 0
+    failed = 0
+    start = perf_counter()
+    pending: set[Future] = set()
+
+    def collect(done: set[Future]):
+        nonlocal updated, failed
+        for future in done:
+            try:
+                ok = future.result()
+            except Exception as e:
+                logging.error(f"Failed to update: {e}")
+                ok = False
+            if ok:
+                updated += 1
+            else:
+                failed += 1
+
+    # Reading the pages and writing the changes overlap, at most a few PATCHes per writer are queued
+    with ThreadPoolExecutor(max_workers=writers) as executor:
+        for asset in snipeapi.iter_rows('hardware', {'sort': 'id', 'order': 'asc'}):
+            scanned += 1
+            ou, payload = reconcile(asset)
+            if ou and not get_dept_from_ou(ou):
                 missing_ou.add(ou)
-            if (asset['custom_fields']['Department']['value'] != dept_name or
-                    lab_name != asset['custom_fields']['Lab']['value']):
-                snipe_obj = Hardware(api=snipeapi).get_by_id(asset['id'])
-                (snipe_obj.get_by_id()
-                 .store_state()
-                 .set_custom_field('Department', dept_name)
-                 .set_custom_field('Lab', lab_name))
-                snipe_obj.upsert()
-                logging.info(f"Updating {asset['name']}")
-
-    logging.info(f"Missing OUs:")
-    for ou in missing_ou:
+            if not payload:
+                continue
+            if len(pending) >= writers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(patch, snipeapi, asset['id'], asset['name'], payload))
+        collect(wait(pending).done)
+
+    elapsed = perf_counter() - start
+    logging.info(f"Read {scanned} assets in {elapsed:.1f}s ({scanned / elapsed if elapsed else 0:,.0f}/s), "
+                 f"updated {updated}, failed {failed}")
+    logging.info(f"Missing OUs: {len(missing_ou)}")
+    for ou in sorted(missing_ou):
         logging.info(ou)
 
 
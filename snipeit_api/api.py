@@ -3,10 +3,12 @@ from __future__ import annotations
 import logging
 from http.client import RemoteDisconnected
 from sys import exit
+from threading import Lock
 from datetime import timedelta
 from time import sleep
-from typing import Any
+from typing import Any, Iterator
 from requests.exceptions import ConnectionError
+from requests import Session
 from requests_cache import CachedSession
 
 session = CachedSession(
@@ -16,6 +18,10 @@ session = CachedSession(
     allowable_codes=[200],  # Cache only successful responses
     allowable_methods=['GET']  # Cache only GET requests
 )
+# For responses that are read once (e.g. pages of a full scan), keeping them only costs memory
+uncached_session = Session()
+# Expiring walks the whole cache, do not let threads that write at the same time trip over each other
+CACHE_LOCK = Lock()
 
 
 class SnipeApiError(Exception):
@@ -76,11 +82,33 @@ class SnipeITApi:
 
         return response
 
-    def call(self, endpoint: str, payload: Any = None, method: str = "GET") -> Any:
+    def iter_rows(self, endpoint: str, payload: dict = None, page_size: int = 0) -> Iterator[dict]:
+        """
+        Page through an endpoint without holding more than one page in memory
+        @param endpoint: Which API endpoint to use (eg. hardware)
+        @param payload: Additional query parameters (eg. sort, order)
+        @param page_size: Rows per page, defaults to the page size of this API
+        @return: The rows, one at a time
+        """
+        limit = page_size or self.page_size
+        offset = 0
+        total = 1
+        while offset < total:
+            response = self.call(endpoint, payload=(payload or {}) | {'limit': limit, 'offset': offset}, cache=False)
+            if 'total' not in response:
+                raise SnipeApiError("Invalid response from Snipe-IT", response)
+            total = response['total']
+            if not response['rows']:
+                break
+            offset += len(response['rows'])
+            yield from response['rows']
+
+    def call(self, endpoint: str, payload: Any = None, method: str = "GET", cache: bool = True) -> Any:
         """
         @param endpoint: Which API endpoint to use (eg. devices)
         @param payload: Values to send to Snipe-IT
         @param method: GET, POST, PATCH, DELETE
+        @param cache: Whether a GET response may be cached
         @return: Response object from Snipe-IT or raises HTTPError
         """
         logging.debug(f"Calling Snipe-IT API: {endpoint}")
@@ -91,23 +119,25 @@ class SnipeITApi:
             self._expire_cache(api_url)
 
         # Snipe-IT API does not understand JSON with GET requests
+        json_payload = payload
         if method == "GET" and payload:
             api_url = self._build_get_url(api_url, payload)
-            payload = None
+            json_payload = None
 
         logging.debug(f"Calling Snipe-IT URL: {api_url}")
 
         try:
-            response = session.request(method, api_url, auth=None, headers=self.headers, json=payload,
-                                       verify=self.verify_tls)
+            response = (session if cache else uncached_session).request(method, api_url, auth=None,
+                                                                        headers=self.headers, json=json_payload,
+                                                                        verify=self.verify_tls)
         except ConnectionError:
-            return self._handle_connection_error(endpoint, payload, method)
+            return self._handle_connection_error(endpoint, payload, method, cache)
 
         if 200 <= response.status_code < 300:
             self._reset_backoff()
             return response.json()
 
-        return self._handle_connection_error(endpoint, payload, method)
+        return self._handle_connection_error(endpoint, payload, method, cache)
 
     def _map_endpoint(self, endpoint: str) -> str:
         endpoint_map = {
@@ -121,14 +151,15 @@ class SnipeITApi:
         return endpoint
 
     def _expire_cache(self, api_url: str) -> None:
-        expiring_urls = list(filter(lambda x: x.startswith(api_url), session.cache.urls()))
-        session.cache.delete(urls=expiring_urls)
+        with CACHE_LOCK:
+            expiring_urls = list(filter(lambda x: x.startswith(api_url), session.cache.urls()))
+            session.cache.delete(urls=expiring_urls)
 
     def _build_get_url(self, api_url: str, payload: dict) -> str:
         api_url += "?" + "&".join(f"{key}={value}" for key, value in payload.items())
         return api_url
 
-    def _handle_connection_error(self, endpoint: str, payload: Any, method: str) -> Any:
+    def _handle_connection_error(self, endpoint: str, payload: Any, method: str, cache: bool = True) -> Any:
         if self.snipe_backoff > 5:
             logging.error(f"Connection error persists, with {method} to {endpoint} exiting")
             logging.debug(payload)
@@ -138,9 +169,9 @@ class SnipeITApi:
         sleep(self.snipe_backoff_seconds * self.snipe_backoff)
         logging.error(f"Retrying {method} to {endpoint}")
         try:
-            return self.call(endpoint, payload, method)
+            return self.call(endpoint, payload, method, cache)
         except ConnectionError:
-            return self._handle_connection_error(endpoint, payload, method)
+            return self._handle_connection_error(endpoint, payload, method, cache)
 
     def _reset_backoff(self) -> None:
         if self.snipe_backoff > 0:
@@ -4,19 +4,36 @@ import logging
 import re
 import smtplib
 from configparser import RawConfigParser
-from csv import reader
 from datetime import date, timedelta, datetime
 from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from functools import lru_cache
 from os import path
 
-from typing import Any
+from typing import Any, Callable, Iterable
 from json import dumps as json_stringify
 
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
+from snipeit_api.manufacturers import MANUFACTURER_RULES, load_rules
+from snipeit_api.oui import FLAG_DONGLE, FLAG_PRIVATE, mac_flags, normalize_mac
+# These moved to their own modules, still importable from here
+from snipeit_api.operating_systems import clean_os, get_os_type, validate_os
+from snipeit_api.org_units import get_dept_from_ou, get_depts, get_lab_from_ou, get_labs
+from snipeit_api.validation import clean_ip, validate_hostname
+
+__all__ = [
+    'INVALID_TAGS', 'INVALID_USERS', 'clean_column', 'clean_edr', 'clean_mac', 'clean_mac_lists', 'clean_macs',
+    'clean_manufacturer', 'clean_model', 'clean_tag', 'clean_tags', 'clean_user', 'clean_users', 'convert_to_bool',
+    'filter_list', 'filter_list_first', 'filter_list_str', 'load_manufacturer_rules', 'parse_isoformat',
+    'print_progress', 'query_apple_warranty', 'send_email', 'setup_logging', 'setup_manufacturer_rules',
+    'validate_category',
+    # Re-exported from operating_systems, org_units and validation
+    'clean_os', 'get_os_type', 'validate_os', 'get_dept_from_ou', 'get_depts', 'get_lab_from_ou', 'get_labs',
+    'clean_ip', 'validate_hostname',
+]
 
 
 def clean_edr(value: Any) -> str:
@@ -64,60 +81,64 @@ def clean_edr(value: Any) -> str:
     return ''
 
 
-def clean_tag(value: Any) -> str:
-    if not value:
-        return ''
-    # + does weird things, % is a wildcard, so it becomes hard to search for something with it
-    # " and ' are used to delimit strings and can cause havoc
-    value = str(value).replace('+', '').replace('%', '').replace('"', '').replace("'", '').strip()
-    value = value.replace("&amp;", "and").replace("&", "and")  # Snipe-IT cannot search for & in names
+# Strings vendors put in asset tag/serial/name fields when there is nothing useful there
+INVALID_TAGS = frozenset([
+    "not available",
+    "default string",
+    "not specified",
+    "null",
+    "none",
+    "empty",
+    "unknown",
+    # What vendor does this (SuperMicro)?
+    "main board",
+    "0000000000",
+    "______________",  # NEC
+    "123-1234-123",
+    "..................",
+    # LG Gram does this
+    "type3serialnumber",
+    # Siemens Simatic PLCs
+    "simatic",
+    # Mostly SuperMicro
+    "system product name",
+    "system manufacturer",
+    "no asset tag",
+    "chassis serial number",
+    "undefined serial number",
+    "chassis asset tag",
+    # Azure VMs all have the same asset tag/serial numbers
+    # https://learn.microsoft.com/en-us/azure/automation/troubleshoot/update-agent-issues-linux
+    "7783-7084-3265-9085-8269-3286-77",
+    # More vendor shenanigans
+    "varian",
+    "tangent197",
+    "isd_pcs",
+    # WTF Dell
+    "unidentified system",
+    "cbx3___",
+    "n/a",
+])
+# Spaces are intentional to make sure we don't match on partial words
+INVALID_TAG_SUBSTRING = re.compile(r'to be filled|system |123456789')
+# + does weird things, % is a wildcard, so it becomes hard to search for something with it
+# " and ' are used to delimit strings and can cause havoc
+TAG_DELETE = str.maketrans('', '', '+%"\'')
+
+
+@lru_cache(maxsize=65536)
+def _clean_tag(value: str) -> str:
+    value = value.translate(TAG_DELETE).strip()
+    if "&" in value:
+        value = value.replace("&amp;", "and").replace("&", "and")  # Snipe-IT cannot search for & in names
 
     value_lower = value.lower()
 
-    invalid = ["not available",
-               "default string",
-               "not specified",
-               "null",
-               "none",
-               "empty",
-               "unknown",
-               # What vendor does this (SuperMicro)?
-               "main board",
-               "0000000000",
-               "______________",  # NEC
-               "123-1234-123",
-               "..................",
-               # LG Gram does this
-               "type3serialnumber",
-               # Siemens Simatic PLCs
-               "simatic",
-               # Mostly SuperMicro
-               "system product name",
-               "system manufacturer",
-               "no asset tag",
-               "chassis serial number",
-               "undefined serial number",
-               "chassis asset tag",
-               # Azure VMs all have the same asset tag/serial numbers
-               # https://learn.microsoft.com/en-us/azure/automation/troubleshoot/update-agent-issues-linux
-               "7783-7084-3265-9085-8269-3286-77",
-               # More vendor shenanigans
-               "varian",
-               "tangent197",
-               "isd_pcs",
-               # WTF Dell
-               "unidentified system",
-               "cbx3___",
-               "n/a"]
-
     # Len < 3 also eliminates, 0, na and a few other strings that are not useful
-    if not value_lower or len(value_lower) < 3 or value_lower in invalid:
+    if len(value_lower) < 3 or value_lower in INVALID_TAGS:
         return ''
 
-    # Spaces are intentional to make sure we don't match on partial words
-    if ('to be filled' in value_lower or
-            'system ' in value_lower or
-            '123456789' in value_lower or
+    if (INVALID_TAG_SUBSTRING.search(value_lower) or
             # apparently all Bosch camera systems have the same serial/asset tag...
             value_lower.startswith('dip-')):
         return ''
@@ -125,8 +146,37 @@ def clean_tag(value: Any) -> str:
     if 'series' in value_lower:
         value = value.split('series')[0]
 
-    # logging.debug(f"Clean tag: {value}")
-    return str(value).strip()
+    return value.strip()
+
+
+def clean_tag(value: Any) -> str:
+    if not value:
+        return ''
+    return _clean_tag(str(value))
+
+
+def clean_column(values: Iterable[Any], cleaner: Callable[[Any], Any]) -> list[Any]:
+    """
+    Clean a whole column of source data, every distinct value is cleaned once
+    :param values: The raw values
+    :param cleaner: e.g. clean_tag
+    :return: The cleaned values, in the same order
+    """
+    values = list(values)
+    try:
+        distinct = dict.fromkeys(values)
+    except TypeError:
+        # Unhashable, e.g. lists
+        return [cleaner(value) for value in values]
+    cleaned = dict(zip(distinct, map(cleaner, distinct)))
+    return list(map(cleaned.__getitem__, values))
+
+
+def clean_tags(values: Iterable[Any]) -> list[str]:
+    # Every distinct value is cleaned once already, going through the clean_tag cache would only churn it
+    uncached = _clean_tag.__wrapped__
+    return clean_column(values, lambda value: uncached(str(value)) if value else '')
+
 
 def clean_model(model: str) -> str:
     model = clean_tag(model)
@@ -134,312 +184,103 @@ def clean_model(model: str) -> str:
         return 'Unknown'
     return model
 
+@lru_cache(maxsize=4096)
+def _normalize_manufacturer(manufacturer: str) -> str:
+    return MANUFACTURER_RULES.match(manufacturer.lower().strip()) or clean_tag(manufacturer)
+
+
 def clean_manufacturer(manufacturer: str):
     if not manufacturer:
         return ''
+    # See manufacturers.json for the rules
+    return _normalize_manufacturer(str(manufacturer))
 
-    manufacturer_lower = str(manufacturer).lower().strip()
-    if manufacturer_lower.startswith('apple'):
-        return 'Apple'
-    elif manufacturer_lower.startswith('dell') or manufacturer_lower.endswith('ell inc.'):
-        return 'Dell Inc.'
-    elif manufacturer_lower.startswith('aaeon'):
-        return 'AAEON Technology Inc.'
-    elif manufacturer_lower.startswith('apc'):
-        return 'APC'
-    elif manufacturer_lower.startswith('alaris') or manufacturer_lower == 'becton dickinson':
-        return 'BD'
-    elif manufacturer_lower.startswith('asix'):
-        return 'ASIX Electronics Corporation'
-    elif manufacturer_lower.startswith('advansus'):
-        return 'Advansus Corp.'
-    elif manufacturer_lower.startswith('advantech'):
-        return 'Advantech Co., Ltd.'
-    elif manufacturer_lower.startswith('andover'):
-        return 'Andover Controls Corporation'
-    elif manufacturer_lower.startswith('armorlin'):
-        return 'Armorlink Co., Ltd.'
-    elif manufacturer_lower.startswith('asrock'):
-        return 'ASRock Incorporation'
-    elif manufacturer_lower.startswith('axiom'):
-        return 'Axiom Technology Co., Ltd.'
-    elif manufacturer_lower.startswith('asus'):
-        return 'ASUSTeK Computer Inc.'
-    elif manufacturer_lower.startswith('azurewav'):
-        return 'AzureWave Technologies, Inc.'
-    elif manufacturer_lower.startswith('b&r'):
-        return 'BR Industrial Automation'
-    elif manufacturer_lower.startswith('belkin'):
-        return 'Belkin International Inc.'
-    elif manufacturer_lower.startswith('bizlink'):
-        return 'BizLink (Kunshan) Co.,Ltd'
-    elif manufacturer_lower.startswith('brady'):
-        return 'Brady Corporation'
-    elif manufacturer_lower.startswith('broadcom'):
-        return 'Broadcom Inc.'
-    elif manufacturer_lower.startswith('buffalo'):
-        return 'Buffalo Inc.'
-    elif manufacturer_lower.startswith('ce') and 'link' in manufacturer_lower:
-        return 'Ce Link Limited'
-    elif manufacturer_lower.startswith('chongqin'):
-        return 'Chongqing Fugui Electronics Co.,Ltd.'
-    elif manufacturer_lower.startswith('cisco'):
-        return 'Cisco Systems, Inc.'
-    elif manufacturer_lower.startswith('cloud') and 'net' in manufacturer_lower:
-        return 'Cloud Network Technology (Samoa) Limited'
-    elif manufacturer_lower.startswith('cyberpow'):
-        return 'Cyber Power Systems, Inc.'
-    elif manufacturer_lower.startswith('cybernet'):
-        return 'Cybernet Manufacturing Inc.'
-    elif manufacturer_lower.startswith('dfi'):
-        return 'DFI Inc.'
-    elif manufacturer_lower.startswith('flytech'):
-        return 'Flytech Technology Co., Ltd.'
-    elif manufacturer_lower.startswith('fujitsu'):
-        return 'Fujitsu'
-    # Do not match on GETAC
-    elif manufacturer_lower == 'ge' or 'general elec' in manufacturer_lower:
-        return 'GE'
-    elif manufacturer_lower.startswith('gigabyte') or manufacturer_lower.startswith('giga-byte'):
-        return 'Gigabyte Technology Co., Ltd.'
-    elif manufacturer_lower.startswith('gigamon'):
-        return 'Gigamon Systems LLC'
-    elif manufacturer_lower.startswith('good') and 'way' in manufacturer_lower:
-        return 'Good Way Technology Co., Ltd.'
-    # Do HPE before HP
-    elif (manufacturer_lower.startswith('hpe') or
-          ('hewlett' in manufacturer_lower and 'enterprise' in manufacturer_lower)):
-        return "Hewlett Packard Enterprise"
-    elif manufacturer_lower.startswith('hp') or manufacturer_lower.startswith('hewlett'):
-        return 'Hewlett-Packard'
-    elif manufacturer_lower.startswith('hitachi'):
-        return 'Hitachi'
-    elif manufacturer_lower.startswith('huizhou') and 'd' in manufacturer_lower:
-        return 'Huizhou Dehong Technology Co., Ltd.'
-    elif manufacturer_lower.startswith('hon') and 'hai' in manufacturer_lower:
-        return 'Hon Hai Precision Ind. Co.,Ltd.'
-    elif manufacturer_lower.startswith('intel'):
-        return 'Intel Corporation'
-    elif manufacturer_lower.startswith('ibm'):
-        return 'IBM'
-    elif manufacturer_lower.startswith('juniper'):
-        return 'Juniper'
-    elif manufacturer_lower.startswith('jump') and 'indu' in manufacturer_lower:
-        return 'JUMPtec Industrielle Computertechnik AG'
-    elif manufacturer_lower.startswith('jetway') and 'in' in manufacturer_lower:
-        return 'Jetway Information Co., Ltd.'
-    elif manufacturer_lower.startswith('kcodes'):
-        return 'KCodes Corporation'
-    elif manufacturer_lower.startswith('lcfc'):
-        return 'LCFC(HeFei) Electronics Technology Co., Ltd.'
-    elif manufacturer_lower.startswith('lenovo'):
-        return 'Lenovo'
-    elif manufacturer_lower.startswith('luxshare'):
-        return 'Luxshare Precision Industry Co., Ltd.'
-    elif manufacturer_lower.startswith('liteon'):
-        return 'Liteon Technology Corporation'
-    elif manufacturer_lower.startswith('lg'):
-        return 'LG Electronics'
-    elif manufacturer_lower.startswith('micro-star'):
-        return 'Micro-Star International Co., Ltd.'
-    elif manufacturer_lower.startswith('microsof'):
-        return 'Microsoft Corporation'
-    elif manufacturer_lower.startswith('mitac'):
-        return 'Mitac International Corp.'
-    elif manufacturer_lower.startswith('nec'):
-        return 'NEC Corporation'
-    elif manufacturer_lower.startswith('oracle'):
-        return 'Oracle Corporation'
-    elif manufacturer_lower.startswith('parallels'):
-        return 'Parallels Software International Inc.'
-    elif manufacturer_lower.startswith('pc') and 'partne' in manufacturer_lower:
-        return 'PC Partner Ltd.'
-    elif manufacturer_lower.startswith('palo alto'):
-        return 'Palo Alto Networks'
-    elif manufacturer_lower.startswith('panasonic'):
-        return 'Panasonic'
-    elif manufacturer_lower.startswith('pioneer'):
-        return 'Pioneer'
-    elif manufacturer_lower.startswith('realtek'):
-        return 'Realtek Semiconductor Corp.'
-    elif 'schneider electric' in manufacturer_lower:
-        return 'Schneider Electric'
-    elif manufacturer_lower.startswith('siemens'):
-        return 'Siemens AG'
-    elif manufacturer_lower.startswith('samsung'):
-        return 'Samsung'
-    elif manufacturer_lower.startswith('summit'):
-        return 'Summit Data Communications'
-    elif manufacturer_lower.startswith('sony'):
-        return 'Sony Corporation'
-    elif manufacturer_lower.startswith('super') and 'micro' in manufacturer_lower:
-        return 'Super Micro Computer, Inc.'
-    elif manufacturer_lower.startswith('tangent'):
-        return 'Tangent, Inc.'
-    elif manufacturer_lower.startswith('toshiba'):
-        return 'Toshiba Corporation'
-    elif manufacturer_lower.startswith('texas') and 'ins' in manufacturer_lower:
-        return 'Texas Instruments'
-    elif manufacturer_lower.startswith('tyan'):
-        return 'Tyan Computer Corp.'
-    elif manufacturer_lower.startswith('vmware'):
-        return 'VMware, Inc.'
-    elif manufacturer_lower.startswith('variscit'):
-        return 'Variscite LTD'
-    elif manufacturer_lower.startswith('wistron'):
-        return 'Wistron Corporation'
-    elif manufacturer_lower.startswith('zebra'):
-        return 'Zebra Technologies Inc.'
-    elif manufacturer_lower.startswith('congatec'):
-        return 'congatec AG'
-    elif manufacturer_lower.startswith('3s') and ('system' in manufacturer_lower or 'vision' in manufacturer_lower):
-        return '3S System Tech Inc.'
-    elif manufacturer_lower.startswith('speed') and 'dra' in manufacturer_lower:
-        return 'Speed Dragon Multimedia Limited'
-
-    return clean_tag(manufacturer)
+
+def load_manufacturer_rules(file_path: str, prepend: bool = True):
+    """
+    Add site specific manufacturer rules from a JSON file in the same format as manufacturers.json
+    :param file_path: Path to the JSON file
+    :param prepend: Whether the new rules take precedence over the built-in ones
+    """
+    MANUFACTURER_RULES.extend(load_rules(file_path), prepend=prepend)
+    _normalize_manufacturer.cache_clear()
 
 
-def clean_mac(mac_address: str, remove_bad_vendors: bool = True) -> str:
+def setup_manufacturer_rules(config: RawConfigParser):
+    """
+    Load the site specific manufacturer rules named by manufacturer_rules in the [snipe-it] section, if any.
+    :param config: RawConfigParser object
+    """
+    file_path = config.get('snipe-it', 'manufacturer_rules', fallback='')
+    if file_path:
+        load_manufacturer_rules(file_path)
+        logging.debug(f"Loaded manufacturer rules from {file_path}")
+
+
+@lru_cache(maxsize=65536)
+def _clean_mac(mac_address: str, remove_bad_vendors: bool) -> str:
+    # Remove everything that is not a hex character, make it uppercase, '' if it is not a MAC
+    mac_address = normalize_mac(mac_address)
     if not mac_address:
         return ''
-    # Remove everything that is not a hex character, make it uppercase
-    mac_address = ''.join(c for c in mac_address.upper() if c in '0123456789ABCDEF')
-    # Invalid MAC
-    if not mac_address or len(mac_address) != 12:
-        return ''
+
+    # Private and dongle prefixes, see snipeit_api/oui.py
+    flags = mac_flags(mac_address)
 
     # Random MAC addresses x2, x6, xA, xE are reserved for local use
     # This catches Microsoft Loopback, VirtualBox, GlobalProtect and Apple Private addresses
-    if mac_address[1] in ['2', '6', 'A', 'E'] and not (
-            mac_address[:5] in DEFAULTS['valid_private_mac'] or
-            mac_address[:6] in DEFAULTS['valid_private_mac'] or
-            mac_address[:7] in DEFAULTS['valid_private_mac'] or
-            mac_address[:8] in DEFAULTS['valid_private_mac']
-    ):
+    if mac_address[1] in '26AE' and not flags & FLAG_PRIVATE:
         return ''
 
     if mac_address == '000000000000' or mac_address == 'FFFFFFFFFFFF':
         return ''
 
-    # Bad MAC addresses, typically due to being USB dongles
-    # 000000 -> Xerox (not invalid)
-    # 0A:00:27:00:00:00 -> VirtualBox
-    bad_prefix = [
-        # HyperV network adapters, haven't noticed duplicates yet
-        # '00155D',
-        # VMWare network adapters, no duplicates on server products yet
-        # '005056',
-        # This one seems to be VMware desktop products which are consecutively assigned
-        '005056C0',
-        # Belkin (USB network adapters)
-        '00173F', '001CDF', '002275', '08863B', '149182', '24F5A2', '302303', '58EF68',
-        '6038E0', '80691A', '94103E', '944452', 'B4750E', 'C05627', 'C4411E', 'D8EC5E',
-        'E89F80', 'EC1A59',
-        '001150', '0030BD',
-        # CE Link (USB network adapters)
-        '6C6E07', '70B3D554', 'A0CEC8',
-        # Cable Matters (USB network adapters)
-        'F44DAD', '5C857E30', '70886B80',
-        # Cisco AnyConnect
-        '00059A3C7A00', '00059A3C7800',
-        # Apple USB dongles
-        '5CF7E68B',
-        'AC7F3EE6DDE5',
-        # Microsoft USB dongles?
-        'F01DBCF2',
-        # ASIX USB dongles
-        'F8E43B',
-        # BizLink (Kunshan) USB dongles
-        '9CEBE8',
-        # Speed Dragon Multimedia USB dongle
-        '00133B',
-        # AuKey (Dongguan Kingtron Electronics Tech Co., Ltd) USB dongles
-        '98FC84E',
-        '34298F7',
-        #  Wistron Infocomm (Zhongshan) Corporation dongle
-        '98EECBB21088',
-        # OmniKey RFID dongle virtual MAC
-        # These are serially generated (00, 01, ...) and not unique
-        '00189E',
-        # Realtek USB dongles
-        '00E04C'
-        # Cisco-Linksys dongles
-        'C8D719C3426D',
-        # Dell USB dongle
-        '509A4C1B0BC4',
-        '605B3021',
-        'C025A5ED7191',
-        '3C2C30F82A34',
-        # Luxshare Precision Industry Company Limited
-        '3C18A0',
-        # Tp-Link Technologies Co.,Ltd.
-        '984827',
-        '34E894',
-        # Shenzen Cudy Technology Co., Ltd.
-        'B44BD62',
-        # Shenzhen Century Xinyang Technology Co., Ltd
-        '90DE80',
-        # Good Way Ind. Co., Ltd.
-        "0050B6",
-        # TRENDnet, Inc.
-        "782D7E",
-        # Wistron InfoComm(Kunshan)Co.,Ltd. - Lenovo Docking Stations
-        "54EE75",
-        # Hon Hai Precision Ind. Co.,Ltd.
-        "FC017C"
-    ]
-    # :11 is /28
-    if remove_bad_vendors and (mac_address in bad_prefix or
-                               mac_address[:8] in bad_prefix or
-                               mac_address[:7] in bad_prefix or
-                               mac_address[:6] in bad_prefix or
-                               mac_address[:5] in bad_prefix):
+    if remove_bad_vendors and flags & FLAG_DONGLE:
         return ''
 
     # Add colons
-    mac_address = ':'.join(mac_address[i:i + 2] for i in range(0, 12, 2))
+    return (f"{mac_address[0:2]}:{mac_address[2:4]}:{mac_address[4:6]}:"
+            f"{mac_address[6:8]}:{mac_address[8:10]}:{mac_address[10:12]}")
 
-    return mac_address
 
-
-def clean_os(operating_system: str) -> str:
-    if operating_system == 'Red Hat':
-        return "RedHat"
-    if "Monterey" in operating_system:
-        return "macOS"
-    if operating_system.startswith("Mac OS 10"):
-        return "Mac OS X"
-    if operating_system.startswith("Microsoft "):
-        return operating_system[10:]
-    return operating_system
+def clean_mac(mac_address: str, remove_bad_vendors: bool = True) -> str:
+    if not mac_address:
+        return ''
+    return _clean_mac(mac_address, remove_bad_vendors)
 
 
-def clean_ip(ip: Any) -> str | None:
-    # Validate this is an IPv4 address
-    if not ip:
-        return None
-    ip = str(ip).strip()
-    try:
-        ip = ip.split(".")
-        if len(ip) != 4:
-            return None
-        for octet in ip:
-            octet = int(octet)
-            if octet < 1 or octet > 254:
-                return None
-    except ValueError:
-        return None
+def clean_macs(mac_addresses: Iterable[str], remove_bad_vendors: bool = True) -> list[str]:
+    """
+    Clean a whole list of MAC addresses (a device, a page...) at once
+    :return: The valid MAC addresses, without duplicates and sorted, like filter_list
+    """
+    cleaned = {_clean_mac(mac, remove_bad_vendors) for mac in set(mac_addresses) if mac}
+    cleaned.discard('')
+    return sorted(cleaned)
 
-    # Check if this is a bogus IP address
-    if int(ip[0]) in [127, 255]:
-        return None
-    if int(ip[0]) == 169 and int(ip[1]) == 254:
-        return None
-    if int(ip[0]) in range(224, 239):
-        return None
 
-    return ".".join(ip)
+def clean_mac_lists(mac_lists: Iterable[Iterable[str] | None],
+                    remove_bad_vendors: bool = True) -> list[tuple[str, ...]]:
+    """
+    clean_macs for a whole column of MAC address lists (one per device), every distinct address is cleaned once
+    :return: The cleaned lists, as tuples so records can share them
+    """
+    mac_lists = [tuple(macs) if macs else () for macs in mac_lists]
+    uncached = _clean_mac.__wrapped__
+    distinct = {mac for macs in mac_lists for mac in macs if mac}
+    cleaned = {mac: uncached(mac, remove_bad_vendors) for mac in distinct}
+    cleaned[''] = ''
+    result = []
+    for macs in mac_lists:
+        if len(macs) == 1:
+            # Most devices only report one address
+            mac = cleaned[macs[0] or '']
+            result.append((mac,) if mac else ())
+            continue
+        valid = {cleaned[mac or ''] for mac in macs}
+        valid.discard('')
+        result.append(tuple(sorted(valid)))
+    return result
 
 
 def filter_list(value: list[Any]) -> list[Any]:
@@ -461,21 +302,26 @@ def filter_list_first(*values: list[Any]) -> Any:
             return value[0]
     return None
 
-def clean_user(user: str) -> str:
-    invalid = ["not available",
-               "default string",
-               "not specified",
-               "null",
-               "none",
-               "empty",
-               "unknown",
-               "root",
-               "system"]
-    # Make sure user is str
-    user = str(user).strip().lower()
-    if not user or user in invalid:
+INVALID_USERS = frozenset([
+    "not available",
+    "default string",
+    "not specified",
+    "null",
+    "none",
+    "empty",
+    "unknown",
+    "root",
+    "system",
+])
+SERVICE_USER = re.compile(r'scanner|admin')
+
+
+@lru_cache(maxsize=65536)
+def _clean_user(user: str) -> str:
+    user = user.strip().lower()
+    if not user or user in INVALID_USERS:
         return ''
-    if "scanner" in user or "admin" in user:
+    if SERVICE_USER.search(user):
         return ''
     # If @ in user or \\ in user, strip domain
     if "@" in user:
@@ -486,55 +332,13 @@ def clean_user(user: str) -> str:
     return user
 
 
-def get_os_type(operating_system: str) -> str:
-    os = operating_system.lower()
-    if "windows" in os:
-        return "Windows"
-    if ("linux" in os or
-            "ubuntu" in os or
-            "debian" in os or
-            "redhat" in os or
-            "red hat" in os or
-            "centos" in os or
-            "fedora" in os or
-            "suse" in os or
-            "alma" in os or
-            "rhel" in os or
-            "centos" in os or
-            "evolution" in os):
-        return "Linux"
-    if ("mac" in os or
-            "android" in os or
-            os == "ios" or
-            "tvos" in os or
-            "watchos" in os or
-            "bsd" in os or
-            "cisco" in os or
-            "chrome" in os or
-            "vxworks" in os or
-            "other" in os):
-        return "Other"
-    if ("apc" in os or
-            "axis" in os or
-            "cobos" in os or
-            "enea" in os or
-            "futuresmart" in os or
-            "pump" in os or
-            "roku" in os or
-            "proprietary" in os):
-        return "Proprietary"
-    return ""
-
-
-def validate_os(operating_system: str, valid_os: list = None) -> str:
-    operating_system = clean_os(operating_system)
-    if not valid_os:
-        valid_os = DEFAULTS['valid_os']
+def clean_user(user: str) -> str:
+    # Make sure user is str
+    return _clean_user(str(user))
 
-    if operating_system in valid_os:
-        return operating_system
 
-    return ""
+def clean_users(users: Iterable[Any]) -> list[str]:
+    return clean_column(users, clean_user)
 
 
 def validate_category(category: str, valid_categories: list = None) -> str:
@@ -623,25 +427,6 @@ def query_apple_warranty(serial: str, model_name: str='') -> date|None:
     return date(year=year, month=1, day=1)
 
 
-def validate_hostname(hostname) -> str:
-    if not hostname:
-        return ''
-    hostname = str(hostname).strip().upper()
-    # Regular expression pattern for a valid short hostname or FQDN
-    short_hostname_pattern = r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)$"
-    fqdn_pattern = r"^(?=[a-zA-Z0-9-]{1,63}\.)([a-zA-Z0-9-]{1,63}\.?)+([a-zA-Z]{2,63})$"
-    short_hostname_regex = re.compile(short_hostname_pattern)
-    fqdn_regex = re.compile(fqdn_pattern)
-
-    # Check if the name matches the patterns
-    if short_hostname_regex.match(hostname):
-        return hostname
-    elif fqdn_regex.match(hostname):
-        return hostname.split('.')[0]
-    else:
-        return ''
-
-
 def send_email(recipient_email, subject, body, sender_email,
                server: str = 'localhost', server_port: int = 25, attachment_path: str = ''):
     # Create a multipart message
@@ -673,48 +458,6 @@ def send_email(recipient_email, subject, body, sender_email,
     server.quit()
 
 
-DEPT_OU = {}
-LAB_OU = {}
-def get_depts():
-    global DEPT_OU
-    global LAB_OU
-    if DEPT_OU:
-        return DEPT_OU
-
-    # Read in the CSV file into a global variable
-    with open('ou_dept.csv', 'r') as f:
-        for row in reader(f):
-            DEPT_OU[row[0]] = row[1]
-            LAB_OU[row[0]] = row[2]
-
-    return DEPT_OU
-
-def get_labs():
-    global LAB_OU
-    if not LAB_OU:
-        get_depts()
-    return LAB_OU
-
-def get_dept_from_ou(ou: str):
-    depts = get_depts()
-    # Start by searching for the entire string, then remove the last part and try again
-    while ou:
-        if ou in depts:
-            return depts[ou]
-        ou = '/'.join(ou.split('/')[:-1])
-
-    return ''
-
-def get_lab_from_ou(ou: str):
-    labs = get_labs()
-
-    while ou:
-        if ou in labs:
-            return labs[ou]
-        ou = '/'.join(ou.split('/')[:-1])
-
-    return ''
-
 def parse_isoformat(date_string):
     if date_string.endswith('Z'):
         date_string = date_string[:-1] + '+00:00'
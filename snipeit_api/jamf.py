@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import sleep
+from typing import Any, Callable
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from snipeit_api.helpers import parse_isoformat
+
+# Jamf Pro API client, one keep-alive session and one bearer token shared by every thread
+
+# Refresh the token this long before it expires, so requests in flight never carry an expired token
+TOKEN_REFRESH = timedelta(seconds=120)
+MAX_RETRIES = 5
+
+
+class JamfClient:
+    def __repr__(self):
+        return f"JamfClient({self.url})"
+
+    def __init__(self, url: str, username: str, password: str, pool_size: int = 10) -> None:
+        """
+        @param url: URL of the Jamf Pro server
+        @param username: Username for the Jamf Pro API
+        @param password: Password for the Jamf Pro API
+        @param pool_size: Connections kept open, at least the number of threads calling Jamf
+        """
+        self.url = url
+        self.auth = (username, password)
+        self.session = Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Accept': 'application/json', 'Content-Type': 'application/json'})
+        self.token = ''
+        self.expires: datetime = datetime.now(timezone.utc)
+        self.token_lock = Lock()
+
+    def get_token(self) -> str:
+        # Threads that find the token about to expire wait for the one that refreshes it, instead of all asking
+        with self.token_lock:
+            if self.token and self.expires > datetime.now(timezone.utc) + TOKEN_REFRESH:
+                return self.token
+
+            response = None
+            # A token that did not expire yet can be extended without sending the password
+            if self.token and self.expires > datetime.now(timezone.utc):
+                logging.info(f'Calling for a token against: {self.url}/api/v1/auth/keep-alive')
+                response = self.session.post(f"{self.url}/api/v1/auth/keep-alive",
+                                             headers={'Authorization': f'Bearer {self.token}'})
+            if response is None or response.status_code != 200:
+                logging.info(f'Calling for a token against: {self.url}/api/v1/auth/token')
+                response = self.session.post(f"{self.url}/api/v1/auth/token", auth=self.auth)
+
+            if response.status_code != 200:
+                logging.info(f"Received an invalid response from Jamf: {response.status_code} - {response.text}")
+                logging.error("Could not obtain a token for use, please check your username and password.")
+                raise SystemExit("Unable to obtain Jamf Token")
+
+            response_json = response.json()
+            try:
+                self.expires = parse_isoformat(response_json['expires'])
+            except (KeyError, ValueError):
+                logging.error(f"Timestamp in {response_json} is invalid - exiting")
+                raise SystemExit("Unable to grok Jamf Timestamp - Exiting")
+
+            logging.info(f"Token expires at {self.expires}")
+            self.token = response_json['token']
+            return self.token
+
+    def invalidate_token(self, token: str) -> None:
+        # Only the first thread to see a 401 for this token drops it, the others get the replacement
+        with self.token_lock:
+            if self.token == token:
+                self.token = ''
+
+    def call(self, endpoint: str, payload: Any = None, method: str = "GET",
+             throttled: Callable[[], None] = None) -> dict:
+        """
+        @param endpoint: API path, e.g. /api/v1/computers-inventory
+        @param payload: JSON body
+        @param method: GET, POST or PATCH
+        @param throttled: Called when Jamf rate limits the request, before waiting for the retry
+        @return: The decoded JSON response
+        """
+        for backoff in range(1, MAX_RETRIES + 2):
+            token = self.get_token()
+            logging.debug(f"Calling {self.url}{endpoint} with method {method} and payload {payload}")
+            response = self.session.request(method, f"{self.url}{endpoint}", json=payload,
+                                            headers={'Authorization': f'Bearer {token}'})
+
+            if response.status_code == 200:
+                return response.json()
+
+            if backoff > MAX_RETRIES:
+                break
+
+            if response.status_code in (429, 503):
+                time_backoff = retry_after(response, backoff * 30)
+                logging.warning(f'JAMF Pro Ratelimit exceeded: pausing {time_backoff}s')
+                if throttled:
+                    throttled()
+                sleep(time_backoff)
+                continue
+
+            if response.status_code == 401:
+                logging.error("JAMF API call failed with 401, refreshing token")
+                # This means we likely are reusing an expired token, expired tokens cannot be re-used.
+                self.invalidate_token(token)
+                continue
+
+            logging.error(f"JAMF responded with error code:{response.text}")
+            logging.debug(f"{response.status_code} - {response.content}")
+            raise SystemExit("JAMF API call failed")
+
+        logging.error(f"JAMF API call failed after {MAX_RETRIES} retries")
+        raise SystemExit(f"JAMF API call failed after {MAX_RETRIES} retries")
+
+
+def retry_after(response: Response, default: float) -> float:
+    """
+    @param response: A 429 or 503 response
+    @param default: Seconds to wait when Jamf does not say
+    @return: Seconds to wait according to the Retry-After header, either seconds or an HTTP date
+    """
+    value = response.headers.get('Retry-After', '').strip()
+    if not value:
+        return default
+    if value.isdigit():
+        return float(value)
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from os import path
+from typing import Any
+
+DEFAULT_RULES_FILE = path.join(path.dirname(__file__), 'manufacturers.json')
+
+
+class ManufacturerRules:
+    """
+    Maps lower case manufacturer strings to a canonical manufacturer name.
+
+    Rules are tried in order and the first match wins. Each rule has a list of alternatives, an alternative matches
+    when all of its tests (prefix, suffix, exact, contains) pass. Alternatives with a prefix are indexed in a trie, so
+    only the rules whose prefix the string actually starts with are tried, plus the few rules without a prefix.
+    """
+
+    def __init__(self, rules: list[dict[str, Any]] | None = None) -> None:
+        self.rules: list[dict[str, Any]] = []
+        self.trie: dict = {}
+        self.unanchored: list[int] = []
+        self.extend(rules or [])
+
+    @classmethod
+    def from_file(cls, file_path: str = DEFAULT_RULES_FILE) -> ManufacturerRules:
+        return cls(load_rules(file_path))
+
+    def extend(self, rules: list[dict[str, Any]], prepend: bool = False) -> ManufacturerRules:
+        """
+        @param rules: Rules as found in manufacturers.json
+        @param prepend: Put the new rules before the existing ones, so they take precedence
+        """
+        self.rules = rules + self.rules if prepend else self.rules + rules
+        self.compile()
+        return self
+
+    def compile(self) -> None:
+        self.trie = {}
+        self.unanchored = []
+        for index, rule in enumerate(self.rules):
+            for alternative in rule['match']:
+                prefix = alternative.get('prefix', '')
+                if not prefix:
+                    if not self.unanchored or self.unanchored[-1] != index:
+                        self.unanchored.append(index)
+                    continue
+                node = self.trie
+                for char in prefix:
+                    node = node.setdefault(char, {})
+                # None holds the rules ending at this node
+                candidates = node.setdefault(None, [])
+                if not candidates or candidates[-1] != index:
+                    candidates.append(index)
+
+    def candidates(self, value: str) -> list[int]:
+        found = list(self.unanchored)
+        node = self.trie
+        for char in value:
+            node = node.get(char)
+            if node is None:
+                break
+            found.extend(node.get(None, ()))
+        found.sort()
+        return found
+
+    def match(self, value: str) -> str | None:
+        """
+        @param value: Lower case, stripped manufacturer string
+        @return: The canonical name or None if no rule matches
+        """
+        for index in self.candidates(value):
+            rule = self.rules[index]
+            if any(matches(alternative, value) for alternative in rule['match']):
+                return rule['name']
+        return None
+
+
+def matches(alternative: dict[str, Any], value: str) -> bool:
+    if 'exact' in alternative and value != alternative['exact']:
+        return False
+    if 'prefix' in alternative and not value.startswith(alternative['prefix']):
+        return False
+    if 'suffix' in alternative and not value.endswith(alternative['suffix']):
+        return False
+    return all(needle in value for needle in alternative.get('contains', ()))
+
+
+def load_rules(file_path: str) -> list[dict[str, Any]]:
+    with open(file_path, 'r') as f:
+        return json.load(f)
+
+
+MANUFACTURER_RULES = ManufacturerRules.from_file()
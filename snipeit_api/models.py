@@ -3,16 +3,21 @@ from __future__ import annotations
 import html
 import json
 import re
-from dataclasses import dataclass, field, fields
+import sys
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from time import monotonic
 from uuid import uuid4
 
+from typing import Any, Iterable, Iterator
+
 from typing_extensions import Self
 
 from dataclasses_json import dataclass_json, config
 
 from .api import SnipeITApi, logging
 from .defaults import DEFAULTS
-from .helpers import clean_mac, clean_tag, clean_manufacturer, clean_user, filter_list, parse_isoformat
+from .helpers import clean_mac, clean_macs, clean_tag, clean_manufacturer, clean_user, filter_list, parse_isoformat
 
 
 def exclude_ifempty(value):
@@ -23,6 +28,91 @@ def exclude_always(_):
     return True
 
 
+# Writable fields per class as (name, exclude predicate) pairs, filled in by payload_fields()
+PAYLOAD_FIELDS: dict[type, tuple[tuple[str, Any], ...]] = {}
+
+
+def payload_fields(cls: type) -> tuple[tuple[str, Any], ...]:
+    # dataclass_json replaces to_dict on every decorated class with a generic deep copy, which is far too slow to run
+    # on every upsert. Resolve the fields the API accepts, and their exclude rules, once per class instead.
+    spec = PAYLOAD_FIELDS.get(cls)
+    if spec is None:
+        spec = []
+        for dcfield in fields(cls):
+            exclude = dcfield.metadata.get('dataclasses_json', {}).get('exclude')
+            if dcfield.name.startswith('_') or exclude is exclude_always:
+                continue
+            spec.append((dcfield.name, exclude))
+        spec = PAYLOAD_FIELDS[cls] = tuple(spec)
+    return spec
+
+
+def payload_value(value: Any) -> Any:
+    if isinstance(value, SnipeObject):
+        return value.to_payload()
+    if isinstance(value, list):
+        return [payload_value(v) for v in value]
+    if isinstance(value, dict):
+        # Copy so the state saved by store_state does not change along with the object
+        return dict(value)
+    if is_dataclass(value):
+        return asdict(value)
+    return value
+
+
+def is_unchanged(old: Any, new: Any) -> bool:
+    # Snipe-IT returns strings HTML encoded
+    return old == new or (isinstance(old, str) and isinstance(new, str) and html.unescape(old) == html.unescape(new))
+
+
+# Custom fields that hold several values in one string, e.g. Domain "AD, UR" or Management "AD, JAMF, SCCM"
+MULTI_VALUE_SEPARATOR = ", "
+
+
+class MultiValue:
+    """
+    Ordered set of the values in a multi-valued custom field. The string is parsed once and new values are merged
+    into the set, it is only joined again (sorted, like filter_list) when a merge added something.
+    """
+    __slots__ = ('text', 'tokens', 'dirty')
+
+    def __init__(self, text: str = "") -> None:
+        self.text: str = text or ""
+        self.tokens: dict[str, None] = dict.fromkeys(sys.intern(token)
+                                                     for token in self.text.split(MULTI_VALUE_SEPARATOR) if token)
+        self.dirty = False
+
+    def merge(self, values: Iterable[Any]) -> bool:
+        """
+        @param values: Values to add, empty values are skipped
+        @return: Whether anything was added since the value was last serialised
+        """
+        tokens = self.tokens
+        for value in values:
+            if not value:
+                continue
+            value = str(value)
+            if value not in tokens:
+                tokens[sys.intern(value)] = None
+                self.dirty = True
+        return self.dirty
+
+    def __contains__(self, value: str) -> bool:
+        return value in self.tokens
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tokens)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __str__(self) -> str:
+        if self.dirty:
+            self.text = MULTI_VALUE_SEPARATOR.join(sorted(self.tokens))
+            self.dirty = False
+        return self.text
+
+
 @dataclass
 class CustomField:
     field: str
@@ -56,16 +146,34 @@ class SnipeObject:
         if self.api and self.id:
             self.get_by_id()
 
-    def to_dict(self) -> dict:
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+    def iter_payload(self) -> Iterator[tuple[str, Any]]:
+        for name, exclude in payload_fields(type(self)):
+            value = getattr(self, name)
+            if exclude is not None and exclude(value):
+                continue
+            yield name, payload_value(value)
+
+    def to_payload(self) -> dict:
+        """
+        @return: The fields Snipe-IT accepts for this object, with the exclude rules applied
+        """
+        return dict(self.iter_payload())
+
+    def to_patch_payload(self) -> dict:
+        """
+        @return: The id and every field that changed since store_state, built in a single pass
+        """
+        curr_data = self._curr_data
+        payload = {'id': self.id}
+        for k, v in self.iter_payload():
+            if k in curr_data and is_unchanged(curr_data[k], v):
+                continue
+            payload[k] = v
+        return payload
 
     def to_patch_dict(self, curr_data) -> dict:
         for k, v in self._curr_data.items():
-            if (k in curr_data and k != 'id' and
-                    (curr_data[k] == v or
-                     (isinstance(curr_data[k], str) and html.unescape(curr_data[k]) == html.unescape(v))
-                    )
-            ):
+            if k in curr_data and k != 'id' and is_unchanged(v, curr_data[k]):
                 del curr_data[k]
         return curr_data
 
@@ -73,10 +181,8 @@ class SnipeObject:
         if not self.id:
             return self.create()
 
-        curr_data = self.to_dict()
         # If method is PATCH, we only want to update the fields that have changed
-        if method == 'PATCH':
-            curr_data = self.to_patch_dict(curr_data)
+        curr_data = self.to_patch_payload() if method == 'PATCH' else self.to_payload()
 
         if set(curr_data.keys()) == {"id"}:
             logging.info("No changes to save")
@@ -95,7 +201,7 @@ class SnipeObject:
         if self.id:
             logging.debug(f"Object already exists {self.__class__.__name__.lower()} - {self.id}")
             return self
-        payload = self.to_dict() | extra_data
+        payload = self.to_payload() | extra_data
         data = self.api.call(f"{self.__class__.__name__.lower()}", method="POST", payload=payload)
         if data['status'] == "success" and data['payload']:
             return self.populate(data['payload'], from_api=True)
@@ -160,7 +266,7 @@ class SnipeObject:
         return self
 
     def store_state(self):
-        setattr(self, '_curr_data', self.to_dict())
+        setattr(self, '_curr_data', self.to_payload())
         return self
 
     def __setattr__(self, key, value):
@@ -537,6 +643,46 @@ class Users(SnipeDataObject):
         return self.search(f'users', payload={"employee_num": employee_num})
 
 
+# Cache of username lookups. Unknown usernames are only remembered for USER_MISS_SECONDS, so a user created later
+# (e.g. by ldap2snipe) is found by a long running process.
+USERS_BY_USERNAME: dict[str, Users] = {}
+UNKNOWN_USERS: dict[str, float] = {}
+USER_MISS_SECONDS = 600
+# DEFAULTS['techs'] as given and the set built from it
+TECHS: tuple[Any, frozenset[str]] = (None, frozenset())
+
+
+def lookup_user(api: SnipeITApi, username: str) -> Users | None:
+    username = clean_user(username)
+    if not username:
+        return None
+    if username in USERS_BY_USERNAME:
+        return USERS_BY_USERNAME[username]
+    if UNKNOWN_USERS.get(username, 0) > monotonic():
+        return None
+    user = Users(api=api, username=username).get_by_username()
+    if not user.id:
+        UNKNOWN_USERS[username] = monotonic() + USER_MISS_SECONDS
+        return None
+    UNKNOWN_USERS.pop(username, None)
+    USERS_BY_USERNAME[username] = user
+    return user
+
+
+def get_techs() -> frozenset[str]:
+    # The importers replace DEFAULTS['techs'] after import, so rebuild the set whenever it changes
+    global TECHS
+    techs = DEFAULTS['techs']
+    if TECHS[0] is not techs:
+        TECHS = (techs, frozenset([techs] if isinstance(techs, str) else filter(None, techs)))
+    return TECHS[1]
+
+
+def is_tech(user: Users) -> bool:
+    techs = get_techs()
+    return user.username in techs or bool(user.department and user.department.name in techs)
+
+
 @dataclass_json
 @dataclass
 class Hardware(SnipeDataObject):
@@ -589,6 +735,8 @@ class Hardware(SnipeDataObject):
     user_can_checkout: bool = field(metadata=config(exclude=exclude_always), default=False)
     custom_fields: dict = field(metadata=config(exclude=exclude_always), default_factory=dict)
     available_actions: Actions = field(metadata=config(exclude=exclude_always), default_factory=Actions)
+    # Parsed multi-valued custom fields by DB column, see merge_custom_field
+    _multi_values: dict = field(metadata=config(exclude=exclude_always), default_factory=dict)
 
     def set_custom_field(self, human_name: str, value: str) -> Self:
         # This will trigger the custom_fields dict, see __setattr__
@@ -606,6 +754,27 @@ class Hardware(SnipeDataObject):
 
         return getattr(self, self.custom_fields[human_name]['field']) or ''
 
+    def merge_custom_field(self, human_name: str, values: Iterable[Any]) -> Self:
+        """
+        Add values to a multi-valued custom field (Domain, Management, EDR). The field only changes, and only shows up
+        in the PATCH, when a value was not there yet.
+        @param human_name: Name of the custom field
+        @param values: Values to add, empty values are skipped
+        """
+        if human_name not in self.custom_fields:
+            logging.debug(f"Custom field {human_name} not found in this fieldset.")
+            return self
+
+        column = self.custom_fields[human_name]['field']
+        current = getattr(self, column, '') or ''
+        multi_value = self._multi_values.get(column)
+        # Parse again only if the field was set some other way since the last merge
+        if multi_value is None or multi_value.text != current:
+            multi_value = self._multi_values[column] = MultiValue(current)
+        if multi_value.merge(values):
+            setattr(self, column, str(multi_value))
+        return self
+
     def __setattr__(self, key, value: str | int | dict):
         logging.debug(f"Hardware: Setting {key} to {value} of type {type(value)}")
 
@@ -626,6 +795,16 @@ class Hardware(SnipeDataObject):
                 value[cfield_key]['value'] = html.unescape(cfield_values['value'])
                 setattr(self, cfield_values['field'], cfield_values['value'])
 
+        if key == 'assigned_to' and isinstance(value, dict):
+            if value.get('type') != 'user':
+                # Checked out to a location or another asset, keep the row instead of looking its id up as a user
+                object.__setattr__(self, key, value)
+                return
+            # The row already has everything we need to decide on checkouts, do not fetch the user again
+            assigned_to = Users().populate(value, from_api=True)
+            assigned_to.api = self.api
+            value = assigned_to
+
         if key == "purchase_date" and value:
             if 'T' in value:
                 # Snipe-IT returns date in ISO datetime format but expects them to be returned as strings %Y-%m-%d
@@ -652,17 +831,12 @@ class Hardware(SnipeDataObject):
 
         super().__setattr__(key, value)
 
-    def store_state(self):
-        setattr(self, '_curr_data', self.to_dict() | self.get_custom_fields())
-        return self
+    def iter_payload(self) -> Iterator[tuple[str, Any]]:
+        yield from super().iter_payload()
+        yield from self.get_custom_fields().items()
 
     def populate_mac(self, mac_addresses: list[str], remove_bad_vendor: bool = True):
-        new_macs = []
-        for mac in mac_addresses:
-            new_mac = clean_mac(mac, remove_bad_vendor)
-            new_macs.append(new_mac)
-
-        new_macs = filter_list(new_macs)
+        new_macs = clean_macs(mac_addresses, remove_bad_vendor)
         available_fields = []
         logging.debug(new_macs)
         for cf in self.custom_fields.values():
@@ -688,15 +862,11 @@ class Hardware(SnipeDataObject):
     def upsert(self, method='PATCH') -> Self:
         self.evaluate_edr()
         self.evaluate_last_user()
-        extra_data = self.get_custom_fields()
         if not self.id:
-            return self.create(extra_data=extra_data)
-
-        curr_data = self.to_dict() | extra_data
+            return self.create()
 
         # If method is PATCH, we only want to update the fields that have changed
-        if method == 'PATCH':
-            curr_data = self.to_patch_dict(curr_data)
+        curr_data = self.to_patch_payload() if method == 'PATCH' else self.to_payload()
 
         if set(curr_data.keys()) == {"id"}:
             logging.debug("No changes to save")
@@ -774,6 +944,17 @@ class Hardware(SnipeDataObject):
 
         return self.search(f"hardware/byserial/{serial}")
 
+    def assigned_user_id(self) -> int:
+        """
+        @return: Id of the user the asset is checked out to, 0 when it is not checked out to a user
+        """
+        if isinstance(self.assigned_to, Users):
+            return self.assigned_to.id
+        if isinstance(self.assigned_to, dict):
+            # Checked out to a location or an asset
+            return 0
+        return int(self.assigned_to or 0)
+
     def checkout_to_user(self, user: Users, expected_checkin: str = "", checkout_at: str = "", note: str = "") -> Self:
         if not user.id:
             raise ValueError("User not found/created")
@@ -782,12 +963,15 @@ class Hardware(SnipeDataObject):
         if not note:
             note = f"From Snipe-IT API"
 
-        if self.assigned_to and self.assigned_to.id == user.id:
-            logging.debug(f"Already checked out to {self.assigned_to.username}")
+        if self.assigned_user_id() == user.id:
+            logging.debug(f"Already checked out to {user.username}")
             return self
 
-        if self.assigned_to:
-            logging.debug(f"Checking in {self.name} from {self.assigned_to.username}")
+        if isinstance(self.assigned_to, dict):
+            logging.debug(f"Checking in {self.name} from {self.assigned_to.get('type')} {self.assigned_to.get('id')}")
+            self.checkin(note=note)
+        elif self.assigned_user_id():
+            logging.debug(f"Checking in {self.name} from user {self.assigned_user_id()}")
             self.checkin(note=note)
 
         payload = {
@@ -841,14 +1025,13 @@ class Hardware(SnipeDataObject):
         if not last_user:
             return
 
-        if self.assigned_to and self.assigned_to.username.lower() == last_user.lower():
+        if (isinstance(self.assigned_to, Users) and self.assigned_to.id and
+                self.assigned_to.username.lower() == last_user):
             return
 
-        # Lookup the user
-        user = Users(api=self.api, username=last_user).get_by_username()
-        if not user.id:
-            return
-        if (user.department and user.department.name in DEFAULTS['techs']) or user.username in DEFAULTS['techs']:
+        # Lookup the user, known users are only looked up once
+        user = lookup_user(self.api, last_user)
+        if not user or is_tech(user):
             return
 
         # If we have an empty department, then update it
@@ -859,3 +1042,129 @@ class Hardware(SnipeDataObject):
             self.checkout_to_user(user)
         except ValueError:
             logging.error(f"Failed to check out {self.name} to {user.username}")
+
+
+# Compact, read-only representation of hardware rows for holding large batches (e.g. a full page scan) in memory.
+# Nested objects and the custom field layout are shared between rows instead of being a SnipeObject each.
+@dataclass(slots=True, frozen=True)
+class ObjectRef:
+    id: int = 0
+    name: str = ""
+
+
+EMPTY_REF = ObjectRef()
+
+
+# Bounded, a long running scan sees every user and model but only needs the ones of the current pages shared
+@lru_cache(maxsize=65536)
+def _object_ref(object_id: int, name: str) -> ObjectRef:
+    return ObjectRef(object_id, name)
+
+
+def object_ref(data: dict | None) -> ObjectRef:
+    if not data or not data.get('id'):
+        return EMPTY_REF
+    return _object_ref(int(data['id']), html.unescape(str(data.get('name') or data.get('username') or '')))
+
+
+@dataclass(slots=True, frozen=True)
+class CustomFieldLayout:
+    names: tuple[str, ...]
+    columns: tuple[str, ...]
+    formats: tuple[str, ...]
+    elements: tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def _custom_field_layout(key: tuple) -> CustomFieldLayout:
+    return CustomFieldLayout(*(tuple(zip(*key)) or ((), (), (), ())))
+
+
+def custom_field_layout(custom_fields: dict) -> CustomFieldLayout:
+    # One layout per fieldset
+    return _custom_field_layout(tuple((name, cf['field'], cf.get('field_format', 'ANY'), cf.get('element', 'text'))
+                                      for name, cf in custom_fields.items()))
+
+
+@dataclass(slots=True)
+class HardwareRow:
+    id: int = 0
+    name: str = ""
+    asset_tag: str = ""
+    serial: str = ""
+    updated_at: str = ""
+    model: ObjectRef = EMPTY_REF
+    status: ObjectRef = EMPTY_REF
+    category: ObjectRef = EMPTY_REF
+    manufacturer: ObjectRef = EMPTY_REF
+    company: ObjectRef = EMPTY_REF
+    location: ObjectRef = EMPTY_REF
+    assigned_to: ObjectRef = EMPTY_REF
+    layout: CustomFieldLayout = field(default_factory=lambda: custom_field_layout({}))
+    values: tuple[str, ...] = ()
+
+    @classmethod
+    def from_api(cls, row: dict) -> HardwareRow:
+        """
+        @param row: A row from the hardware endpoint as returned by Snipe-IT
+        """
+        custom_fields = row.get('custom_fields') or {}
+        updated_at = row.get('updated_at') or ''
+        if isinstance(updated_at, dict):
+            updated_at = updated_at.get('datetime', '')
+        return cls(id=int(row.get('id') or 0),
+                   name=html.unescape(row.get('name') or ''),
+                   asset_tag=html.unescape(row.get('asset_tag') or ''),
+                   serial=html.unescape(row.get('serial') or ''),
+                   updated_at=updated_at,
+                   model=object_ref(row.get('model')),
+                   status=object_ref(row.get('status_label')),
+                   category=object_ref(row.get('category')),
+                   manufacturer=object_ref(row.get('manufacturer')),
+                   company=object_ref(row.get('company')),
+                   location=object_ref(row.get('location')),
+                   assigned_to=object_ref(row.get('assigned_to')),
+                   layout=custom_field_layout(custom_fields),
+                   values=tuple(sys.intern(html.unescape(str(cf.get('value') or '')))
+                                for cf in custom_fields.values()))
+
+    @property
+    def model_id(self) -> int:
+        return self.model.id
+
+    @property
+    def status_id(self) -> int:
+        return self.status.id
+
+    @property
+    def category_id(self) -> int:
+        return self.category.id
+
+    @property
+    def manufacturer_id(self) -> int:
+        return self.manufacturer.id
+
+    @property
+    def company_id(self) -> int:
+        return self.company.id
+
+    @property
+    def location_id(self) -> int:
+        return self.location.id
+
+    @property
+    def custom_fields(self) -> dict[str, dict]:
+        layout = self.layout
+        return {name: {'field': column, 'value': value, 'field_format': field_format, 'element': element}
+                for name, column, field_format, element, value
+                in zip(layout.names, layout.columns, layout.formats, layout.elements, self.values)}
+
+    def get_custom_field(self, human_name: str) -> str:
+        try:
+            return self.values[self.layout.names.index(human_name)]
+        except ValueError:
+            logging.debug(f"Custom field {human_name} not found in this fieldset.")
+            return ''
+
+    def get_custom_fields(self) -> dict[str, str]:
+        return dict(zip(self.layout.columns, self.values))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from snipeit_api.helpers import clean_column, clean_mac_lists, clean_manufacturer, clean_model, clean_tags, clean_user
+from snipeit_api.operating_systems import get_os_type, validate_os
+from snipeit_api.validation import clean_ips, validate_hostnames
+
+
+# Batch normalisation of source records (Medigate devices, SCCM rows, ...) before they are resolved against Snipe-IT.
+# Records are turned into columns and every column is cleaned at once, so a value that repeats across the batch
+# (models, manufacturers, operating systems, users) is only cleaned once.
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    # Key in the source record, or a callable that takes the record
+    source: str | Callable[[Any], Any]
+    cleaner: Callable[[Any], Any] | None = None
+    # Used when the source value is empty, the cleaner is not called for it
+    default: Any = ''
+    # Values that are lists (e.g. MAC addresses) become tuples, so they can be deduplicated as well
+    many: bool = False
+    # Cleans the whole column at once instead of the cleaner (e.g. clean_tags), for columns where nearly every value
+    # is different. It gets the empty values as well and has to return default for them.
+    column: Callable[[list[Any]], list[Any]] | None = None
+
+    def extract(self, record: Any) -> Any:
+        if callable(self.source):
+            return self.source(record)
+        try:
+            return record[self.source]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+
+# Our names for the usual fields, with the cleaner that belongs to them
+FIELDS: dict[str, Field] = {
+    'name': Field('name', column=validate_hostnames),
+    'asset_tag': Field('asset_tag', column=clean_tags),
+    'serial': Field('serial', column=clean_tags),
+    'model': Field('model', clean_model, default='Unknown'),
+    'manufacturer': Field('manufacturer', clean_manufacturer),
+    'mac_addresses': Field('mac_addresses', default=(), many=True, column=clean_mac_lists),
+    'operating_system': Field('operating_system', validate_os),
+    'os_type': Field('operating_system', get_os_type),
+    'ip_address': Field('ip_address', default=None, column=clean_ips),
+    'last_user': Field('last_user', clean_user),
+}
+
+
+def to_columns(records: Iterable[Any], fields: dict[str, Field] = None) -> dict[str, list[Any]]:
+    """
+    :param records: Source records, anything that can be indexed by the source keys
+    :param fields: Output name -> Field, defaults to FIELDS
+    :return: Output name -> raw values, one per record
+    """
+    fields = fields or FIELDS
+    records = list(records)
+    columns = {}
+    for name, spec in fields.items():
+        if callable(spec.source):
+            values = [spec.source(record) for record in records]
+        else:
+            try:
+                values = [record[spec.source] for record in records]
+            except (KeyError, IndexError, TypeError):
+                values = [spec.extract(record) for record in records]
+        if spec.many and not spec.column:
+            values = [tuple(value) if isinstance(value, list) else value for value in values]
+        columns[name] = values
+    return columns
+
+
+def clean_values(values: list[Any], spec: Field) -> list[Any]:
+    if spec.column:
+        return spec.column(values)
+    cleaner = spec.cleaner
+    if not cleaner:
+        return [value if value else spec.default for value in values]
+    default = spec.default
+    if spec.many:
+        # Cleaned values are shared between the records with the same raw value, so they must not be mutable
+        return clean_column(values, lambda value: tuple(cleaner(value)) if value else default)
+    return clean_column(values, lambda value: cleaner(value) if value else default)
+
+
+def normalize_columns(columns: dict[str, list[Any]], fields: dict[str, Field] = None) -> dict[str, list[Any]]:
+    """
+    :param columns: Output name -> raw values, see to_columns
+    :param fields: Output name -> Field, defaults to FIELDS
+    :return: Output name -> cleaned values
+    """
+    fields = fields or FIELDS
+    return {name: clean_values(values, fields[name]) for name, values in columns.items()}
+
+
+def normalize_records(records: Iterable[Any], fields: dict[str, Field] = None) -> list[dict[str, Any]]:
+    """
+    :param records: Source records, anything that can be indexed by the source keys
+    :param fields: Output name -> Field, defaults to FIELDS
+    :return: One dict with the cleaned values per record, in the same order
+    """
+    columns = normalize_columns(to_columns(records, fields), fields)
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from snipeit_api.defaults import DEFAULTS
+
+# Operating system catalogue: maps the OS strings our sources report to the canonical name (one of
+# DEFAULTS['valid_os']) and the OS Type custom field. Fleets only report a few hundred distinct strings, so every
+# lookup is memoised.
+
+# Renames applied before validating, exact match first, then contains, then prefix (None drops the prefix)
+OS_ALIASES = {
+    'Red Hat': "RedHat",
+}
+OS_CONTAINS = (
+    ("Monterey", "macOS"),
+)
+OS_PREFIXES = (
+    ("Mac OS 10", "Mac OS X"),
+    ("Microsoft ", None),
+)
+
+# OS Type -> keywords found in the lower case OS string, the first type in this order wins
+OS_TYPES = {
+    "Windows": ("windows",),
+    "Linux": ("linux", "ubuntu", "debian", "redhat", "red hat", "centos", "fedora", "suse", "alma", "rhel",
+              "evolution"),
+    "Other": ("mac", "android", "tvos", "watchos", "bsd", "cisco", "chrome", "vxworks", "other"),
+    "Proprietary": ("apc", "axis", "cobos", "enea", "futuresmart", "pump", "roku", "proprietary"),
+}
+# Too short to match as part of a word
+OS_TYPES_EXACT = {
+    "ios": "Other",
+}
+
+OS_TYPE_PRIORITY = {keyword: (priority, os_type)
+                    for priority, (os_type, keywords) in enumerate(OS_TYPES.items())
+                    for keyword in keywords}
+# The lookahead reports a keyword at every position in one pass over the string, keywords of a type that wins come
+# first so they are the ones reported when several start at the same position
+OS_KEYWORDS = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in OS_TYPE_PRIORITY) + '))')
+
+VALID_OS: tuple[list, frozenset[str]] = ([], frozenset())
+
+
+def valid_os_names() -> frozenset[str]:
+    global VALID_OS
+    # Scripts can replace DEFAULTS['valid_os'], rebuild the set when they do
+    if VALID_OS[0] is not DEFAULTS['valid_os']:
+        VALID_OS = (DEFAULTS['valid_os'], frozenset(DEFAULTS['valid_os']))
+        _validate_os.cache_clear()
+    return VALID_OS[1]
+
+
+@lru_cache(maxsize=4096)
+def clean_os(operating_system: str) -> str:
+    if not operating_system:
+        return ''
+    if operating_system in OS_ALIASES:
+        return OS_ALIASES[operating_system]
+    for needle, replacement in OS_CONTAINS:
+        if needle in operating_system:
+            return replacement
+    for prefix, replacement in OS_PREFIXES:
+        if operating_system.startswith(prefix):
+            return replacement if replacement is not None else operating_system[len(prefix):]
+    return operating_system
+
+
+@lru_cache(maxsize=4096)
+def get_os_type(operating_system: str) -> str:
+    if not operating_system:
+        return ''
+    os = operating_system.lower()
+    if os in OS_TYPES_EXACT:
+        return OS_TYPES_EXACT[os]
+    found = min((OS_TYPE_PRIORITY[match.group(1)] for match in OS_KEYWORDS.finditer(os)), default=None)
+    return found[1] if found else ""
+
+
+@lru_cache(maxsize=4096)
+def _validate_os(operating_system: str) -> str:
+    operating_system = clean_os(operating_system)
+    if operating_system in VALID_OS[1]:
+        return operating_system
+    return ""
+
+
+def validate_os(operating_system: str, valid_os: list = None) -> str:
+    """
+    :param operating_system: OS string as reported by the source
+    :param valid_os: Valid names, defaults to DEFAULTS['valid_os']
+    :return: The canonical name, or '' if it is not a valid OS
+    """
+    if not operating_system:
+        return ''
+    if valid_os:
+        operating_system = clean_os(operating_system)
+        return operating_system if operating_system in valid_os else ""
+    valid_os_names()
+    return _validate_os(operating_system)
+
+
+def classify_os(operating_system: str) -> tuple[str, str]:
+    """
+    :param operating_system: OS string as reported by the source
+    :return: The canonical name and the OS Type, either can be ''
+    """
+    return validate_os(operating_system), get_os_type(operating_system)
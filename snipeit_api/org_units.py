@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import os
+from csv import reader
+from time import monotonic
+
+# Department and lab per AD/LDAP organizational unit, from ou_dept.csv (OU path, department, lab).
+# An OU inherits the department and lab of the closest parent OU that is listed.
+
+OU_DEPT_FILE = 'ou_dept.csv'
+# How often (seconds) to check whether the file changed, so long running processes pick up edits
+RELOAD_INTERVAL = 5.0
+
+
+class OrgUnitTree:
+    def __init__(self, file_path: str = OU_DEPT_FILE, reload_interval: float = RELOAD_INTERVAL) -> None:
+        self.file_path = file_path
+        self.reload_interval = reload_interval
+        self.mtime: int | None = None
+        self.checked = 0.0
+        # Trie over the OU path components, None holds the (department, lab) of the OU ending at that node
+        self.trie: dict = {}
+        self.depts: dict[str, str] = {}
+        self.labs: dict[str, str] = {}
+        self.resolved: dict[str, tuple[str, str]] = {}
+
+    def load(self, mtime: int) -> None:
+        trie: dict = {}
+        depts = {}
+        labs = {}
+        with open(self.file_path, 'r') as f:
+            for row in reader(f):
+                if not row or not row[0]:
+                    continue
+                ou, dept, lab = (row + ['', ''])[:3]
+                depts[ou] = dept
+                labs[ou] = lab
+                node = trie
+                for part in ou.split('/'):
+                    node = node.setdefault(part, {})
+                node[None] = (dept, lab)
+        # Swap everything at once, other threads either see the old or the new tree
+        self.trie, self.depts, self.labs, self.resolved = trie, depts, labs, {}
+        self.mtime = mtime
+        logging.debug(f"Loaded {len(depts)} OUs from {self.file_path}")
+
+    def refresh(self) -> None:
+        now = monotonic()
+        if self.mtime is not None and now - self.checked < self.reload_interval:
+            return
+        self.checked = now
+        try:
+            mtime = os.stat(self.file_path).st_mtime_ns
+        except OSError:
+            if self.mtime is None:
+                raise
+            logging.warning(f"Cannot read {self.file_path}, keeping the OUs loaded earlier")
+            return
+        if mtime != self.mtime:
+            self.load(mtime)
+
+    def resolve(self, ou: str) -> tuple[str, str]:
+        """
+        :param ou: OU path, e.g. DOMAIN/Departments/Chemistry/Lab 1
+        :return: Department and lab, '' when no parent OU is listed
+        """
+        if not ou:
+            return '', ''
+        self.refresh()
+        resolved = self.resolved
+        found = resolved.get(ou)
+        if found is None:
+            found = resolved[ou] = self._resolve(ou)
+        return found
+
+    def _resolve(self, ou: str) -> tuple[str, str]:
+        found = ('', '')
+        node = self.trie
+        for part in ou.split('/'):
+            node = node.get(part)
+            if node is None:
+                break
+            # The deepest listed OU wins
+            found = node.get(None, found)
+        return found
+
+
+ORG_UNITS = OrgUnitTree()
+
+
+def get_depts() -> dict[str, str]:
+    ORG_UNITS.refresh()
+    return ORG_UNITS.depts
+
+
+def get_labs() -> dict[str, str]:
+    ORG_UNITS.refresh()
+    return ORG_UNITS.labs
+
+
+def get_dept_from_ou(ou: str) -> str:
+    return ORG_UNITS.resolve(ou)[0]
+
+
+def get_lab_from_ou(ou: str) -> str:
+    return ORG_UNITS.resolve(ou)[1]
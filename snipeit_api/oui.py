@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import re
+import struct
+from csv import DictReader
+from dataclasses import dataclass
+from functools import lru_cache
+from os import path
+from sys import argv
+from threading import Lock
+from typing import Iterable
+
+from snipeit_api.defaults import DEFAULTS
+
+# MAC vendor database, the one place that knows which MAC prefixes are NDAA covered, USB dongles or stable private
+# addresses. clean_mac and ndaabanned.py both look addresses up here.
+#
+# Build the compiled version offline from the IEEE registries (https://regauth.standards.ieee.org/standards-ra-web/pub/view.html,
+# oui.csv, mam.csv and oui36.csv) plus our own lists, it is shared read-only (mmap) by every process that opens it:
+#   python -m snipeit_api.oui build oui.db oui.csv mam.csv oui36.csv
+# Without oui.db the same lookups are answered from our own lists in memory, only the IEEE vendor names are missing.
+#
+# Layout (little endian):
+#   header   magic, version, record count, name count, the prefix lengths (in hex digits) present
+#   buckets  65536 + 1 record offsets, one bucket per first two octets of the MAC address
+#   records  per bucket sorted by 64-bit key (prefix length << 48 | prefix padded to 48 bits), vendor index,
+#            NDAA group index, flags
+#   names    offsets into the UTF-8 blob of vendor and group names that follows
+# A lookup is one bucket read plus a short binary search in the bucket for each prefix length. Every prefix is at least
+# two octets long, so all the prefixes that can match an address are in the same bucket.
+
+NDAA_FILE = path.join(path.dirname(__file__), 'ndaa.csv')
+OUI_DATABASE_FILE = 'oui.db'
+NON_HEX = re.compile(r'[^0-9A-F]')
+
+# Bad MAC addresses, typically due to being USB dongles
+# 000000 -> Xerox (not invalid)
+# 0A:00:27:00:00:00 -> VirtualBox
+BAD_MAC_PREFIXES = [
+    # HyperV network adapters, haven't noticed duplicates yet
+    # '00155D',
+    # VMWare network adapters, no duplicates on server products yet
+    # '005056',
+    # This one seems to be VMware desktop products which are consecutively assigned
+    '005056C0',
+    # Belkin (USB network adapters)
+    '00173F', '001CDF', '002275', '08863B', '149182', '24F5A2', '302303', '58EF68',
+    '6038E0', '80691A', '94103E', '944452', 'B4750E', 'C05627', 'C4411E', 'D8EC5E',
+    'E89F80', 'EC1A59',
+    '001150', '0030BD',
+    # CE Link (USB network adapters)
+    '6C6E07', '70B3D554', 'A0CEC8',
+    # Cable Matters (USB network adapters)
+    'F44DAD', '5C857E30', '70886B80',
+    # Cisco AnyConnect
+    '00059A3C7A00', '00059A3C7800',
+    # Apple USB dongles
+    '5CF7E68B',
+    'AC7F3EE6DDE5',
+    # Microsoft USB dongles?
+    'F01DBCF2',
+    # ASIX USB dongles
+    'F8E43B',
+    # BizLink (Kunshan) USB dongles
+    '9CEBE8',
+    # Speed Dragon Multimedia USB dongle
+    '00133B',
+    # AuKey (Dongguan Kingtron Electronics Tech Co., Ltd) USB dongles
+    '98FC84E',
+    '34298F7',
+    #  Wistron Infocomm (Zhongshan) Corporation dongle
+    '98EECBB21088',
+    # OmniKey RFID dongle virtual MAC
+    # These are serially generated (00, 01, ...) and not unique
+    '00189E',
+    # Realtek USB dongles
+    '00E04C',
+    # Cisco-Linksys dongles
+    'C8D719C3426D',
+    # Dell USB dongle
+    '509A4C1B0BC4',
+    '605B3021',
+    'C025A5ED7191',
+    '3C2C30F82A34',
+    # Luxshare Precision Industry Company Limited
+    '3C18A0',
+    # Tp-Link Technologies Co.,Ltd.
+    '984827',
+    '34E894',
+    # Shenzen Cudy Technology Co., Ltd.
+    'B44BD62',
+    # Shenzhen Century Xinyang Technology Co., Ltd
+    '90DE80',
+    # Good Way Ind. Co., Ltd.
+    "0050B6",
+    # TRENDnet, Inc.
+    "782D7E",
+    # Wistron InfoComm(Kunshan)Co.,Ltd. - Lenovo Docking Stations
+    "54EE75",
+    # Hon Hai Precision Ind. Co.,Ltd.
+    "FC017C"
+]
+
+FLAG_BLOCKED = 1  # Covered by NDAA section 889, see ndaa.csv
+FLAG_DONGLE = 2  # USB dongles and the like, the MAC follows the adapter and not the asset, see BAD_MAC_PREFIXES
+FLAG_PRIVATE = 4  # Locally administered, but known to be stable (DEFAULTS['valid_private_mac'])
+
+MAGIC = b'SNIPEOUI'
+VERSION = 2
+HEADER = struct.Struct('<8sIII12B')
+RECORD = struct.Struct('<QIII')
+OFFSET = struct.Struct('<I')
+BUCKETS = 1 << 16
+# Buckets up to this many records are read at once instead of searched
+SMALL_BUCKET = 8
+MAC_MASK = (1 << 48) - 1
+
+
+@dataclass(frozen=True, slots=True)
+class OuiEntry:
+    prefix: str
+    vendor: str
+    flags: int
+    # NDAA covered group (ZTE, Huawei...), only for blocked prefixes
+    group: str = ''
+
+    @property
+    def blocked(self) -> bool:
+        return bool(self.flags & FLAG_BLOCKED)
+
+    @property
+    def dongle(self) -> bool:
+        return bool(self.flags & FLAG_DONGLE)
+
+    @property
+    def private(self) -> bool:
+        return bool(self.flags & FLAG_PRIVATE)
+
+
+@dataclass(frozen=True, slots=True)
+class NdaaPrefix:
+    prefix: str
+    group: str
+    vendor: str
+
+
+def load_ndaa_prefixes(file_path: str = NDAA_FILE) -> list[NdaaPrefix]:
+    with open(file_path, 'r', newline='') as f:
+        return [NdaaPrefix(row['prefix'], row['group'], row['vendor']) for row in DictReader(f)]
+
+
+def collect_prefixes(ieee_files: Iterable[str] = (), ndaa_file: str = NDAA_FILE) -> dict[str, list]:
+    """
+    @param ieee_files: IEEE registry CSV exports (MA-L, MA-M, MA-S)
+    @param ndaa_file: CSV with the NDAA covered prefixes
+    @return: Vendor, NDAA group and flags per prefix (hex only, upper case)
+    """
+    entries: dict[str, list] = {}
+
+    def add(prefix: str, vendor: str = '', group: str = '', flags: int = 0):
+        prefix = NON_HEX.sub('', prefix.upper())
+        if not 4 <= len(prefix) <= 12:
+            logging.warning(f"Skipping invalid prefix {prefix}")
+            return
+        entry = entries.setdefault(prefix, ['', '', 0])
+        entry[0] = entry[0] or vendor.strip()
+        entry[1] = entry[1] or group.strip()
+        entry[2] |= flags
+
+    for ieee_file in ieee_files:
+        with open(ieee_file, 'r', newline='', encoding='utf-8') as f:
+            for row in DictReader(f):
+                add(row['Assignment'], row['Organization Name'])
+    for ndaa in load_ndaa_prefixes(ndaa_file):
+        add(ndaa.prefix, ndaa.vendor, ndaa.group, FLAG_BLOCKED)
+    for prefix in BAD_MAC_PREFIXES:
+        add(prefix, flags=FLAG_DONGLE)
+    for prefix in DEFAULTS['valid_private_mac']:
+        add(prefix, flags=FLAG_PRIVATE)
+    return entries
+
+
+def prefix_key(prefix: str) -> int:
+    # Hex only, upper case, at most 12 digits
+    return len(prefix) << 48 | int(prefix, 16) << 4 * (12 - len(prefix))
+
+
+def normalize_mac(mac_address: str) -> str:
+    """
+    @return: The 12 hex digits, upper case, or '' when it is not a MAC address
+    """
+    mac_address = NON_HEX.sub('', str(mac_address).upper())
+    return mac_address if len(mac_address) == 12 else ''
+
+
+class PrefixTable:
+    """
+    Our own lists (ndaa.csv, BAD_MAC_PREFIXES, valid_private_mac) in memory, for when oui.db has not been built
+    """
+
+    def __init__(self, entries: dict[str, list]) -> None:
+        self.by_length: dict[int, dict[str, tuple]] = {}
+        for prefix, entry in entries.items():
+            self.by_length.setdefault(len(prefix), {})[prefix] = tuple(entry)
+        # Longest prefix first, the most specific assignment names the vendor
+        self.lengths = sorted(self.by_length, reverse=True)
+        self.lookup = lru_cache(maxsize=65536)(self._lookup)
+
+    def close(self) -> None:
+        self.lookup.cache_clear()
+
+    def _lookup(self, mac_address: str) -> OuiEntry | None:
+        mac_address = normalize_mac(mac_address)
+        return self.match(mac_address) if mac_address else None
+
+    def flags(self, mac_address: str) -> int:
+        """
+        @param mac_address: 12 upper case hex digits, see normalize_mac
+        @return: The flags of every matching prefix
+        """
+        flags = 0
+        for length in self.lengths:
+            found = self.by_length[length].get(mac_address[:length])
+            if found:
+                flags |= found[2]
+        return flags
+
+    def match(self, mac_address: str) -> OuiEntry | None:
+        """
+        @param mac_address: 12 upper case hex digits, see normalize_mac
+        @return: The most specific assignment, with the flags of every matching prefix, or None
+        """
+        prefix, vendor, group, flags = '', '', '', 0
+        for length in self.lengths:
+            found = self.by_length[length].get(mac_address[:length])
+            if not found:
+                continue
+            prefix = prefix or mac_address[:length]
+            vendor = vendor or found[0]
+            group = group or found[1]
+            flags |= found[2]
+        if not prefix:
+            return None
+        return OuiEntry(prefix, vendor, flags, group)
+
+
+class OuiDatabase:
+    def __init__(self, file_path: str = OUI_DATABASE_FILE) -> None:
+        with open(file_path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, name_count, *lengths = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.mm.close()
+            raise ValueError(f"{file_path} is not a version {VERSION} OUI database, please rebuild it")
+        # Longest prefix first, the most specific assignment names the vendor
+        self.lengths = sorted((length for length in lengths if length), reverse=True)
+        self.buckets = HEADER.size
+        self.records = self.buckets + (BUCKETS + 1) * OFFSET.size
+        self.name_offsets = self.records + self.count * RECORD.size
+        self.name_blob = self.name_offsets + (name_count + 1) * OFFSET.size
+        self.lookup = lru_cache(maxsize=65536)(self._lookup)
+
+    def __enter__(self) -> OuiDatabase:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.lookup.cache_clear()
+        self.mm.close()
+
+    def bucket(self, value: int) -> tuple[int, int]:
+        """
+        @param value: The MAC address as a 48-bit number
+        @return: The range of records that share its first two octets
+        """
+        return struct.unpack_from('<II', self.mm, self.buckets + (value >> 32 & 0xFFFF) * OFFSET.size)
+
+    def find(self, key: int, lo: int, hi: int) -> tuple[int, int, int] | None:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key, vendor, group, flags = RECORD.unpack_from(self.mm, self.records + mid * RECORD.size)
+            if mid_key == key:
+                return vendor, group, flags
+            if mid_key < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def name(self, index: int) -> str:
+        if not index:
+            return ''
+        start, end = struct.unpack_from('<II', self.mm, self.name_offsets + index * OFFSET.size)
+        return self.mm[self.name_blob + start:self.name_blob + end].decode('utf-8')
+
+    def _lookup(self, mac_address: str) -> OuiEntry | None:
+        mac_address = normalize_mac(mac_address)
+        return self.match(mac_address) if mac_address else None
+
+    def flags(self, mac_address: str) -> int:
+        """
+        @param mac_address: 12 upper case hex digits, see normalize_mac
+        @return: The flags of every matching prefix, without reading the vendor names
+        """
+        value = int(mac_address, 16)
+        lo, hi = self.bucket(value)
+        flags = 0
+        if hi - lo <= SMALL_BUCKET:
+            # Most buckets only hold a few prefixes, checking each of them beats a binary search per prefix length
+            for key, _, _, record_flags in RECORD.iter_unpack(self.mm[self.records + lo * RECORD.size:
+                                                                      self.records + hi * RECORD.size]):
+                shift = 4 * (12 - (key >> 48))
+                if value >> shift << shift == key & MAC_MASK:
+                    flags |= record_flags
+            return flags
+        for length in self.lengths:
+            shift = 4 * (12 - length)
+            found = self.find(length << 48 | value >> shift << shift, lo, hi)
+            if found:
+                flags |= found[2]
+        return flags
+
+    def match(self, mac_address: str) -> OuiEntry | None:
+        """
+        @param mac_address: 12 upper case hex digits, see normalize_mac
+        @return: The most specific assignment, with the flags of every matching prefix, or None
+        """
+        value = int(mac_address, 16)
+        lo, hi = self.bucket(value)
+        if lo == hi:
+            return None
+        prefix, vendor, group, flags = '', '', '', 0
+        for length in self.lengths:
+            shift = 4 * (12 - length)
+            found = self.find(length << 48 | value >> shift << shift, lo, hi)
+            if not found:
+                continue
+            prefix = prefix or mac_address[:length]
+            vendor = vendor or self.name(found[0])
+            group = group or self.name(found[1])
+            flags |= found[2]
+        if not prefix:
+            return None
+        return OuiEntry(prefix, vendor, flags, group)
+
+
+def build_oui_database(output: str, ieee_files: Iterable[str] = (), ndaa_file: str = NDAA_FILE) -> int:
+    """
+    @param output: Where to write the database
+    @param ieee_files: IEEE registry CSV exports (MA-L, MA-M, MA-S)
+    @param ndaa_file: CSV with the NDAA covered prefixes
+    @return: The number of prefixes written
+    """
+    entries = collect_prefixes(ieee_files, ndaa_file)
+
+    # Index 0 is "no name"
+    names = {'': 0}
+    records = []
+    for prefix, (vendor, group, flags) in entries.items():
+        key = prefix_key(prefix)
+        records.append((key >> 32 & 0xFFFF, key, names.setdefault(vendor, len(names)),
+                        names.setdefault(group, len(names)), flags))
+    records.sort()
+
+    bucket_offsets = []
+    for index, record in enumerate(records):
+        while len(bucket_offsets) <= record[0]:
+            bucket_offsets.append(index)
+    bucket_offsets += [len(records)] * (BUCKETS + 1 - len(bucket_offsets))
+
+    lengths = sorted({len(prefix) for prefix in entries})
+    blob = bytearray()
+    offsets = [0]
+    for name in names:
+        blob += name.encode('utf-8')
+        offsets.append(len(blob))
+
+    with open(output, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(records), len(names), *(lengths + [0] * (12 - len(lengths)))))
+        for offset in bucket_offsets:
+            f.write(OFFSET.pack(offset))
+        for record in records:
+            f.write(RECORD.pack(*record[1:]))
+        for offset in offsets:
+            f.write(OFFSET.pack(offset))
+        f.write(blob)
+
+    return len(records)
+
+
+OUI_DATABASE: OuiDatabase | PrefixTable | None = None
+OUI_DATABASE_LOCK = Lock()
+
+
+def get_oui_database(file_path: str = OUI_DATABASE_FILE) -> OuiDatabase | PrefixTable:
+    global OUI_DATABASE
+    if OUI_DATABASE:
+        return OUI_DATABASE
+    with OUI_DATABASE_LOCK:
+        if not OUI_DATABASE:
+            if path.exists(file_path):
+                try:
+                    OUI_DATABASE = OuiDatabase(file_path)
+                except ValueError as e:
+                    logging.error(f"{e}, MAC lookups use the built-in prefix lists without vendor names")
+            else:
+                logging.info(f"{file_path} not found, MAC lookups use the built-in prefix lists without vendor names")
+            if not OUI_DATABASE:
+                OUI_DATABASE = PrefixTable(collect_prefixes())
+    return OUI_DATABASE
+
+
+def lookup_mac(mac_address: str) -> OuiEntry | None:
+    """
+    @param mac_address: MAC address in any notation
+    @return: Vendor, NDAA group and blocked/dongle/private flags, None when no known prefix matches
+    """
+    return get_oui_database().lookup(mac_address)
+
+
+def mac_flags(mac_address: str) -> int:
+    """
+    Only the blocked/dongle/private flags of an address that is already normalised, uncached (clean_mac caches its
+    own result), for checks that do not need the vendor
+    @param mac_address: 12 upper case hex digits, see normalize_mac
+    """
+    return get_oui_database().flags(mac_address)
+
+
+def main():
+    if len(argv) > 2 and argv[1] == 'build':
+        print(f"Wrote {build_oui_database(argv[2], argv[3:])} prefixes to {argv[2]}")
+    elif len(argv) > 2 and argv[1] == 'lookup':
+        for mac_address in argv[2:]:
+            print(f"{mac_address}: {lookup_mac(mac_address)}")
+    else:
+        print("Usage: python -m snipeit_api.oui build <output> [ieee.csv ...] | lookup <mac> [<mac> ...]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from queue import Queue
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import Any, Callable, Iterable
+
+# Producer/consumer pipeline for the importers: every source is read in its own thread, records flow through the
+# stages (e.g. normalise -> upsert) over bounded queues, so fetching from the source overlaps with writing to Snipe-IT
+# and a slow stage holds back the sources instead of filling up memory.
+
+DONE = object()
+
+
+@dataclass
+class Stage:
+    """
+    @param name: Shown in the timings
+    @param func: Called with every record, returns the record for the next stage or None to drop it
+    @param workers: Threads running func, keep this at 1 for stages that create objects in Snipe-IT
+    @param queue_size: Records waiting for this stage before the previous stage (or the sources) waits
+    """
+    name: str
+    func: Callable[[Any], Any]
+    workers: int = 1
+    queue_size: int = 500
+
+
+@dataclass
+class StageStats:
+    name: str
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: StageStats) -> None:
+        self.processed += other.processed
+        self.dropped += other.dropped
+        self.failed += other.failed
+        self.seconds += other.seconds
+
+
+class Pipeline:
+    def __init__(self, stages: list[Stage], progress: Callable[[int], None] = None) -> None:
+        """
+        @param stages: Stages in the order records go through them, the result of the last stage is discarded
+        @param progress: Called with the number of records the last stage finished (failed or not), after every record
+        """
+        self.stages = stages
+        self.progress = progress
+        self.stats: dict[str, StageStats] = {}
+        self.lock = Lock()
+        self.abort = Event()
+        self.error: BaseException | None = None
+        self.finished = 0
+
+    def fail(self, error: BaseException) -> None:
+        with self.lock:
+            if self.error is None:
+                self.error = error
+        self.abort.set()
+
+    def read_source(self, source: Iterable, queue: Queue, stats: StageStats) -> None:
+        local = StageStats(stats.name)
+        start = perf_counter()
+        try:
+            for record in source:
+                if self.abort.is_set():
+                    break
+                local.processed += 1
+                queue.put(record)
+        except BaseException as e:
+            logging.error(f"Source failed: {e!r}")
+            self.fail(e)
+        local.seconds = perf_counter() - start
+        with self.lock:
+            stats.add(local)
+
+    def run_stage(self, stage: Stage, queue: Queue, next_queue: Queue | None, stats: StageStats) -> None:
+        local = StageStats(stage.name)
+        while True:
+            record = queue.get()
+            if record is DONE:
+                break
+            # Keep reading so nothing upstream stays blocked on a full queue
+            if self.abort.is_set():
+                continue
+            start = perf_counter()
+            try:
+                result = stage.func(record)
+            except Exception as e:
+                logging.exception(f"{stage.name} failed: {e}")
+                local.failed += 1
+                continue
+            except BaseException as e:
+                self.fail(e)
+                continue
+            finally:
+                local.processed += 1
+                local.seconds += perf_counter() - start
+                # Failed records count as finished too, otherwise the progress never reaches the total
+                if next_queue is None and self.progress:
+                    with self.lock:
+                        self.finished += 1
+                        self.progress(self.finished)
+            if next_queue is None:
+                continue
+            if result is None:
+                local.dropped += 1
+            else:
+                next_queue.put(result)
+        with self.lock:
+            stats.add(local)
+
+    def run(self, *sources: Iterable) -> dict[str, StageStats]:
+        """
+        @param sources: Iterables of raw records, read at the same time
+        @return: Records and busy time per stage, 'source' counts what the sources produced and how long they took
+        """
+        queues = [Queue(maxsize=stage.queue_size) for stage in self.stages]
+        self.stats = {'source': StageStats('source')}
+        self.stats.update({stage.name: StageStats(stage.name) for stage in self.stages})
+        start = perf_counter()
+
+        workers: list[list[Thread]] = []
+        for i, stage in enumerate(self.stages):
+            next_queue = queues[i + 1] if i + 1 < len(queues) else None
+            workers.append([Thread(target=self.run_stage, args=(stage, queues[i], next_queue, self.stats[stage.name]),
+                                   name=f"{stage.name}-{n}", daemon=True)
+                            for n in range(stage.workers)])
+        readers = [Thread(target=self.read_source, args=(source, queues[0], self.stats['source']), daemon=True)
+                   for source in sources]
+
+        for thread in readers + [thread for threads in workers for thread in threads]:
+            thread.start()
+
+        # Every stage is told to stop once everything before it finished
+        for thread in readers:
+            thread.join()
+        for i, threads in enumerate(workers):
+            for _ in threads:
+                queues[i].put(DONE)
+            for thread in threads:
+                thread.join()
+
+        elapsed = perf_counter() - start
+        for stats in self.stats.values():
+            logging.info(f"{stats.name}: {stats.processed} records in {stats.seconds:.1f}s "
+                         f"({stats.seconds / stats.processed * 1000 if stats.processed else 0:.1f}ms each), "
+                         f"{stats.dropped} dropped, {stats.failed} failed")
+        logging.info(f"Pipeline finished in {elapsed:.1f}s")
+
+        if self.error is not None:
+            raise self.error
+        return self.stats
+
+    @property
+    def failed(self) -> int:
+        return sum(stats.failed for stats in self.stats.values())
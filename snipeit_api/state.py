@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any
+
+# Small JSON files that scripts keep between runs (watermarks, previous results)
+
+
+def load_state(file_path: str) -> dict[str, Any]:
+    try:
+        with open(file_path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable state {file_path}: {e}")
+        return {}
+
+
+def save_state(file_path: str, state: dict[str, Any]) -> None:
+    # Write next to the file and rename, so an interrupted run never leaves half a state behind
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, file_path)
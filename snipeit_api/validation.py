@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from ipaddress import ip_address
+from typing import Any, Iterable
+
+# Hostname and IP address validation, shared by the importers and the trust score app
+
+# A valid short hostname
+HOSTNAME = re.compile(r"(?!-)[A-Z0-9-]{1,63}(?<!-)")
+# Labels can not be empty and the name has to end in a top level domain. Every label starts after a dot, so unlike a
+# nested (label\.?)+ pattern this can not backtrack exponentially on long invalid names.
+FQDN = re.compile(r"[A-Z0-9-]{1,63}(?:\.[A-Z0-9-]+)*\.[A-Z0-9-]*[A-Z]{2}")
+
+
+@lru_cache(maxsize=65536)
+def _validate_hostname(hostname: str) -> str:
+    hostname = hostname.strip().upper()
+    if HOSTNAME.fullmatch(hostname):
+        return hostname
+    if FQDN.fullmatch(hostname):
+        return hostname.partition('.')[0]
+    return ''
+
+
+def validate_hostname(hostname: Any) -> str:
+    """
+    :param hostname: Short hostname or FQDN
+    :return: The upper case short hostname, or '' if it is not a valid name
+    """
+    if not hostname:
+        return ''
+    return _validate_hostname(str(hostname))
+
+
+def validate_hostnames(hostnames: Iterable[Any]) -> list[str]:
+    hostnames = list(hostnames)
+    # Every distinct name is validated once already, going through the cache would only churn it
+    uncached = _validate_hostname.__wrapped__
+    cleaned = {hostname: uncached(str(hostname)) if hostname else '' for hostname in set(hostnames)}
+    return list(map(cleaned.__getitem__, hostnames))
+
+
+@lru_cache(maxsize=65536)
+def parse_ip(ip: str) -> str | None:
+    """
+    :param ip: IPv4 or IPv6 address, IPv4 mapped IPv6 addresses are returned as IPv4
+    :return: The address in its canonical notation, or None if it is not an IP address
+    """
+    try:
+        address = ip_address(ip.strip())
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    return str(address)
+
+
+def clean_ipv4(ip: str) -> str | None:
+    # Accepts the same addresses as the IPv4-only clean_ip that was in helpers.py, in one pass over the octets
+    octets = ip.split('.')
+    if len(octets) != 4:
+        return None
+    try:
+        first, second, third, fourth = map(int, octets)
+    except ValueError:
+        return None
+    # x.x.x.0 and x.x.x.255 are network and broadcast addresses in our subnets, 255.x.x.x is reserved
+    if not (0 < first < 255 and 0 < second < 255 and 0 < third < 255 and 0 < fourth < 255):
+        return None
+    # Loopback, link local and multicast up to 238.x, 239.x has always been let through
+    if first == 127 or (first == 169 and second == 254) or 224 <= first < 239:
+        return None
+    return ip
+
+
+@lru_cache(maxsize=65536)
+def _clean_ip(ip: str) -> str | None:
+    ip = ip.strip()
+    # Nearly everything we see is plain IPv4, only parse the rest with ipaddress
+    if ':' not in ip:
+        return clean_ipv4(ip)
+    ip = parse_ip(ip)
+    if not ip:
+        return None
+    if '.' in ip:
+        # IPv4 mapped
+        return clean_ipv4(ip)
+    address = ip_address(ip)
+    if address.is_loopback or address.is_link_local or address.is_multicast or address.is_unspecified:
+        return None
+    return ip
+
+
+def clean_ip(ip: Any) -> str | None:
+    """
+    :param ip: IPv4 or IPv6 address
+    :return: The address if it is a usable device address (not loopback, link local, multicast...), otherwise None
+    """
+    if not ip:
+        return None
+    return _clean_ip(str(ip))
+
+
+def clean_ips(ips: Iterable[Any]) -> list[str | None]:
+    ips = list(ips)
+    uncached = _clean_ip.__wrapped__
+    cleaned = {ip: uncached(str(ip)) if ip else None for ip in set(ips)}
+    return list(map(cleaned.__getitem__, ips))
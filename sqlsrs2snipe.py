@@ -6,19 +6,23 @@ import logging
 import os
 from configparser import RawConfigParser
 from datetime import datetime
+from functools import partial
 from requests import get
 from requests_ntlm import HttpNtlmAuth
 from xmltodict import parse
 
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
-from snipeit_api.helpers import clean_ip, clean_mac, filter_list, clean_tag, clean_user, print_progress, \
-    get_dept_from_ou, validate_os, clean_model, setup_logging
+from snipeit_api.helpers import clean_mac, filter_list, clean_tag, clean_user, print_progress, \
+    get_dept_from_ou, validate_os, clean_model, setup_logging, setup_manufacturer_rules
 from snipeit_api.models import Hardware, Manufacturers, Models
+from snipeit_api.pipeline import Pipeline, Stage
+from snipeit_api.validation import clean_ip
 
 CONFIG = RawConfigParser()
 CONFIG.read("settings.conf")
 setup_logging(CONFIG)
+setup_manufacturer_rules(CONFIG)
 snipeit_apiurl = CONFIG.get('snipe-it', 'url')
 snipeit_apikey = CONFIG.get('snipe-it', 'apikey')
 DEFAULTS['techs'] = CONFIG.get('snipe-it', 'techs').split(" ")
@@ -168,18 +172,14 @@ def process_entry(properties, net_info, edr_info, api: SnipeITApi):
     if current_ram < new_ram:
         new_hw.set_custom_field("RAM", new_ram)
 
-    old_domain = new_hw.get_custom_field("Domain").split(", ")
-    new_domain = [domain.upper()] if domain else []
-    new_hw.set_custom_field("Domain", ", ".join(filter_list(new_domain + old_domain)))
+    new_hw.merge_custom_field("Domain", [domain.upper()] if domain else [])
 
     management = ['SCCM']
     if 'UR' in domain:
         management.append('AD')
-    old_management = new_hw.get_custom_field("Management").split(', ')
-    new_hw.set_custom_field("Management", ', '.join(filter_list(old_management + management)))
+    new_hw.merge_custom_field("Management", management)
 
-    edr = new_hw.get_custom_field("EDR").split(', ')
-    new_hw.set_custom_field("EDR", ', '.join(filter_list(edr + edr_info.get(computer_name, []))))
+    new_hw.merge_custom_field("EDR", edr_info.get(computer_name, []))
 
     if ou:
         new_hw.set_custom_field("Org. Unit", ou)
@@ -206,11 +206,11 @@ def main():
     net_info = process_network_info(load_xml('./tmp/report_net.xml'))
     edr_info = process_edr_info(load_xml('./tmp/report_edr.xml'))
     total_entries = len(pc_info)
-    completed_entries = 0
-    for entry in pc_info:
-        process_entry(entry['content']['m:properties'], net_info, edr_info, snipe_api)
-        completed_entries += 1
-        print_progress(completed_entries, total_entries)
+    pipeline = Pipeline([Stage('upsert', partial(process_entry, net_info=net_info, edr_info=edr_info, api=snipe_api))],
+                        progress=lambda done: print_progress(done, total_entries))
+    pipeline.run(entry['content']['m:properties'] for entry in pc_info)
+    if pipeline.failed:
+        raise SystemExit(f"{pipeline.failed} of {total_entries} computers failed")
 
 
 if __name__ == "__main__":
@@ -2,12 +2,31 @@
 import logging
 from configparser import RawConfigParser
 from copy import deepcopy
+from functools import partial
 
 from tenable.sc import TenableSC
 from snipeit_api.api import SnipeITApi
 from snipeit_api.defaults import DEFAULTS
-from snipeit_api.helpers import filter_list, setup_logging
+from snipeit_api.helpers import setup_logging
 from snipeit_api.models import Hardware
+from snipeit_api.pipeline import Pipeline, Stage
+
+
+def process_host(host: dict, snipe_api: SnipeITApi) -> None:
+    shortname = host['dnsName'].split('.')[0].upper()
+    if not host['macAddress'] and not shortname:
+        logging.error(f"Cannot uniquely identify {host['ip']} - {host['dnsName']}")
+        return
+    new_hw: Hardware = (Hardware(api=snipe_api, custom_fields=deepcopy(DEFAULTS['custom_fields']))
+                        .get_by_mac([host['macAddress']])
+                        .get_by_name(shortname)
+                        .store_state())
+    if not new_hw.id:
+        logging.error(f"Cannot find {shortname} - {host['macAddress']}")
+        return
+    new_hw.merge_custom_field('EDR', ["Tenable Nessus"])
+    new_hw.set_custom_field('IP Address', host['ip'])
+    new_hw.upsert()
 
 
 def main():
@@ -29,23 +48,11 @@ def main():
     query = ('pluginID', '=', '110095,22869,20811,178102')
     vulnerable_hosts = sc.analysis.vulns(query)
 
-    # Make a unique list of hostnames and MAC addresses
-    for host in vulnerable_hosts:
-        shortname = host['dnsName'].split('.')[0].upper()
-        if not host['macAddress'] and not shortname:
-            logging.error(f"Cannot uniquely identify {host['ip']} - {host['dnsName']}")
-            continue
-        new_hw: Hardware = (Hardware(api=snipe_api, custom_fields=deepcopy(DEFAULTS['custom_fields']))
-                            .get_by_mac([host['macAddress']])
-                            .get_by_name(shortname)
-                            .store_state())
-        if not new_hw.id:
-            logging.error(f"Cannot find {shortname} - {host['macAddress']}")
-            continue
-        current_edr = new_hw.get_custom_field('EDR').split(", ")
-        new_hw.set_custom_field('EDR', ", ".join(filter_list(current_edr + ["Tenable Nessus"])))
-        new_hw.set_custom_field('IP Address', host['ip'])
-        new_hw.upsert()
+    # The result pages are read while the hosts are updated
+    pipeline = Pipeline([Stage('upsert', partial(process_host, snipe_api=snipe_api))])
+    pipeline.run(vulnerable_hosts)
+    if pipeline.failed:
+        raise SystemExit(f"{pipeline.failed} hosts failed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# clean_manufacturer must give the same result as the elif chain it replaced (snipeit_api/manufacturers.json)
+# Usage: python -m unittest tests.test_manufacturers
+import inspect
+import re
+import unittest
+from itertools import product
+
+from snipeit_api.helpers import clean_manufacturer, clean_tag
+
+
+def legacy_clean_manufacturer(manufacturer: str):
+    # The original helpers.clean_manufacturer, kept as the reference
+    if not manufacturer:
+        return ''
+
+    manufacturer_lower = str(manufacturer).lower().strip()
+    if manufacturer_lower.startswith('apple'):
+        return 'Apple'
+    elif manufacturer_lower.startswith('dell') or manufacturer_lower.endswith('ell inc.'):
+        return 'Dell Inc.'
+    elif manufacturer_lower.startswith('aaeon'):
+        return 'AAEON Technology Inc.'
+    elif manufacturer_lower.startswith('apc'):
+        return 'APC'
+    elif manufacturer_lower.startswith('alaris') or manufacturer_lower == 'becton dickinson':
+        return 'BD'
+    elif manufacturer_lower.startswith('asix'):
+        return 'ASIX Electronics Corporation'
+    elif manufacturer_lower.startswith('advansus'):
+        return 'Advansus Corp.'
+    elif manufacturer_lower.startswith('advantech'):
+        return 'Advantech Co., Ltd.'
+    elif manufacturer_lower.startswith('andover'):
+        return 'Andover Controls Corporation'
+    elif manufacturer_lower.startswith('armorlin'):
+        return 'Armorlink Co., Ltd.'
+    elif manufacturer_lower.startswith('asrock'):
+        return 'ASRock Incorporation'
+    elif manufacturer_lower.startswith('axiom'):
+        return 'Axiom Technology Co., Ltd.'
+    elif manufacturer_lower.startswith('asus'):
+        return 'ASUSTeK Computer Inc.'
+    elif manufacturer_lower.startswith('azurewav'):
+        return 'AzureWave Technologies, Inc.'
+    elif manufacturer_lower.startswith('b&r'):
+        return 'BR Industrial Automation'
+    elif manufacturer_lower.startswith('belkin'):
+        return 'Belkin International Inc.'
+    elif manufacturer_lower.startswith('bizlink'):
+        return 'BizLink (Kunshan) Co.,Ltd'
+    elif manufacturer_lower.startswith('brady'):
+        return 'Brady Corporation'
+    elif manufacturer_lower.startswith('broadcom'):
+        return 'Broadcom Inc.'
+    elif manufacturer_lower.startswith('buffalo'):
+        return 'Buffalo Inc.'
+    elif manufacturer_lower.startswith('ce') and 'link' in manufacturer_lower:
+        return 'Ce Link Limited'
+    elif manufacturer_lower.startswith('chongqin'):
+        return 'Chongqing Fugui Electronics Co.,Ltd.'
+    elif manufacturer_lower.startswith('cisco'):
+        return 'Cisco Systems, Inc.'
+    elif manufacturer_lower.startswith('cloud') and 'net' in manufacturer_lower:
+        return 'Cloud Network Technology (Samoa) Limited'
+    elif manufacturer_lower.startswith('cyberpow'):
+        return 'Cyber Power Systems, Inc.'
+    elif manufacturer_lower.startswith('cybernet'):
+        return 'Cybernet Manufacturing Inc.'
+    elif manufacturer_lower.startswith('dfi'):
+        return 'DFI Inc.'
+    elif manufacturer_lower.startswith('flytech'):
+        return 'Flytech Technology Co., Ltd.'
+    elif manufacturer_lower.startswith('fujitsu'):
+        return 'Fujitsu'
+    # Do not match on GETAC
+    elif manufacturer_lower == 'ge' or 'general elec' in manufacturer_lower:
+        return 'GE'
+    elif manufacturer_lower.startswith('gigabyte') or manufacturer_lower.startswith('giga-byte'):
+        return 'Gigabyte Technology Co., Ltd.'
+    elif manufacturer_lower.startswith('gigamon'):
+        return 'Gigamon Systems LLC'
+    elif manufacturer_lower.startswith('good') and 'way' in manufacturer_lower:
+        return 'Good Way Technology Co., Ltd.'
+    # Do HPE before HP
+    elif (manufacturer_lower.startswith('hpe') or
+          ('hewlett' in manufacturer_lower and 'enterprise' in manufacturer_lower)):
+        return "Hewlett Packard Enterprise"
+    elif manufacturer_lower.startswith('hp') or manufacturer_lower.startswith('hewlett'):
+        return 'Hewlett-Packard'
+    elif manufacturer_lower.startswith('hitachi'):
+        return 'Hitachi'
+    elif manufacturer_lower.startswith('huizhou') and 'd' in manufacturer_lower:
+        return 'Huizhou Dehong Technology Co., Ltd.'
+    elif manufacturer_lower.startswith('hon') and 'hai' in manufacturer_lower:
+        return 'Hon Hai Precision Ind. Co.,Ltd.'
+    elif manufacturer_lower.startswith('intel'):
+        return 'Intel Corporation'
+    elif manufacturer_lower.startswith('ibm'):
+        return 'IBM'
+    elif manufacturer_lower.startswith('juniper'):
+        return 'Juniper'
+    elif manufacturer_lower.startswith('jump') and 'indu' in manufacturer_lower:
+        return 'JUMPtec Industrielle Computertechnik AG'
+    elif manufacturer_lower.startswith('jetway') and 'in' in manufacturer_lower:
+        return 'Jetway Information Co., Ltd.'
+    elif manufacturer_lower.startswith('kcodes'):
+        return 'KCodes Corporation'
+    elif manufacturer_lower.startswith('lcfc'):
+        return 'LCFC(HeFei) Electronics Technology Co., Ltd.'
+    elif manufacturer_lower.startswith('lenovo'):
+        return 'Lenovo'
+    elif manufacturer_lower.startswith('luxshare'):
+        return 'Luxshare Precision Industry Co., Ltd.'
+    elif manufacturer_lower.startswith('liteon'):
+        return 'Liteon Technology Corporation'
+    elif manufacturer_lower.startswith('lg'):
+        return 'LG Electronics'
+    elif manufacturer_lower.startswith('micro-star'):
+        return 'Micro-Star International Co., Ltd.'
+    elif manufacturer_lower.startswith('microsof'):
+        return 'Microsoft Corporation'
+    elif manufacturer_lower.startswith('mitac'):
+        return 'Mitac International Corp.'
+    elif manufacturer_lower.startswith('nec'):
+        return 'NEC Corporation'
+    elif manufacturer_lower.startswith('oracle'):
+        return 'Oracle Corporation'
+    elif manufacturer_lower.startswith('parallels'):
+        return 'Parallels Software International Inc.'
+    elif manufacturer_lower.startswith('pc') and 'partne' in manufacturer_lower:
+        return 'PC Partner Ltd.'
+    elif manufacturer_lower.startswith('palo alto'):
+        return 'Palo Alto Networks'
+    elif manufacturer_lower.startswith('panasonic'):
+        return 'Panasonic'
+    elif manufacturer_lower.startswith('pioneer'):
+        return 'Pioneer'
+    elif manufacturer_lower.startswith('realtek'):
+        return 'Realtek Semiconductor Corp.'
+    elif 'schneider electric' in manufacturer_lower:
+        return 'Schneider Electric'
+    elif manufacturer_lower.startswith('siemens'):
+        return 'Siemens AG'
+    elif manufacturer_lower.startswith('samsung'):
+        return 'Samsung'
+    elif manufacturer_lower.startswith('summit'):
+        return 'Summit Data Communications'
+    elif manufacturer_lower.startswith('sony'):
+        return 'Sony Corporation'
+    elif manufacturer_lower.startswith('super') and 'micro' in manufacturer_lower:
+        return 'Super Micro Computer, Inc.'
+    elif manufacturer_lower.startswith('tangent'):
+        return 'Tangent, Inc.'
+    elif manufacturer_lower.startswith('toshiba'):
+        return 'Toshiba Corporation'
+    elif manufacturer_lower.startswith('texas') and 'ins' in manufacturer_lower:
+        return 'Texas Instruments'
+    elif manufacturer_lower.startswith('tyan'):
+        return 'Tyan Computer Corp.'
+    elif manufacturer_lower.startswith('vmware'):
+        return 'VMware, Inc.'
+    elif manufacturer_lower.startswith('variscit'):
+        return 'Variscite LTD'
+    elif manufacturer_lower.startswith('wistron'):
+        return 'Wistron Corporation'
+    elif manufacturer_lower.startswith('zebra'):
+        return 'Zebra Technologies Inc.'
+    elif manufacturer_lower.startswith('congatec'):
+        return 'congatec AG'
+    elif manufacturer_lower.startswith('3s') and ('system' in manufacturer_lower or 'vision' in manufacturer_lower):
+        return '3S System Tech Inc.'
+    elif manufacturer_lower.startswith('speed') and 'dra' in manufacturer_lower:
+        return 'Speed Dragon Multimedia Limited'
+
+    return clean_tag(manufacturer)
+
+
+def manufacturer_inputs() -> list[str]:
+    # Every string the old rules test for, on its own and combined with the others, in the forms the sources send
+    literals = sorted(set(re.findall(r"'([^'\n]+)'", inspect.getsource(legacy_clean_manufacturer))))
+    values = ['', 'Dell Inc.', 'DELL', 'GETAC', 'General Electric', 'HPE', 'Hewlett Packard Enterprise',
+              'Hewlett-Packard', 'To be filled by O.E.M.', 'Some Unlisted Vendor']
+    for literal in literals:
+        values += [literal, literal.upper(), literal.title(), f"  {literal} ", f"{literal} Inc.", f"x{literal}",
+                   f"{literal}series"]
+    values += [f"{first} {second}" for first, second in product(literals, repeat=2)]
+    return values
+
+
+class TestManufacturers(unittest.TestCase):
+    def test_same_as_legacy(self):
+        for value in manufacturer_inputs():
+            with self.subTest(value=value):
+                self.assertEqual(legacy_clean_manufacturer(value), clean_manufacturer(value))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Every built-in prefix (ndaa.csv, BAD_MAC_PREFIXES, valid_private_mac) has to make it into the MAC vendor database
+# Usage: python -m unittest tests.test_oui
+import unittest
+
+from snipeit_api.defaults import DEFAULTS
+from snipeit_api.oui import BAD_MAC_PREFIXES, FLAG_BLOCKED, FLAG_DONGLE, FLAG_PRIVATE, NON_HEX, collect_prefixes, \
+    load_ndaa_prefixes
+
+
+class BuiltInPrefixesTest(unittest.TestCase):
+    def test_no_prefix_rejected(self):
+        with self.assertNoLogs(level='WARNING'):
+            entries = collect_prefixes()
+        expected = ([(ndaa.prefix, FLAG_BLOCKED) for ndaa in load_ndaa_prefixes()] +
+                    [(prefix, FLAG_DONGLE) for prefix in BAD_MAC_PREFIXES] +
+                    [(prefix, FLAG_PRIVATE) for prefix in DEFAULTS['valid_private_mac']])
+        for prefix, flag in expected:
+            with self.subTest(prefix=prefix):
+                prefix = NON_HEX.sub('', prefix.upper())
+                self.assertIn(prefix, entries)
+                self.assertTrue(entries[prefix][2] & flag)
+
+    def test_dongle_prefixes_are_separate(self):
+        # A missing comma glues two neighbouring entries together
+        for prefix in BAD_MAC_PREFIXES:
+            with self.subTest(prefix=prefix):
+                self.assertLessEqual(len(prefix), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,6 @@ Looks up the visitor's IP in Medigate/xDOME and returns a trust score
 based on which security integrations are associated with that device.
 """
 import logging
-import re
 import smtplib
 from configparser import RawConfigParser, NoSectionError, NoOptionError
 from datetime import datetime, timezone
@@ -17,6 +16,8 @@ from medigate_api import DevicesApi, Configuration, ApiClient
 from medigate_api.models import GetDevicesParameters
 from medigate_api.rest import ApiException
 
+from snipeit_api.validation import parse_ip
+
 CONFIG = RawConfigParser()
 CONFIG.read("settings.conf")
 
@@ -241,9 +242,10 @@ def get_client_ip() -> str:
     override = request.args.get("ip")
     if override:
         # Validate IP address format (IPv4 or IPv6)
-        if not re.match(r"^((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$", override.strip()):
+        ip = parse_ip(override)
+        if not ip:
             abort(400, "Invalid IP address format")
-        return override.strip()
+        return ip
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
         return forwarded_for.split(",")[0].strip()